@@ -0,0 +1,111 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmark of act latency and update time with and without XLA JIT compilation.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import json
+
+from tensorforce.agents import Agent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import Runner
+
+
+# python examples/jit_benchmark.py -a examples/configs/ppo.json -n examples/configs/mlp2_network.json
+
+# python examples/jit_benchmark.py -a examples/configs/dqn.json -n examples/configs/mlp2_network.json -y int -s 4
+
+
+def benchmark(agent, network, environment, jit, timesteps, warmup_timesteps):
+    agent = Agent.from_spec(
+        spec=dict(agent),
+        kwargs=dict(
+            states=environment.states,
+            actions=environment.actions,
+            network=network,
+            execution=dict(jit=jit)
+        )
+    )
+    runner = Runner(agent=agent, environment=environment, profile=True)
+
+    # Untimed warmup, includes the initial compilation
+    runner.run(num_timesteps=warmup_timesteps)
+
+    totals = dict(timesteps=0, updates=0, act_time=0.0, update_time=0.0)
+
+    def episode_finished(r, id_):
+        report = r.profiler.last_report
+        for key in totals:
+            totals[key] += report[key]
+        return True
+
+    runner.run(num_timesteps=timesteps, episode_finished=episode_finished)
+    runner.close()
+
+    return dict(
+        jit=jit,
+        act_latency=(totals['act_time'] / max(totals['timesteps'], 1)),
+        update_time=(totals['update_time'] / max(totals['updates'], 1)),
+        updates=totals['updates']
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-a', '--agent', required=True, help="Agent configuration file")
+    parser.add_argument('-n', '--network', default=None, help="Network specification file")
+    parser.add_argument('-y', '--action-type', default='float', help="MinimalTest action type")
+    parser.add_argument('-s', '--action-shape', type=int, nargs='*', default=(), help="MinimalTest action shape")
+    parser.add_argument('-t', '--timesteps', type=int, default=5000, help="Number of timed timesteps")
+    parser.add_argument('-w', '--warmup-timesteps', type=int, default=500, help="Number of untimed timesteps")
+
+    args = parser.parse_args()
+
+    with open(args.agent, 'r') as fp:
+        agent = json.load(fp=fp)
+    if args.network is not None:
+        with open(args.network, 'r') as fp:
+            network = json.load(fp=fp)
+    else:
+        network = None
+
+    results = list()
+    for jit in (False, True):
+        environment = MinimalTest(specification={args.action_type: tuple(args.action_shape)})
+        results.append(benchmark(
+            agent=agent,
+            network=network,
+            environment=environment,
+            jit=jit,
+            timesteps=args.timesteps,
+            warmup_timesteps=args.warmup_timesteps
+        ))
+
+    print('{:>6} {:>18} {:>18} {:>8}'.format('jit', 'act latency (ms)', 'update time (ms)', 'updates'))
+    for result in results:
+        print('{:>6} {:>18.3f} {:>18.3f} {:>8}'.format(
+            str(result['jit']), result['act_latency'] * 1000.0, result['update_time'] * 1000.0, result['updates']
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Per-layer network profiling.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import json
+
+from tensorforce.core.networks import NetworkProfiler
+
+
+# python examples/network_profiler.py examples/configs/mlp2_network.json -s 8
+
+# python examples/network_profiler.py examples/configs/cnn_dqn_network.json -s 84 84 4 -b 1 32 -o profile.json
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('network', help="Network specification file")
+    parser.add_argument('-s', '--shape', type=int, nargs='+', required=True, help="State shape")
+    parser.add_argument('-y', '--type', default='float', help="State type")
+    parser.add_argument('-b', '--batch-sizes', type=int, nargs='+', default=(1, 32, 256), help="Batch sizes")
+    parser.add_argument('-r', '--runs', type=int, default=20, help="Number of timed runs per layer and batch size")
+    parser.add_argument('-o', '--output', default=None, help="Write the reports to this JSON file")
+
+    args = parser.parse_args()
+
+    profiler = NetworkProfiler(
+        network=args.network,
+        states=dict(shape=tuple(args.shape), type=args.type),
+        batch_sizes=args.batch_sizes,
+        num_runs=args.runs
+    )
+    reports = profiler.profile()
+    print(NetworkProfiler.format(reports=reports))
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(obj=reports, fp=fp, indent=4)
+
+
+if __name__ == '__main__':
+    main()
@@ -28,6 +28,9 @@ $ tmux a -t OpenAI  # `ctrl+b d` to exit tmux
 
 To kill the session:
 $ python examples/openai_gym_async.py CartPole-v0 -W 3 -K
+
+Alternatively, start all processes from this script via the ClusterLauncher (no tmux, restarts failed workers):
+$ python examples/openai_gym_async.py CartPole-v0 -a examples/configs/vpg.json -n examples/configs/mlp2_network.json -e 10000 -m 200 -W 3 -M launcher
 """
 
 from __future__ import absolute_import
@@ -47,7 +50,7 @@ from six.moves import xrange, shlex_quote
 
 from tensorforce import TensorForceError
 from tensorforce.agents import Agent
-from tensorforce.execution import Runner
+from tensorforce.execution import Runner, ClusterLauncher
 from tensorforce.contrib.openai_gym import OpenAIGym
 
 
@@ -61,7 +64,7 @@ def main():
     parser.add_argument('-t', '--timesteps', type=int, default=None, help="Number of timesteps")
     parser.add_argument('-m', '--max-episode-timesteps', type=int, default=None, help="Maximum number of timesteps per episode")
     parser.add_argument('-d', '--deterministic', action='store_true', help="Choose actions deterministically")
-    parser.add_argument('-M', '--mode', choices=('tmux', 'child'), default='tmux', help="Starter mode")
+    parser.add_argument('-M', '--mode', choices=('tmux', 'child', 'launcher'), default='tmux', help="Starter mode")
     parser.add_argument('-W', '--num-workers', type=int, default=1, help="Number of worker agents")
     parser.add_argument('-C', '--child', action='store_true', help="Child process")
     parser.add_argument('-P', '--parameter-server', action='store_true', help="Parameter server")
@@ -83,6 +86,36 @@ def main():
         os.system("\n".join(kill_cmds))
         return 0
 
+    if args.mode == 'launcher':
+        with open(args.agent, 'r') as fp:
+            agent = json.load(fp=fp)
+        if args.network is not None:
+            with open(args.network, 'r') as fp:
+                agent['network'] = json.load(fp=fp)
+
+        launcher = ClusterLauncher(
+            agent=agent,
+            environment=(lambda: OpenAIGym(args.gym_id)),
+            num_workers=args.num_workers
+        )
+
+        def worker_episode_finished(r, worker_id):
+            if r.global_episode % 100 == 0:
+                print("Finished episode {} (worker {}) after overall {} timesteps.".format(
+                    r.global_episode, worker_id, r.global_timestep
+                ))
+                print("Average of last 100 rewards: {}".format(sum(r.episode_rewards[-100:]) / min(100, len(r.episode_rewards))))
+            return True
+
+        launcher.run(
+            num_timesteps=args.timesteps,
+            num_episodes=args.episodes,
+            max_episode_timesteps=args.max_episode_timesteps,
+            deterministic=args.deterministic,
+            episode_finished=worker_episode_finished
+        )
+        return 0
+
     if not args.child:
         # start up child processes
         target_script = os.path.abspath(inspect.stack()[0][1])
@@ -0,0 +1,78 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Session thread pool autotuning.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import json
+
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import SessionAutotuner
+
+
+# python examples/session_autotune.py -a examples/configs/ppo.json -n examples/configs/mlp2_network.json
+
+# python examples/session_autotune.py -a examples/configs/dqn.json -n examples/configs/mlp2_network.json -y int -i 1 2 4
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-a', '--agent', required=True, help="Agent configuration file")
+    parser.add_argument('-n', '--network', default=None, help="Network specification file")
+    parser.add_argument('-y', '--action-type', default='float', help="MinimalTest action type")
+    parser.add_argument('-s', '--action-shape', type=int, nargs='*', default=(), help="MinimalTest action shape")
+    parser.add_argument('-i', '--intra-op-threads', type=int, nargs='+', default=None, help="Intra-op thread counts")
+    parser.add_argument('-j', '--inter-op-threads', type=int, nargs='+', default=(1, 2), help="Inter-op thread counts")
+    parser.add_argument('-t', '--timesteps', type=int, default=1000, help="Number of timed timesteps")
+
+    args = parser.parse_args()
+
+    with open(args.agent, 'r') as fp:
+        agent = json.load(fp=fp)
+    if args.network is not None:
+        with open(args.network, 'r') as fp:
+            network = json.load(fp=fp)
+    else:
+        network = None
+
+    autotuner = SessionAutotuner(
+        agent=agent,
+        environment=(lambda: MinimalTest(specification={args.action_type: tuple(args.action_shape)})),
+        network=network,
+        intra_op_threads=args.intra_op_threads,
+        inter_op_threads=args.inter_op_threads,
+        timesteps=args.timesteps
+    )
+    session_config, results = autotuner.tune()
+
+    print('{:>6} {:>6} {:>16} {:>16} {:>16}'.format('intra', 'inter', 'acts/sec', 'updates/sec', 'ms/timestep'))
+    for result in results:
+        print('{:>6} {:>6} {:>16.1f} {:>16.1f} {:>16.3f}'.format(
+            result['session_config']['intra_op_parallelism_threads'],
+            result['session_config']['inter_op_parallelism_threads'],
+            result['act_throughput'], result['update_throughput'], result['time_per_timestep'] * 1000.0
+        ))
+    print('Recommended execution spec: {}'.format(json.dumps(dict(session_config=session_config))))
+
+
+if __name__ == '__main__':
+    main()
@@ -151,6 +151,16 @@ class Agent(object):
         self.episode, self.timestep, self.next_internals = self.model.reset()
         self.current_internals = self.next_internals
 
+    def reset_slots(self, slots):
+        """
+        Resets the per-slot state of states preprocessors for the given batch slots when acting
+        batched, e.g. for the environments of a VectorEnvironment which terminated.
+
+        Args:
+            slots (list): Batch slots to reset.
+        """
+        self.model.reset_slots(slots=slots)
+
     def act(self, states, deterministic=False, independent=False, fetch_tensors=None):
         """
         Return action(s) for given state(s). States preprocessing and exploration are applied if  
@@ -49,6 +49,8 @@ class DDPGAgent(LearningAgent):
         discount=0.99,
         distributions=None,
         entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None,
         critic_network=None,
         critic_optimizer=None,
         target_sync_frequency=10000,
@@ -137,7 +139,9 @@ class DDPGAgent(LearningAgent):
             discount=discount,
             network=network,
             distributions=distributions,
-            entropy_regularization=entropy_regularization
+            entropy_regularization=entropy_regularization,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize_model(self):
@@ -161,6 +165,8 @@ class DDPGAgent(LearningAgent):
             network=self.network,
             distributions=self.distributions,
             entropy_regularization=self.entropy_regularization,
+            fused_parameterization=self.fused_parameterization,
+            execution=self.execution,
             critic_network=self.critic_network,
             critic_optimizer=self.critic_optimizer,
             target_sync_frequency=self.target_sync_frequency,
@@ -51,6 +51,8 @@ class DQFDAgent(LearningAgent):
         discount=0.99,
         distributions=None,
         entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None,
         target_sync_frequency=10000,
         target_update_weight=1.0,
         huber_loss=None,
@@ -150,7 +152,9 @@ class DQFDAgent(LearningAgent):
             discount=discount,
             network=network,
             distributions=distributions,
-            entropy_regularization=entropy_regularization
+            entropy_regularization=entropy_regularization,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize_model(self):
@@ -174,6 +178,8 @@ class DQFDAgent(LearningAgent):
             network=self.network,
             distributions=self.distributions,
             entropy_regularization=self.entropy_regularization,
+            fused_parameterization=self.fused_parameterization,
+            execution=self.execution,
             target_sync_frequency=self.target_sync_frequency,
             target_update_weight=self.target_update_weight,
             # DQFD always uses double dqn, which is a required key for a q-model.
@@ -48,6 +48,8 @@ class DQNAgent(LearningAgent):
         discount=0.99,
         distributions=None,
         entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None,
         target_sync_frequency=10000,
         target_update_weight=1.0,
         double_q_model=False,
@@ -128,7 +130,9 @@ class DQNAgent(LearningAgent):
             discount=discount,
             network=network,
             distributions=distributions,
-            entropy_regularization=entropy_regularization
+            entropy_regularization=entropy_regularization,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize_model(self):
@@ -152,6 +156,8 @@ class DQNAgent(LearningAgent):
             network=self.network,
             distributions=self.distributions,
             entropy_regularization=self.entropy_regularization,
+            fused_parameterization=self.fused_parameterization,
+            execution=self.execution,
             target_sync_frequency=self.target_sync_frequency,
             target_update_weight=self.target_update_weight,
             double_q_model=self.double_q_model,
@@ -50,7 +50,9 @@ class LearningAgent(Agent):
         reward_preprocessing=None,
         discount=0.99,
         distributions=None,
-        entropy_regularization=None
+        entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None
     ):
         """
         Initializes the learning agent.
@@ -62,6 +64,8 @@ class LearningAgent(Agent):
                 - batch_size: integer (required).
                 - frequency: integer (default: batch_size).
                 - length: integer (optional if unit == 'sequences', default: 8).
+                - accumulation_steps: integer, number of successive updates whose gradients are
+                    accumulated before an optimization step is applied (default: 1).
             memory (spec): Memory specification, see core.memories module for more information
                 (required).
             optimizer (spec): Optimizer specification, see core.optimizers module for more
@@ -91,6 +95,14 @@ class LearningAgent(Agent):
                 - protocol: communication protocol (default: none, i.e. 'grpc').
                 - config: TensorFlow ConfigProto object (default: none).
                 - replica_model: internal.
+                - restarted: specifies whether this worker rejoins a running cluster, in which case
+                    the shared variables are not initialized again (default: false).
+                - synchronous: specifies synchronous data-parallel training via a local replica
+                    coordinator instead of a parameter server, see execution.SynchronousRunner
+                    (default: false).
+                - address: address of the replica coordinator (required if synchronous, replaces
+                    cluster_spec).
+                - authkey: authentication key of the replica coordinator (default: none).
             variable_noise (float): Standard deviation of variable noise (default: none).
             states_preprocessing (spec, or dict of specs): States preprocessing specification, see
                 core.preprocessors module for more information (default: none)
@@ -102,6 +114,17 @@ class LearningAgent(Agent):
             distributions (spec / dict of specs): Distributions specifications, see
                 core.distributions module for more information (default: none).
             entropy_regularization (float): Entropy regularization weight (default: none).
+            fused_parameterization (bool): Computes the parameters of all action distributions with
+                one fused projection, and samples compatible distributions jointly, which speeds up
+                acting with many action components (default: false).
+            execution (spec): Execution specification, with the following attributes (default:
+                none):
+                - jit: specifies whether the act and optimization subgraphs are compiled with XLA
+                    JIT compilation, ops without XLA kernel are executed as usual (default: false).
+                - session_config: TensorFlow ConfigProto object, or dict of its fields, e.g.
+                    intra_op_parallelism_threads and inter_op_parallelism_threads to bound the
+                    thread pools when running several agents per host, see
+                    execution.SessionAutotuner (default: none, i.e. thread pools sized to the machine).
         """
 
         self.scope = scope
@@ -120,6 +143,8 @@ class LearningAgent(Agent):
         self.network = network
         self.distributions = distributions
         self.entropy_regularization = entropy_regularization
+        self.fused_parameterization = fused_parameterization
+        self.execution = execution
 
         # TensorFlow summarizer & Configuration Meta Parameter Recorder options
         if self.summarizer is None:
@@ -47,6 +47,8 @@ class PPOAgent(LearningAgent):
         discount=0.99,
         distributions=None,
         entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None,
         baseline_mode=None,
         baseline=None,
         baseline_optimizer=None,
@@ -148,7 +150,9 @@ class PPOAgent(LearningAgent):
             discount=discount,
             network=network,
             distributions=distributions,
-            entropy_regularization=entropy_regularization
+            entropy_regularization=entropy_regularization,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize_model(self):
@@ -172,6 +176,8 @@ class PPOAgent(LearningAgent):
             network=self.network,
             distributions=self.distributions,
             entropy_regularization=self.entropy_regularization,
+            fused_parameterization=self.fused_parameterization,
+            execution=self.execution,
             baseline_mode=self.baseline_mode,
             baseline=self.baseline,
             baseline_optimizer=self.baseline_optimizer,
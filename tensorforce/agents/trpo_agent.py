@@ -48,6 +48,8 @@ class TRPOAgent(LearningAgent):
         discount=0.99,
         distributions=None,
         entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None,
         baseline_mode=None,
         baseline=None,
         baseline_optimizer=None,
@@ -59,7 +61,8 @@ class TRPOAgent(LearningAgent):
         cg_unroll_loop=False,
         ls_max_iterations=10,
         ls_accept_ratio=0.9,
-        ls_unroll_loop=False
+        ls_unroll_loop=False,
+        ls_batched=False
     ):
         """
         Initializes the TRPO agent.
@@ -88,6 +91,7 @@ class TRPOAgent(LearningAgent):
             ls_max_iterations (int): Line-search max iterations (default: 10).
             ls_accept_ratio (float): Line-search accept ratio (default: 0.9).
             ls_unroll_loop (bool): Line-search unroll loop (default: false).
+            ls_batched (bool): Line-search evaluates all step sizes at once (default: false).
         """
 
         # Update mode
@@ -126,7 +130,8 @@ class TRPOAgent(LearningAgent):
             ls_accept_ratio=ls_accept_ratio,
             ls_mode='exponential',  # !!!!!!!!!!!!!
             ls_parameter=0.5,  # !!!!!!!!!!!!!
-            ls_unroll_loop=ls_unroll_loop
+            ls_unroll_loop=ls_unroll_loop,
+            ls_batched=ls_batched
         )
 
         self.baseline_mode = baseline_mode
@@ -155,7 +160,9 @@ class TRPOAgent(LearningAgent):
             discount=discount,
             network=network,
             distributions=distributions,
-            entropy_regularization=entropy_regularization
+            entropy_regularization=entropy_regularization,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize_model(self):
@@ -179,6 +186,8 @@ class TRPOAgent(LearningAgent):
             network=self.network,
             distributions=self.distributions,
             entropy_regularization=self.entropy_regularization,
+            fused_parameterization=self.fused_parameterization,
+            execution=self.execution,
             baseline_mode=self.baseline_mode,
             baseline=self.baseline,
             baseline_optimizer=self.baseline_optimizer,
@@ -49,10 +49,13 @@ class VPGAgent(LearningAgent):
         discount=0.99,
         distributions=None,
         entropy_regularization=None,
+        fused_parameterization=False,
+        execution=None,
         baseline_mode=None,
         baseline=None,
         baseline_optimizer=None,
-        gae_lambda=None
+        gae_lambda=None,
+        vtrace_threshold=None
     ):
         """
         Initializes the VPG agent.
@@ -72,6 +75,9 @@ class VPGAgent(LearningAgent):
             baseline_optimizer (spec): Baseline optimizer specification, see core.optimizers module
                 for more information (default: none).
             gae_lambda (float): Lambda factor for generalized advantage estimation (default: none).
+            vtrace_threshold (float): Truncation threshold of the importance weights for V-trace
+                off-policy correction, enables model.off_policy_update (default: none). Not supported
+                together with actions_exploration.
         """
 
         # Update mode
@@ -109,6 +115,7 @@ class VPGAgent(LearningAgent):
         self.baseline = baseline
         self.baseline_optimizer = baseline_optimizer
         self.gae_lambda = gae_lambda
+        self.vtrace_threshold = vtrace_threshold
 
         super(VPGAgent, self).__init__(
             states=states,
@@ -130,7 +137,9 @@ class VPGAgent(LearningAgent):
             discount=discount,
             network=network,
             distributions=distributions,
-            entropy_regularization=entropy_regularization
+            entropy_regularization=entropy_regularization,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize_model(self):
@@ -154,8 +163,11 @@ class VPGAgent(LearningAgent):
             network=self.network,
             distributions=self.distributions,
             entropy_regularization=self.entropy_regularization,
+            fused_parameterization=self.fused_parameterization,
+            execution=self.execution,
             baseline_mode=self.baseline_mode,
             baseline=self.baseline,
             baseline_optimizer=self.baseline_optimizer,
-            gae_lambda=self.gae_lambda
+            gae_lambda=self.gae_lambda,
+            vtrace_threshold=self.vtrace_threshold
         )
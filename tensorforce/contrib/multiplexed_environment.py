@@ -0,0 +1,319 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from tensorforce.contrib.remote_environment import RemoteEnvironment, BufferProtocol
+from tensorforce.environments import VectorEnvironment
+from tensorforce import TensorForceError
+import numpy as np
+import itertools
+import logging
+import os
+import socket
+
+
+class MultiplexedEnvironmentServer(object):
+    """
+    Reference server hosting many environment instances behind a single connection, to be used with
+    MultiplexedRemoteEnvironment. The instances are split into groups, each of which is stepped as a
+    VectorEnvironment (batched execute with auto-reset). Requests address one group or all instances
+    and carry an id which is echoed in the response, so a client can have several requests in flight,
+    e.g. stepping one group while computing the actions of another.
+
+    Examples:
+    client sends: {"cmd": "get_spec", "id": 0}
+    server responds: {"status": "ok", "id": 0, "states": {...}, "actions": {...}, "group_sizes": [8, 8]}
+
+    client sends: {"cmd": "execute", "id": 7, "group": 1, "actions": [8 actions]}
+    server responds: {"status": "ok", "id": 7, "states": [8 states], "terminal": [8 bools], "reward": [8 floats]}
+    """
+
+    def __init__(self, environments, num_groups=1, mode="serial", host="localhost", port=6025, unix_socket=None):
+        """
+        Args:
+            environments (List[Environment]): The hosted environment instances, with identical specification.
+            num_groups (int): Number of groups the instances are split into.
+            mode (str): Execution mode of each group's VectorEnvironment, 'serial', 'thread' or 'process'.
+            host (str): The hostname to listen on.
+            port (int): The port to listen on.
+            unix_socket (str): Optional path of a Unix domain socket to listen on instead of host:port.
+        """
+        if num_groups < 1 or num_groups > len(environments):
+            raise TensorForceError("Invalid number of groups {} for {} environments!".
+                                   format(num_groups, len(environments)))
+        bounds = np.linspace(0, len(environments), num_groups + 1).astype(np.int64)
+        self.groups = [
+            VectorEnvironment(environments=environments[start:end], mode=mode)
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.socket = None
+        self.logger = logging.getLogger(__name__)
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+            if self.unix_socket and os.path.exists(self.unix_socket):
+                os.remove(self.unix_socket)
+        for group in self.groups:
+            group.close()
+
+    def listen(self):
+        """
+        Binds the server socket. Called by `serve` if not done before.
+        """
+        if self.unix_socket:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.bind(self.unix_socket)
+        else:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.socket.bind((self.host, self.port))
+            # Port 0 binds to a free port.
+            self.port = self.socket.getsockname()[1]
+        self.socket.listen(1)
+
+    def serve(self, num_connections=None):
+        """
+        Serves client connections one after the other.
+
+        Args:
+            num_connections (int): Number of connections to serve before returning, or None to serve forever.
+        """
+        if self.socket is None:
+            self.listen()
+        for _ in (range(num_connections) if num_connections is not None else itertools.count()):
+            connection, _ = self.socket.accept()
+            if not self.unix_socket:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                self.handle(connection)
+            finally:
+                connection.close()
+
+    def handle(self, connection):
+        """
+        Processes the requests of a connection in order until the client closes it.
+        """
+        protocol = BufferProtocol()
+        while True:
+            try:
+                request = protocol.recv(connection, check_status=False)
+            except (TensorForceError, socket.error):
+                # Connection closed by the client.
+                return
+            if request.get("cmd") == "close":
+                return
+            try:
+                response = self.process(request)
+                response["status"] = "ok"
+            except Exception as exception:
+                self.logger.error("Request {} failed: {}".format(request.get("cmd"), exception))
+                response = dict(status="error", message=str(exception))
+            response["id"] = request.get("id")
+            protocol.send(response, connection)
+
+    def process(self, request):
+        """
+        Executes a request and returns the response dict (without status and id).
+        """
+        command = request.get("cmd")
+        group = request.get("group")
+        groups = self.groups if group is None else [self.groups[group]]
+
+        if command == "get_spec":
+            return dict(
+                states=self.groups[0].states,
+                actions=self.groups[0].actions,
+                group_sizes=[group.num_environments for group in self.groups]
+            )
+
+        elif command == "seed":
+            seed = request.get("value")
+            seeds = list()
+            for group in groups:
+                seeds.extend(group.seed(seed=(None if seed is None else seed + len(seeds))))
+            return dict(value=seeds)
+
+        elif command == "reset":
+            states = [group.reset() for group in groups]
+            return dict(states=self.concatenate(states))
+
+        elif command == "execute":
+            actions = request["actions"]
+            results = list()
+            start = 0
+            for group in groups:
+                end = start + group.num_environments
+                results.append(group.execute(actions=self.slice_actions(actions, start, end)))
+                start = end
+            states, terminal, reward = zip(*results)
+            return dict(states=self.concatenate(states), terminal=np.concatenate(terminal),
+                        reward=np.concatenate(reward))
+
+        else:
+            raise TensorForceError("Unknown command {}!".format(command))
+
+    @staticmethod
+    def concatenate(states):
+        if isinstance(states[0], dict):
+            return {name: np.concatenate([state[name] for state in states]) for name in states[0]}
+        else:
+            return np.concatenate(states)
+
+    @staticmethod
+    def slice_actions(actions, start, end):
+        if isinstance(actions, dict):
+            return {name: action[start:end] for name, action in actions.items()}
+        else:
+            return actions[start:end]
+
+
+class MultiplexedRemoteEnvironment(RemoteEnvironment):
+    """
+    Client of a MultiplexedEnvironmentServer, which behaves like a VectorEnvironment over all hosted
+    instances: `reset` and `execute` return states, terminals and rewards batched along the first
+    dimension, and terminated instances are reset automatically. Groups of instances can also be
+    addressed individually and asynchronously via `send_request` and `receive`, so several requests
+    can be in flight on the one connection.
+    """
+
+    def __init__(self, host="localhost", port=6025, unix_socket=None, connect=True):
+        """
+        Args:
+            host (str): The hostname to connect to.
+            port (int): The port to connect to.
+            unix_socket (str): Optional path of a Unix domain socket to connect to instead of host:port.
+            connect (bool): Whether to connect already in this c'tor.
+        """
+        RemoteEnvironment.__init__(self, host, port, unix_socket)
+        self.protocol = BufferProtocol()
+        self.request_ids = itertools.count()
+        # Responses received while waiting for another request.
+        self.responses = dict()
+
+        self.states_spec = None
+        self.actions_spec = None
+        self.group_sizes = None
+
+        if connect:
+            self.connect()
+
+    def __str__(self):
+        return "MultiplexedRemoteEnvironment({}{})".format(self.address, " [connected]" if self.socket else "")
+
+    def connect(self, timeout=600):
+        RemoteEnvironment.connect(self, timeout)
+        # Requests may take long when the server steps many instances.
+        self.socket.settimeout(None)
+
+        response = self.receive(self.send_request("get_spec"))
+        self.states_spec = self.sanitize_spec(response["states"])
+        self.actions_spec = self.sanitize_spec(response["actions"])
+        self.group_sizes = response["group_sizes"]
+
+    def disconnect(self):
+        if self.socket:
+            self.protocol.send({"cmd": "close"}, self.socket)
+        self.responses = dict()
+        RemoteEnvironment.disconnect(self)
+
+    @property
+    def num_environments(self):
+        return sum(self.group_sizes)
+
+    @property
+    def num_groups(self):
+        return len(self.group_sizes)
+
+    def send_request(self, command, group=None, **kwargs):
+        """
+        Sends a request without waiting for the response.
+
+        Args:
+            command (str): One of 'get_spec', 'seed', 'reset', 'execute'.
+            group (int): The addressed group of instances, or None for all instances.
+            **kwargs: Further request fields, e.g. 'actions' or 'value'.
+
+        Returns: The request id to pass to `receive`.
+        """
+        if not self.socket:
+            raise TensorForceError("Not connected to {}!".format(self.address))
+        request_id = next(self.request_ids)
+        message = dict(kwargs, cmd=command, id=request_id)
+        if group is not None:
+            message["group"] = group
+        self.protocol.send(message, self.socket)
+        return request_id
+
+    def receive(self, request_id):
+        """
+        Blocks until the response to the given request was received. Responses to other requests are
+        kept until they are received, including error responses, which only raise for their own request.
+
+        Returns: The response dict.
+        """
+        while request_id not in self.responses:
+            response = self.protocol.recv(self.socket, check_status=False)
+            self.responses[response.get("id")] = response
+        response = self.responses.pop(request_id)
+        if response.get("status") != "ok":
+            raise TensorForceError("RemoteEnvironment server error: {}".
+                                   format(response.get("message", "not specified")))
+        return response
+
+    def seed(self, seed=None):
+        return self.receive(self.send_request("seed", value=seed))["value"]
+
+    def reset(self, group=None):
+        """
+        Resets all instances, or the instances of the given group.
+
+        Returns: Batched initial states.
+        """
+        self.last_observation = self.receive(self.send_request("reset", group=group))["states"]
+        return self.last_observation
+
+    def execute(self, actions, group=None):
+        """
+        Executes one action per instance (of the given group), resetting terminated instances.
+
+        Returns: Batched next states, terminal array and reward array.
+        """
+        response = self.receive(self.send_request("execute", group=group, actions=actions))
+        self.last_observation = response["states"]
+        return response["states"], response["terminal"], response["reward"]
+
+    @staticmethod
+    def sanitize_spec(spec):
+        # Shapes are transferred as lists (or ints).
+        if "shape" in spec or "type" in spec:
+            spec = dict(spec)
+            if isinstance(spec.get("shape"), list):
+                spec["shape"] = tuple(spec["shape"])
+            return spec
+        return {name: MultiplexedRemoteEnvironment.sanitize_spec(value) for name, value in spec.items()}
+
+    @property
+    def states(self):
+        return self.states_spec
+
+    @property
+    def actions(self):
+        return self.actions_spec
@@ -18,27 +18,32 @@ from tensorforce.environments import Environment
 import socket
 import msgpack
 import msgpack_numpy as mnp
+import numpy as np
 import errno
 import os
 from tensorforce import TensorForceError
 import logging
+import struct
 import time
 
 
 class RemoteEnvironment(Environment):
-    def __init__(self, host="localhost", port=6025):
+    def __init__(self, host="localhost", port=6025, unix_socket=None):
         """
-        A remote Environment that one can connect to through tcp.
+        A remote Environment that one can connect to through tcp (or a Unix domain socket).
         Implements a simple msgpack protocol to get the step/reset/etc.. commands to the
         remote server and simply waits (blocks) for a response.
 
         Args:
                 host (str): The hostname to connect to.
                 port (int): The port to connect to.
+                unix_socket (str): Optional path of a Unix domain socket to connect to instead of host:port,
+                    for simulators running on the same host.
         """
         Environment.__init__(self)
         self.port = int(port) or 6025
         self.host = host or "localhost"
+        self.unix_socket = unix_socket
         self.socket = None
         # The size of the response buffer (depends on the Env's observation-space).
         self.buffer_size = 8192
@@ -47,7 +52,11 @@ class RemoteEnvironment(Environment):
         self.last_observation = None
 
     def __str__(self):
-        return "RemoteEnvironment({}:{}{})".format(self.host, self.port, " [connected]" if self.socket else "")
+        return "RemoteEnvironment({}{})".format(self.address, " [connected]" if self.socket else "")
+
+    @property
+    def address(self):
+        return self.unix_socket if self.unix_socket else "{}:{}".format(self.host, self.port)
 
     def close(self):
         """
@@ -65,24 +74,31 @@ class RemoteEnvironment(Environment):
         """
         # If we are already connected, return error.
         if self.socket:
-            raise TensorForceError("Already connected to {}:{}. Only one connection allowed at a time. " +
-                                   "Close first by calling `close`!".format(self.host, self.port))
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            raise TensorForceError("Already connected to {}. Only one connection allowed at a time. "
+                                   "Close first by calling `close`!".format(self.address))
+        if self.unix_socket:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = self.unix_socket
+        else:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Small request messages should not be delayed waiting for more data (Nagle's algorithm).
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            address = (self.host, self.port)
 
-        if timeout < 5 or timeout is None:
+        if timeout is None or timeout < 5:
             timeout = 5
 
         err = 0
         start_time = time.time()
         while time.time() - start_time < timeout:
             self.socket.settimeout(5)
-            err = self.socket.connect_ex((self.host, self.port))
+            err = self.socket.connect_ex(address)
             if err == 0:
                 break
             time.sleep(1)
         if err != 0:
-            raise TensorForceError("Error when trying to connect to {}:{}: errno={} errcode='{}' '{}'".
-                                   format(self.host, self.port, err, errno.errorcode[err], os.strerror(err)))
+            raise TensorForceError("Error when trying to connect to {}: errno={} errcode='{}' '{}'".
+                                   format(self.address, err, errno.errorcode[err], os.strerror(err)))
 
     def disconnect(self):
         """
@@ -193,3 +209,170 @@ class MsgPackNumpyProtocol(object):
         raise TensorForceError("No message encoded in data stream (data stream had len={})".
                                format(orig_len))
 
+
+
+class BufferProtocol(object):
+    """
+    A low-copy alternative to MsgPackNumpyProtocol with the same `send`/`recv` interface.
+
+    Each message consists of a fixed 8-byte binary header, which encodes the length of the subsequent
+    msgpack-encoded meta dict and the number of arrays, followed by the meta dict and the raw buffers
+    of all numpy arrays contained in the message. Arrays are replaced by placeholders in the meta dict,
+    which also lists dtype and shape of each array.
+    Header, meta dict and array buffers are sent with a single scatter-gather `sendmsg` call (where
+    available) without concatenating them, and arrays are received with `recv_into` directly into
+    their final buffers, optionally re-using the same arrays for every message.
+
+    Examples:
+    client sends: "[8-byte header]msgpack-encoded({"cmd": "reset"})"
+    server responds: "[8-byte header]msgpack-encoded({"status": "ok", "obs_dict": {"camera": {"__ndarray__": 0}},
+        "__arrays__": [["|u1", [84, 84, 3]]]})[84*84*3 raw bytes]"
+    """
+
+    header = struct.Struct("<II")
+
+    def __init__(self, reuse_arrays=False):
+        """
+        Args:
+            reuse_arrays (bool): Whether to receive into the same preallocated arrays for every message (as long as
+                dtypes and shapes match). Received arrays are then only valid until the next call to `recv`.
+        """
+        self.reuse_arrays = reuse_arrays
+        self.header_buffer = bytearray(self.header.size)
+        self.meta_buffer = bytearray(1024)
+        self.arrays = list()
+
+    def send(self, message, socket_):
+        """
+        Sends a message (dict) to the socket. Message consists of an 8-byte binary header followed by the
+            msgpack-encoded meta dict and the raw array buffers.
+
+        Args:
+            message: The message dict (e.g. {"cmd": "reset"})
+            socket_: The python socket object to use.
+        """
+        if not socket_:
+            raise TensorForceError("No socket given in call to `send`!")
+        elif not isinstance(message, dict):
+            raise TensorForceError("Message to be sent must be a dict!")
+
+        arrays = list()
+        meta = self.replace_arrays(message, arrays)
+        meta["__arrays__"] = [(array.dtype.str, array.shape) for array in arrays]
+        meta = msgpack.packb(meta)
+
+        buffers = [memoryview(self.header.pack(len(meta), len(arrays))), memoryview(meta)]
+        buffers.extend(memoryview(array.reshape(-1).view(np.uint8)) for array in arrays if array.nbytes > 0)
+
+        if hasattr(socket_, "sendmsg"):
+            while len(buffers) > 0:
+                sent = socket_.sendmsg(buffers)
+                # Drop what was sent, sendmsg may send only part of the buffers.
+                while sent > 0:
+                    if sent >= len(buffers[0]):
+                        sent -= len(buffers[0])
+                        buffers.pop(0)
+                    else:
+                        buffers[0] = buffers[0][sent:]
+                        sent = 0
+        else:
+            for buffer in buffers:
+                socket_.sendall(buffer)
+
+    def recv(self, socket_, check_status=True):
+        """
+        Receives a message from the given socket object. Blocks until something was received.
+
+        Args:
+            socket_: The python socket object to use.
+            check_status (bool): Whether the message has to have the 'status' field set to 'ok' (responses to a
+                client), otherwise any message is returned (requests to a server).
+        Returns: The decoded (as dict) message received.
+        """
+        self.recv_into(socket_, memoryview(self.header_buffer))
+        meta_len, num_arrays = self.header.unpack(bytes(self.header_buffer))
+
+        if meta_len > len(self.meta_buffer):
+            self.meta_buffer = bytearray(meta_len)
+        meta_view = memoryview(self.meta_buffer)[:meta_len]
+        self.recv_into(socket_, meta_view)
+        message = msgpack.unpackb(meta_view.tobytes(), encoding="utf-8")
+
+        descriptions = message.pop("__arrays__", ())
+        if len(descriptions) != num_arrays:
+            raise TensorForceError("Message header announced {} arrays, but {} were described!".
+                                   format(num_arrays, len(descriptions)))
+        arrays = list()
+        for n, (dtype, shape) in enumerate(descriptions):
+            dtype = np.dtype(dtype)
+            shape = tuple(shape)
+            if self.reuse_arrays and n < len(self.arrays) and \
+                    self.arrays[n].dtype == dtype and self.arrays[n].shape == shape:
+                array = self.arrays[n]
+            else:
+                array = np.empty(shape=shape, dtype=dtype)
+            if array.nbytes > 0:
+                self.recv_into(socket_, memoryview(array.reshape(-1).view(np.uint8)))
+            arrays.append(array)
+        if self.reuse_arrays:
+            self.arrays = arrays
+
+        message = self.restore_arrays(message, arrays)
+
+        if not check_status:
+            return message
+        elif "status" in message:
+            if message["status"] == "ok":
+                return message
+            else:
+                raise TensorForceError("RemoteEnvironment server error: {}".
+                                       format(message.get("message", "not specified")))
+        else:
+            raise TensorForceError("Message without field 'status' received!")
+
+    @staticmethod
+    def recv_into(socket_, view):
+        """
+        Fills the given memoryview with data from the socket.
+        """
+        while len(view) > 0:
+            received = socket_.recv_into(view)
+            if received == 0:
+                raise TensorForceError("No data received by socket.recv_into in call to method `recv` " +
+                                       "(listener possibly closed)!")
+            view = view[received:]
+
+    @staticmethod
+    def replace_arrays(value, arrays):
+        """
+        Returns a copy of the given nested value with numpy arrays replaced by placeholders, appending the
+        (contiguous) arrays to the given list.
+        """
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise TensorForceError("Arrays of dtype object cannot be sent!")
+            # Unlike np.ascontiguousarray, keeps the shape of 0-d arrays.
+            arrays.append(np.require(value, requirements="C"))
+            return {"__ndarray__": len(arrays) - 1}
+        elif isinstance(value, np.generic):
+            return value.item()
+        elif isinstance(value, dict):
+            return {key: BufferProtocol.replace_arrays(v, arrays) for key, v in value.items()}
+        elif isinstance(value, (list, tuple)):
+            return [BufferProtocol.replace_arrays(v, arrays) for v in value]
+        else:
+            return value
+
+    @staticmethod
+    def restore_arrays(value, arrays):
+        """
+        Returns the given nested value with placeholders replaced by the received arrays.
+        """
+        if isinstance(value, dict):
+            if len(value) == 1 and "__ndarray__" in value:
+                return arrays[value["__ndarray__"]]
+            return {key: BufferProtocol.restore_arrays(v, arrays) for key, v in value.items()}
+        elif isinstance(value, list):
+            return [BufferProtocol.restore_arrays(v, arrays) for v in value]
+        else:
+            return value
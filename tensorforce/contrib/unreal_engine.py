@@ -14,7 +14,7 @@
 # ==============================================================================
 
 
-from tensorforce.contrib.remote_environment import RemoteEnvironment, MsgPackNumpyProtocol
+from tensorforce.contrib.remote_environment import RemoteEnvironment, MsgPackNumpyProtocol, BufferProtocol
 from tensorforce.contrib.state_settable_environment import StateSettableEnvironment
 from tensorforce import TensorForceError
 from cached_property import cached_property
@@ -39,7 +39,9 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         connect=True,
         discretize_actions=False,
         delta_time=1/60,
-        num_ticks=4
+        num_ticks=4,
+        protocol="msgpack",
+        unix_socket=None
     ):
         """
         Args:
@@ -52,8 +54,11 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
             delta_time (float): The fake delta time to use for each single game tick.
             num_ticks (int): The number of ticks to be executed in a single act call (each tick will
                 repeat the same given actions).
+            protocol (str): The messaging protocol the game's server speaks, "msgpack" (MsgPackNumpyProtocol) or
+                "buffer" (BufferProtocol, which transfers observation arrays as raw buffers).
+            unix_socket (str): Optional path of a Unix domain socket to connect to instead of host:port.
         """
-        RemoteEnvironment.__init__(self, host, port)
+        RemoteEnvironment.__init__(self, host, port, unix_socket)
 
         # RemoteEnvironment should send a name of the game upon connection.
         self.game_name = None
@@ -65,15 +70,20 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         self.delta_time = delta_time
         self.num_ticks = num_ticks
 
-        # Our tcp messaging protocol to use (simple len-header + msgpack-numpy-body).
-        self.protocol = MsgPackNumpyProtocol()
+        # Our tcp messaging protocol to use (simple len-header + msgpack-numpy-body, or raw array buffers).
+        if protocol == "msgpack":
+            self.protocol = MsgPackNumpyProtocol()
+        elif protocol == "buffer":
+            self.protocol = BufferProtocol()
+        else:
+            raise TensorForceError("Unknown protocol '{}', must be 'msgpack' or 'buffer'!".format(protocol))
 
         if connect:
             self.connect()
 
     def __str__(self):
-        return "UE4Environment({}:{}{})".format(self.host, self.port, "[connected; {}]".
-                                                format(self.game_name) if self.socket else "")
+        return "UE4Environment({}{})".format(self.address, "[connected; {}]".
+                                             format(self.game_name) if self.socket else "")
 
     def connect(self, timeout=600):
         RemoteEnvironment.connect(self, timeout)
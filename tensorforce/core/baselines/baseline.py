@@ -40,7 +40,7 @@ class Baseline(object):
 
         def custom_getter(getter, name, registered=False, **kwargs):
             variable = getter(name=name, registered=True, **kwargs)
-            if not registered:
+            if not registered and name not in self.all_variables:
                 self.all_variables[name] = variable
                 if kwargs.get('trainable', True):
                     self.variables[name] = variable
@@ -16,6 +16,7 @@
 from tensorforce.core.distributions.distribution import Distribution
 from tensorforce.core.distributions.bernoulli import Bernoulli
 from tensorforce.core.distributions.categorical import Categorical
+from tensorforce.core.distributions.hierarchical_categorical import HierarchicalCategorical
 from tensorforce.core.distributions.gaussian import Gaussian
 from tensorforce.core.distributions.beta import Beta
 
@@ -23,6 +24,7 @@ from tensorforce.core.distributions.beta import Beta
 distributions = dict(
     bernoulli=Bernoulli,
     categorical=Categorical,
+    hierarchical_categorical=HierarchicalCategorical,
     gaussian=Gaussian,
     beta=Beta
 )
@@ -33,6 +35,7 @@ __all__ = [
     'Distribution',
     'Bernoulli',
     'Categorical',
+    'HierarchicalCategorical',
     'Gaussian',
     'Beta'
 ]
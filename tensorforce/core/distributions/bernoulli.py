@@ -45,9 +45,15 @@ class Bernoulli(Distribution):
 
         super(Bernoulli, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
-    def tf_parameterize(self, x):
+    def projection_layers(self):
+        return [self.logit]
+
+    def sampling_group(self):
+        return 'bernoulli',
+
+    def tf_parameterize_projections(self, projections):
         # Flat logit
-        logit = self.logit.apply(x=x)
+        logit = projections[0]
 
         # Reshape logit to action shape
         shape = (-1,) + self.shape
@@ -52,16 +52,22 @@ class Beta(Distribution):
 
         super(Beta, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
-    def tf_parameterize(self, x):
+    def projection_layers(self):
+        return [self.alpha, self.beta]
+
+    def sampling_group(self):
+        return 'beta', self.min_value, self.max_value
+
+    def tf_parameterize_projections(self, projections):
         # Softplus to ensure alpha and beta >= 1
         # epsilon < 1.0, hence negative
         log_eps = log(util.epsilon)
 
-        alpha = self.alpha.apply(x=x)
+        alpha = projections[0]
         alpha = tf.clip_by_value(t=alpha, clip_value_min=log_eps, clip_value_max=-log_eps)
         alpha = tf.log(x=(tf.exp(x=alpha) + 1.0)) + 1.0
 
-        beta = self.beta.apply(x=x)
+        beta = projections[1]
         beta = tf.clip_by_value(t=beta, clip_value_min=log_eps, clip_value_max=-log_eps)
         beta = tf.log(x=(tf.exp(x=beta) + 1.0)) + 1.0
 
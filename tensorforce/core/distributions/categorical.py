@@ -50,9 +50,15 @@ class Categorical(Distribution):
 
         super(Categorical, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
-    def tf_parameterize(self, x):
+    def projection_layers(self):
+        return [self.logits]
+
+    def sampling_group(self):
+        return 'categorical', self.num_actions
+
+    def tf_parameterize_projections(self, projections):
         # Flat logits
-        logits = self.logits.apply(x=x)
+        logits = projections[0]
 
         # Reshape logits to action shape
         shape = (-1,) + self.shape + (self.num_actions,)
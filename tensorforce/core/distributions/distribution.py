@@ -45,7 +45,7 @@ class Distribution(object):
 
         def custom_getter(getter, name, registered=False, **kwargs):
             variable = getter(name=name, registered=True, **kwargs)
-            if not registered:
+            if not registered and name not in self.all_variables:
                 self.all_variables[name] = variable
                 if kwargs.get('trainable', True):
                     self.variables[name] = variable
@@ -59,6 +59,11 @@ class Distribution(object):
             func_=self.tf_parameterize,
             custom_getter_=custom_getter
         )
+        self.parameterize_projections = tf.make_template(
+            name_=(scope + '/parameterize-projections'),
+            func_=self.tf_parameterize_projections,
+            custom_getter_=custom_getter
+        )
         self.sample = tf.make_template(
             name_=(scope + '/sample'),
             func_=self.tf_sample,
@@ -88,16 +93,54 @@ class Distribution(object):
     def tf_parameterize(self, x):
         """
         Creates the TensorFlow operations for parameterizing a distribution conditioned on the
-        given input.
+        given input. By default, applies the projection layers and passes their outputs to
+        `tf_parameterize_projections`.
 
         Args:
             x: Input tensor which the distribution is conditioned on.
 
+        Returns:
+            Tuple of distribution parameter tensors.
+        """
+        projection_layers = self.projection_layers()
+        if projection_layers is None:
+            raise NotImplementedError
+        return self.tf_parameterize_projections(projections=[layer.apply(x=x) for layer in projection_layers])
+
+    def tf_parameterize_projections(self, projections):
+        """
+        Creates the TensorFlow operations for parameterizing a distribution given the outputs of  
+        its projection layers. Separate from `tf_parameterize`, so the projections of several  
+        distributions can be computed as one fused projection.
+
+        Args:
+            projections: List of flat projection tensors, one per projection layer.
+
         Returns:
             Tuple of distribution parameter tensors.
         """
         raise NotImplementedError
 
+    def projection_layers(self):
+        """
+        Returns the linear layers which project the input to the distribution parameters, in the  
+        order expected by `tf_parameterize_projections`.
+
+        Returns:
+            List of Linear layers, or None if the distribution is not parameterized by projections.
+        """
+        return None
+
+    def sampling_group(self):
+        """
+        Returns a key identifying distributions which sample element-wise in the same way, so  
+        their parameters can be concatenated and sampled jointly.
+
+        Returns:
+            Hashable key, or None if the distribution cannot be sampled jointly.
+        """
+        return None
+
     def tf_sample(self, distr_params, deterministic):
         """
         Creates the TensorFlow operations for sampling an action based on a distribution.
@@ -182,6 +225,107 @@ class Distribution(object):
         """
         return self.summaries
 
+    @staticmethod
+    def fused_parameterize(distributions, x):
+        """
+        Parameterizes a dict of distributions conditioned on the same input. The projection layers  
+        of all distributions are evaluated as a single matrix multiplication with their  
+        concatenated weights, and the result is sliced per distribution. The layers' own  
+        variables are used and created within each distribution's `parameterize` template, so  
+        their names and hence checkpoints are the same as for separate parameterization.
+
+        Args:
+            distributions: Dict of distributions.
+            x: Input tensor which the distributions are conditioned on.
+
+        Returns:
+            Dict of distribution parameter tuples.
+        """
+        distr_params = dict()
+        fused = list()
+        for name in sorted(distributions):
+            projection_layers = distributions[name].projection_layers()
+            if projection_layers is None:
+                distr_params[name] = distributions[name].parameterize(x=x)
+            else:
+                fused.append((name, projection_layers))
+
+        if len(fused) == 0:
+            return distr_params
+
+        weights = list()
+        biases = list()
+        sizes = list()
+        for name, projection_layers in fused:
+            # Creates the layer variables in the same scope as separate parameterization, the unfused
+            # output is never fetched.
+            distributions[name].parameterize(x=x)
+            for layer in projection_layers:
+                weights.append(layer.weights)
+                biases.append(tf.zeros(shape=(layer.size,)) if layer.bias is None else layer.bias)
+                sizes.append(layer.size)
+
+        projection = tf.matmul(a=x, b=tf.concat(values=weights, axis=1))
+        projection = tf.nn.bias_add(value=projection, bias=tf.concat(values=biases, axis=0))
+        projections = tf.split(value=projection, num_or_size_splits=sizes, axis=1)
+
+        for name, projection_layers in fused:
+            distr_params[name] = distributions[name].parameterize_projections(
+                projections=projections[:len(projection_layers)]
+            )
+            projections = projections[len(projection_layers):]
+
+        return distr_params
+
+    @staticmethod
+    def joint_sample(distributions, distr_params, deterministic):
+        """
+        Samples actions from a dict of distributions. Distributions of the same sampling group are  
+        sampled with a single sampling operation on their parameters concatenated along the  
+        flattened action dimensions.
+
+        Args:
+            distributions: Dict of distributions.
+            distr_params: Dict of distribution parameter tuples.
+            deterministic: Boolean tensor indicating whether to return the maximum likelihood actions.
+
+        Returns:
+            Dict of action tensors.
+        """
+        actions = dict()
+        groups = dict()
+        for name in sorted(distributions):
+            group = distributions[name].sampling_group()
+            if group is None:
+                actions[name] = distributions[name].sample(distr_params=distr_params[name], deterministic=deterministic)
+            else:
+                groups.setdefault(group, list()).append(name)
+
+        for names in groups.values():
+            if len(names) == 1:
+                actions[names[0]] = distributions[names[0]].sample(
+                    distr_params=distr_params[names[0]],
+                    deterministic=deterministic
+                )
+                continue
+
+            # Parameters have shape (batch,) + action shape + (parameter dims,)
+            sizes = [util.prod(distributions[name].shape) for name in names]
+            flat_distr_params = list()
+            for name, size in zip(names, sizes):
+                rank = 1 + len(distributions[name].shape)
+                flat_distr_params.append(tuple(
+                    tf.reshape(tensor=value, shape=((-1, size) + util.shape(value)[rank:]))
+                    for value in distr_params[name]
+                ))
+            joint_distr_params = tuple(tf.concat(values=values, axis=1) for values in zip(*flat_distr_params))
+
+            joint_actions = distributions[names[0]].sample(distr_params=joint_distr_params, deterministic=deterministic)
+            for name, action in zip(names, tf.split(value=joint_actions, num_or_size_splits=sizes, axis=1)):
+                actions[name] = tf.reshape(tensor=action, shape=((-1,) + tuple(distributions[name].shape)))
+
+        return actions
+
     @staticmethod
     def from_spec(spec, kwargs=None):
         """
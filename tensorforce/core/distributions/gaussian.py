@@ -47,10 +47,15 @@ class Gaussian(Distribution):
 
         super(Gaussian, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
-    def tf_parameterize(self, x):
+    def projection_layers(self):
+        return [self.mean, self.log_stddev]
+
+    def sampling_group(self):
+        return 'gaussian',
+
+    def tf_parameterize_projections(self, projections):
         # Flat mean and log standard deviation
-        mean = self.mean.apply(x=x)
-        log_stddev = self.log_stddev.apply(x=x)
+        mean, log_stddev = projections
 
         # Reshape mean and log stddev to action shape
         shape = (-1,) + self.shape
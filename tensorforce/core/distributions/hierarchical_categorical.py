@@ -0,0 +1,219 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from math import ceil, sqrt
+import tensorflow as tf
+
+from tensorforce import util, TensorForceError
+from tensorforce.core.networks import Linear
+from tensorforce.core.distributions import Distribution
+
+
+class HierarchicalCategorical(Distribution):
+    """
+    Two-level categorical distribution, for very large discrete action spaces. Actions are
+    partitioned into consecutive clusters, and an action is chosen by first choosing a cluster
+    and then an action within this cluster. Sampling and log probability only evaluate the
+    cluster logits and the action logits of one cluster, i.e. O(sqrt(num_actions)) by default.
+    Entropy and KL divergence are computed over the cluster distribution, which lower-bounds the
+    respective values of the full distribution. It does not provide state(-action) values and
+    hence cannot be used with Q-models.
+    """
+
+    def __init__(self, shape, num_actions, num_clusters=None, scope='hierarchical-categorical', summary_labels=()):
+        """
+        Hierarchical categorical distribution.
+
+        Args:
+            shape: Action shape.
+            num_actions: Number of discrete action alternatives.
+            num_clusters: Number of action clusters, ceil(sqrt(num_actions)) if None. Reduced if some
+                clusters would otherwise be empty.
+        """
+        self.num_actions = num_actions
+        if num_clusters is None:
+            self.num_clusters = int(ceil(sqrt(num_actions)))
+        elif 0 < num_clusters <= num_actions:
+            self.num_clusters = num_clusters
+        else:
+            raise TensorForceError(
+                'Invalid number of clusters for hierarchical categorical distribution: {}.'.format(num_clusters)
+            )
+        # Actions per cluster, the last cluster may be partially occupied
+        self.cluster_size = int(ceil(num_actions / self.num_clusters))
+        # Fewer clusters if otherwise some clusters would be empty
+        self.num_clusters = int(ceil(num_actions / self.cluster_size))
+
+        self.cluster_logits = Linear(size=(util.prod(shape) * self.num_clusters), bias=0.0, scope='cluster-logits')
+        self.action_weights = None
+        self.action_bias = None
+
+        super(HierarchicalCategorical, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
+
+    def tf_parameterize(self, x):
+        # Per action dimension and cluster, the weights and bias of the within-cluster logits
+        size = util.prod(self.shape) * self.num_clusters
+        stddev = min(0.1, sqrt(2.0 / (x.shape[1].value + self.cluster_size)))
+        self.action_weights = tf.get_variable(
+            name='action-weights',
+            shape=(size, x.shape[1].value, self.cluster_size),
+            dtype=tf.float32,
+            initializer=tf.random_normal_initializer(mean=0.0, stddev=stddev, dtype=tf.float32)
+        )
+        self.action_bias = tf.get_variable(
+            name='action-bias',
+            shape=(size, self.cluster_size),
+            dtype=tf.float32,
+            initializer=tf.zeros_initializer(dtype=tf.float32)
+        )
+
+        # Cluster logits reshaped to action shape
+        logits = self.cluster_logits.apply(x=x)
+        shape = (-1,) + self.shape + (self.num_clusters,)
+        logits = tf.reshape(tensor=logits, shape=shape)
+
+        # Softmax for corresponding probabilities
+        # TODO deprecated call, update when >1.5 becomes default install
+        probabilities = tf.nn.softmax(logits=logits, dim=-1)
+
+        # Min epsilon probability for numerical stability
+        probabilities = tf.maximum(x=probabilities, y=util.epsilon)
+
+        # "Normalized" logits
+        logits = tf.log(x=probabilities)
+
+        # The input is kept to compute within-cluster logits only for the required clusters
+        return x, logits, probabilities
+
+    def action_logits(self, x, clusters):
+        """
+        Computes the normalized within-cluster logits for the given clusters.
+
+        Args:
+            x: Input tensor which the distribution is conditioned on.
+            clusters: Cluster index tensor of action shape.
+
+        Returns:
+            Within-cluster logits tensor of action shape plus cluster size.
+        """
+        num_dims = util.prod(self.shape)
+        clusters = tf.reshape(tensor=clusters, shape=(-1, num_dims))
+
+        # Select weights and bias per action dimension and cluster
+        indices = clusters + tf.range(num_dims) * self.num_clusters
+        weights = tf.gather(params=self.action_weights, indices=indices)
+        bias = tf.gather(params=self.action_bias, indices=indices)
+        x = tf.expand_dims(input=tf.expand_dims(input=x, axis=1), axis=3)
+        logits = tf.reduce_sum(input_tensor=(x * weights), axis=2) + bias
+
+        # Mask out non-existing actions of the partially occupied last cluster
+        actions = tf.expand_dims(input=clusters, axis=2) * self.cluster_size + tf.range(self.cluster_size)
+        logits = tf.where(
+            condition=tf.less(x=actions, y=self.num_actions),
+            x=logits,
+            y=tf.fill(dims=tf.shape(input=logits), value=-1e6)
+        )
+        logits = logits - tf.reduce_logsumexp(input_tensor=logits, axis=2, keep_dims=True)
+
+        shape = (-1,) + self.shape + (self.cluster_size,)
+        return tf.reshape(tensor=logits, shape=shape)
+
+    def state_value(self, distr_params):
+        raise TensorForceError('Hierarchical categorical distribution does not support Q-models.')
+
+    def state_action_value(self, distr_params, action=None):
+        raise TensorForceError('Hierarchical categorical distribution does not support Q-models.')
+
+    def tf_sample(self, distr_params, deterministic):
+        x, logits, _ = distr_params
+
+        # Deterministic: maximum likelihood cluster and action within cluster
+        # Non-deterministic: sample cluster and action within cluster using Gumbel distribution
+        clusters = self.sample_logits(logits=logits, deterministic=deterministic)
+        action_logits = self.action_logits(x=x, clusters=clusters)
+        actions = self.sample_logits(logits=action_logits, deterministic=deterministic)
+
+        return clusters * self.cluster_size + actions
+
+    def sample_logits(self, logits, deterministic):
+        definite = tf.argmax(input=logits, axis=-1, output_type=util.tf_dtype('int'))
+
+        uniform_distribution = tf.random_uniform(
+            shape=tf.shape(input=logits),
+            minval=util.epsilon,
+            maxval=(1.0 - util.epsilon)
+        )
+        gumbel_distribution = -tf.log(x=-tf.log(x=uniform_distribution))
+        sampled = tf.argmax(input=(logits + gumbel_distribution), axis=-1, output_type=util.tf_dtype('int'))
+
+        return tf.where(condition=deterministic, x=definite, y=sampled)
+
+    def tf_log_probability(self, distr_params, action):
+        x, logits, _ = distr_params
+        clusters = action // self.cluster_size
+        actions = action % self.cluster_size
+
+        cluster_one_hot = tf.one_hot(indices=clusters, depth=self.num_clusters)
+        cluster_log_prob = tf.reduce_sum(input_tensor=(logits * cluster_one_hot), axis=-1)
+
+        action_logits = self.action_logits(x=x, clusters=clusters)
+        action_one_hot = tf.one_hot(indices=actions, depth=self.cluster_size)
+        action_log_prob = tf.reduce_sum(input_tensor=(action_logits * action_one_hot), axis=-1)
+
+        return cluster_log_prob + action_log_prob
+
+    def tf_entropy(self, distr_params):
+        _, logits, probabilities = distr_params
+        return -tf.reduce_sum(input_tensor=(probabilities * logits), axis=-1)
+
+    def tf_kl_divergence(self, distr_params1, distr_params2):
+        _, logits1, probabilities1 = distr_params1
+        _, logits2, _ = distr_params2
+        log_prob_ratio = logits1 - logits2
+        return tf.reduce_sum(input_tensor=(probabilities1 * log_prob_ratio), axis=-1)
+
+    def tf_regularization_loss(self):
+        regularization_loss = super(HierarchicalCategorical, self).tf_regularization_loss()
+        if regularization_loss is None:
+            losses = list()
+        else:
+            losses = [regularization_loss]
+
+        regularization_loss = self.cluster_logits.regularization_loss()
+        if regularization_loss is not None:
+            losses.append(regularization_loss)
+
+        if len(losses) > 0:
+            return tf.add_n(inputs=losses)
+        else:
+            return None
+
+    def get_variables(self, include_nontrainable=False):
+        distribution_variables = super(HierarchicalCategorical, self).get_variables(
+            include_nontrainable=include_nontrainable
+        )
+        cluster_logits_variables = self.cluster_logits.get_variables(include_nontrainable=include_nontrainable)
+
+        return distribution_variables + cluster_logits_variables
+
+    def get_summaries(self):
+        distribution_summaries = super(HierarchicalCategorical, self).get_summaries()
+        cluster_logits_summaries = self.cluster_logits.get_summaries()
+
+        return distribution_summaries + cluster_logits_summaries
@@ -17,6 +17,7 @@ from tensorforce.core.networks.layer import Layer, TFLayer, Nonlinearity, Dropou
     Dueling, Conv1d, Conv2d, InternalLstm, Lstm
 from tensorforce.core.networks.network import Network, LayerBasedNetwork, LayeredNetwork
 from tensorforce.core.networks.complex_network import Input, Output
+from tensorforce.core.networks.network_profiler import NetworkProfiler
 
 
 layers = dict(
@@ -56,5 +57,6 @@ __all__ = [
     'Lstm',
     'Network',
     'LayerBasedNetwork',
-    'LayeredNetwork'
+    'LayeredNetwork',
+    'NetworkProfiler'
 ]
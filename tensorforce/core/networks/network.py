@@ -45,7 +45,7 @@ class Network(object):
 
         def custom_getter(getter, name, registered=False, **kwargs):
             variable = getter(name=name, registered=True, **kwargs)
-            if not registered:
+            if not registered and name not in self.all_variables:
                 self.all_variables[name] = variable
                 if kwargs.get('trainable', True):
                     self.variables[name] = variable
@@ -54,9 +54,17 @@ class Network(object):
                         self.summaries.append(summary)
             return variable
 
+        def apply(x, internals, update, return_internals=False):
+            return self.tf_apply(
+                x=util.map_tensors(fn=self.tf_cast_input, tensors=x),
+                internals=internals,
+                update=update,
+                return_internals=return_internals
+            )
+
         self.apply = tf.make_template(
             name_=(scope + '/apply'),
-            func_=self.tf_apply,
+            func_=apply,
             custom_getter_=custom_getter
         )
         self.regularization_loss = tf.make_template(
@@ -80,6 +88,22 @@ class Network(object):
         """
         raise NotImplementedError
 
+    def tf_cast_input(self, x):
+        """
+        Converts uint8 inputs, which are interpreted as images with values in [0, 255] and kept as
+        uint8 from the feed through preprocessing and memory, to floats in [0, 1]. Other inputs are
+        returned unchanged.
+
+        Args:
+            x: Network input tensor.
+
+        Returns:
+            Network input tensor.
+        """
+        if x.dtype == tf.uint8:
+            return tf.cast(x=x, dtype=util.tf_dtype('float')) * (1.0 / 255.0)
+        return x
+
     def tf_regularization_loss(self):
         """
         Creates the TensorFlow operations for the network regularization loss.
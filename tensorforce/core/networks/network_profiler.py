@@ -0,0 +1,228 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import json
+import time
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.python.framework import ops
+
+from tensorforce import util, TensorForceError
+from tensorforce.core.networks.network import Network, LayerBasedNetwork
+
+
+class NetworkProfiler(object):
+    """
+    Builds a network standalone and reports per layer the number of parameters, the estimated
+    FLOPs, the activation memory and the measured latency of the forward pass, for several batch
+    sizes. Each layer is timed in isolation by feeding the outputs of all preceding layers, so
+    policies can be sized to a latency budget before training.
+    """
+
+    def __init__(self, network, states, batch_sizes=(1, 32, 256), num_runs=20, num_warmup_runs=3):
+        """
+        Initializes a network profiler.
+
+        Args:
+            network (spec / str): Network specification, or path of a JSON network specification
+                (e.g. `examples/configs/mlp2_network.json`).
+            states (dict): States specification, as for the agent, i.e. a dict with 'shape' and
+                optional 'type', or a dict of such dicts.
+            batch_sizes (tuple): Batch sizes to profile.
+            num_runs (int): Number of timed runs per layer and batch size, the mean latency is reported.
+            num_warmup_runs (int): Number of untimed runs per layer and batch size.
+        """
+        if isinstance(network, str):
+            with open(network, 'r') as fp:
+                network = json.load(fp=fp)
+        self.network_spec = network
+
+        if 'shape' in states:
+            states = dict(state=states)
+        self.states_spec = dict()
+        for name, state in states.items():
+            shape = state['shape']
+            self.states_spec[name] = dict(
+                shape=((shape,) if isinstance(shape, int) else tuple(shape)),
+                type=state.get('type', 'float')
+            )
+
+        self.batch_sizes = tuple(batch_sizes)
+        self.num_runs = num_runs
+        self.num_warmup_runs = num_warmup_runs
+
+    def profile(self):
+        """
+        Profiles the network for all batch sizes.
+
+        Returns:
+            List of report dicts, one per batch size and layer in order of application, with keys
+            'batch_size', 'layer', 'type', 'parameters', 'flops', 'activation_bytes' and 'latency'
+            (seconds).
+        """
+        reports = list()
+        for batch_size in self.batch_sizes:
+            reports.extend(self.profile_batch_size(batch_size=batch_size))
+        return reports
+
+    def profile_batch_size(self, batch_size):
+        """
+        Profiles the network for one batch size, in a separate graph with fully defined shapes.
+        """
+        graph = tf.Graph()
+        with graph.as_default():
+            network = Network.from_spec(spec=self.network_spec, kwargs=dict(summary_labels=()))
+            if not isinstance(network, LayerBasedNetwork):
+                raise TensorForceError('Network profiling requires a layer-based network.')
+
+            states = dict()
+            for name, state in self.states_spec.items():
+                states[name] = tf.placeholder(
+                    dtype=util.tf_dtype(state['type']),
+                    shape=((batch_size,) + state['shape']),
+                    name=name
+                )
+            internals = dict()
+            for name, internal in network.internals_spec().items():
+                internals[name] = tf.zeros(
+                    shape=((batch_size,) + tuple(internal['shape'])),
+                    dtype=util.tf_dtype(internal['type'])
+                )
+
+            # Record the ops and output of every layer application
+            records = list()
+            applies = [layer.apply for layer in network.layers]
+            for layer in network.layers:
+                layer.apply = self.record_apply(layer=layer, graph=graph, records=records)
+            try:
+                network.apply(x=states, internals=internals, update=tf.constant(value=False))
+            finally:
+                for layer, apply in zip(network.layers, applies):
+                    layer.apply = apply
+
+            with tf.Session(graph=graph) as session:
+                session.run(tf.global_variables_initializer())
+
+                feed_dict = {
+                    placeholder: self.random_input(
+                        shape=util.shape(placeholder),
+                        dtype=self.states_spec[name]['type']
+                    ) for name, placeholder in states.items()
+                }
+                # Values of all layer outputs, fed when timing subsequent layers
+                outputs = session.run([output for _, _, output in records], feed_dict=feed_dict)
+
+                reports = list()
+                for n, (layer, layer_ops, output) in enumerate(records):
+                    for (_, _, previous), value in zip(records[:n], outputs[:n]):
+                        feed_dict[previous] = value
+                    for _ in range(self.num_warmup_runs):
+                        session.run(output.op, feed_dict=feed_dict)
+                    start = time.time()
+                    for _ in range(self.num_runs):
+                        session.run(output.op, feed_dict=feed_dict)
+                    latency = (time.time() - start) / self.num_runs
+
+                    variables = layer.get_variables(include_nontrainable=True)
+                    reports.append(dict(
+                        batch_size=batch_size,
+                        layer=layer.scope,
+                        type=type(layer).__name__,
+                        parameters=sum(util.prod(util.shape(variable)) for variable in variables),
+                        flops=sum(self.op_flops(graph=graph, op=op) for op in layer_ops),
+                        activation_bytes=(util.prod(util.shape(output)) * output.dtype.size),
+                        latency=latency
+                    ))
+
+        return reports
+
+    @staticmethod
+    def record_apply(layer, graph, records):
+        """
+        Wraps the layer's apply template to record the graph ops it creates on the path to its
+        output, and its output.
+        """
+        apply = layer.apply
+
+        def recorded_apply(x, update, **internals):
+            num_ops = len(graph.get_operations())
+            result = apply(x=x, update=update, **internals)
+            output = result[0] if isinstance(result, tuple) else result
+            layer_ops = NetworkProfiler.output_ops(ops=graph.get_operations()[num_ops:], output=output)
+            records.append((layer, layer_ops, output))
+            return result
+
+        return recorded_apply
+
+    @staticmethod
+    def output_ops(ops, output):
+        """
+        Returns the given ops which the output depends on, in order of creation. This excludes for
+        instance variable initializers and summaries.
+        """
+        candidates = set(ops)
+        required = set()
+        pending = [output.op]
+        while len(pending) > 0:
+            op = pending.pop()
+            if op in required or op not in candidates:
+                continue
+            required.add(op)
+            pending.extend(tensor.op for tensor in op.inputs)
+            pending.extend(op.control_inputs)
+        return [op for op in ops if op in required]
+
+    @staticmethod
+    def op_flops(graph, op):
+        """
+        Returns the FLOPs of an op as registered with TensorFlow's statistics, or 0 if not available.
+        """
+        try:
+            flops = ops.get_stats_for_node_def(graph, op.node_def, 'flops').value
+        except ValueError:
+            flops = None
+        return 0 if flops is None else flops
+
+    @staticmethod
+    def random_input(shape, dtype):
+        if dtype == 'float':
+            return np.random.normal(size=shape).astype(np.float32)
+        elif dtype == 'uint8':
+            return np.random.randint(low=0, high=256, size=shape).astype(np.uint8)
+        elif dtype == 'bool':
+            return np.random.randint(low=0, high=2, size=shape).astype(np.bool_)
+        else:
+            return np.zeros(shape=shape, dtype=util.np_dtype(dtype))
+
+    @staticmethod
+    def format(reports):
+        """
+        Formats reports as a table with one row per batch size and layer.
+        """
+        lines = ['{:>6}  {:<16} {:<16} {:>12} {:>14} {:>14} {:>12}'.format(
+            'batch', 'layer', 'type', 'parameters', 'flops', 'activations', 'latency (ms)'
+        )]
+        for report in reports:
+            lines.append('{:>6}  {:<16} {:<16} {:>12} {:>14} {:>14} {:>12.3f}'.format(
+                report['batch_size'], report['layer'], report['type'], report['parameters'], report['flops'],
+                report['activation_bytes'], report['latency'] * 1000.0
+            ))
+        return '\n'.join(lines)
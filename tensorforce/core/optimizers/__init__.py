@@ -24,6 +24,8 @@ from tensorforce.core.optimizers.multi_step import MultiStep
 from tensorforce.core.optimizers.optimized_step import OptimizedStep
 from tensorforce.core.optimizers.subsampling_step import SubsamplingStep
 from tensorforce.core.optimizers.synchronization import Synchronization
+from tensorforce.core.optimizers.accumulated_step import AccumulatedStep
+from tensorforce.core.optimizers.synchronous_replicas import SynchronousReplicas
 
 
 # This can register any class inheriting from tf.train.Optimizer
@@ -42,7 +44,9 @@ optimizers = dict(
     multi_step=MultiStep,
     optimized_step=OptimizedStep,
     subsampling_step=SubsamplingStep,
-    synchronization=Synchronization
+    synchronization=Synchronization,
+    accumulated_step=AccumulatedStep,
+    synchronous_replicas=SynchronousReplicas
 )
 
 
@@ -58,5 +62,7 @@ __all__ = [
     'MultiStep',
     'OptimizedStep',
     'SubsamplingStep',
-    'Synchronization'
+    'Synchronization',
+    'AccumulatedStep',
+    'SynchronousReplicas'
 ]
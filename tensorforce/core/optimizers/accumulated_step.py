@@ -0,0 +1,132 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import tensorflow as tf
+
+from tensorforce import util, TensorForceError
+from tensorforce.core.optimizers import MetaOptimizer, Evolutionary, NaturalGradient, OptimizedStep, \
+    Synchronization
+
+
+class AccumulatedStep(MetaOptimizer):
+    """
+    The accumulated-step meta optimizer accumulates the loss gradients of a number of successive  
+    optimization calls and only every num_steps calls applies the optimization step of another  
+    optimizer, based on the mean accumulated gradients. This decouples the effective batch size  
+    from the batch size retrieved per call. The internal optimizer has to be gradient-based.
+    """
+
+    def __init__(self, optimizer, num_steps=4, scope='accumulated-step', summary_labels=()):
+        """
+        Creates a new accumulated-step meta optimizer instance.
+
+        Args:
+            optimizer: The optimizer which is modified by this meta optimizer.
+            num_steps: Number of optimization calls to accumulate gradients over.
+        """
+        assert isinstance(num_steps, int) and num_steps > 0
+        self.num_steps = num_steps
+
+        super(AccumulatedStep, self).__init__(optimizer=optimizer, scope=scope, summary_labels=summary_labels)
+
+        # Optimizers which do not follow the gradients of the loss produce wrong steps for the
+        # surrogate loss of the accumulated gradients.
+        internal_optimizer = self.optimizer
+        while True:
+            if isinstance(internal_optimizer, (Evolutionary, NaturalGradient, OptimizedStep, Synchronization)):
+                raise TensorForceError(
+                    "Accumulated-step optimizer requires a gradient-based internal optimizer, but {} given.".format(
+                        type(internal_optimizer).__name__
+                    )
+                )
+            elif isinstance(internal_optimizer, MetaOptimizer):
+                internal_optimizer = internal_optimizer.optimizer
+            else:
+                break
+
+    def tf_step(self, time, variables, arguments, fn_loss, **kwargs):
+        """
+        Creates the TensorFlow operations for performing an optimization step.
+
+        Args:
+            time: Time tensor.
+            variables: List of variables to optimize.
+            arguments: Dict of arguments for callables, like fn_loss.
+            fn_loss: A callable returning the loss of the current model.
+            **kwargs: Additional arguments passed on to the internal optimizer.
+
+        Returns:
+            List of delta tensors corresponding to the updates for each optimized variable.
+        """
+        accumulators = [
+            tf.get_variable(
+                name=('accumulator' + str(n)),
+                shape=util.shape(variable),
+                dtype=util.tf_dtype('float'),
+                initializer=tf.zeros_initializer(),
+                trainable=False
+            ) for n, variable in enumerate(variables)
+        ]
+
+        num_accumulated = tf.get_variable(
+            name='num-accumulated',
+            dtype=util.tf_dtype('int'),
+            initializer=0,
+            trainable=False
+        )
+
+        loss = fn_loss(**arguments)
+        gradients = tf.gradients(ys=loss, xs=variables)
+
+        accumulated = list()
+        for accumulator, gradient in zip(accumulators, gradients):
+            if gradient is not None:
+                accumulated.append(tf.assign_add(ref=accumulator, value=gradient))
+
+        with tf.control_dependencies(control_inputs=accumulated):
+            incremented = tf.assign_add(ref=num_accumulated, value=1)
+
+        def accumulated_step():
+            # Surrogate loss whose gradients are the mean accumulated gradients.
+            def fn_accumulated_loss(**kwargs):
+                return tf.add_n(inputs=[
+                    tf.reduce_sum(input_tensor=(tf.stop_gradient(input=(accumulator / self.num_steps)) * variable))
+                    for accumulator, variable in zip(accumulators, variables)
+                ])
+
+            deltas = self.optimizer.step(
+                time=time,
+                variables=variables,
+                arguments=arguments,
+                fn_loss=fn_accumulated_loss,
+                **kwargs
+            )
+
+            with tf.control_dependencies(control_inputs=deltas):
+                reset = [tf.assign(ref=accumulator, value=tf.zeros_like(tensor=accumulator)) for accumulator in accumulators]
+                reset.append(tf.assign(ref=num_accumulated, value=0))
+
+            with tf.control_dependencies(control_inputs=reset):
+                # Trivial operation to enforce control dependency
+                return [delta + 0.0 for delta in deltas]
+
+        def no_step():
+            return [tf.zeros_like(tensor=variable) for variable in variables]
+
+        return tf.cond(pred=(incremented >= self.num_steps), true_fn=accumulated_step, false_fn=no_step)
@@ -20,7 +20,7 @@ from __future__ import division
 from six.moves import xrange
 import tensorflow as tf
 
-from tensorforce import util
+from tensorforce import util, TensorForceError
 from tensorforce.core.optimizers import Optimizer
 
 
@@ -30,13 +30,27 @@ class Evolutionary(Optimizer):
     or negatively, depending on their improvement of the loss.
     """
 
-    def __init__(self, learning_rate, num_samples=1, unroll_loop=False, scope='evolutionary', summary_labels=()):
+    def __init__(
+        self,
+        learning_rate,
+        num_samples=1,
+        unroll_loop=False,
+        antithetic=False,
+        batched=False,
+        scope='evolutionary',
+        summary_labels=()
+    ):
         """
         Creates a new evolutionary optimizer instance.
 
         Args:
             learning_rate: Learning rate.
             num_samples: Number of sampled perturbations.
+            unroll_loop: Unrolls the TensorFlow while loop if true.
+            antithetic: Compares the loss of each perturbation with the loss of its negation  
+                instead of the unperturbed loss if true.
+            batched: Evaluates all perturbations at once for offset variables via fn_offset_loss  
+                instead of iteratively applying them to the variables if true.
         """
         assert isinstance(learning_rate, float) and learning_rate > 0.0
         self.learning_rate = learning_rate
@@ -47,6 +61,12 @@ class Evolutionary(Optimizer):
         assert isinstance(unroll_loop, bool)
         self.unroll_loop = unroll_loop
 
+        assert isinstance(antithetic, bool)
+        self.antithetic = antithetic
+
+        assert isinstance(batched, bool)
+        self.batched = batched
+
         super(Evolutionary, self).__init__(scope=scope, summary_labels=summary_labels)
 
     def tf_step(
@@ -55,6 +75,7 @@ class Evolutionary(Optimizer):
         variables,
         arguments,
         fn_loss,
+        fn_offset_loss=None,
         **kwargs
     ):
         """
@@ -65,68 +86,137 @@ class Evolutionary(Optimizer):
             variables: List of variables to optimize.
             arguments: Dict of arguments for callables, like fn_loss.
             fn_loss: A callable returning the loss of the current model.
+            fn_offset_loss: A callable returning the loss for variables plus given offsets, without  
+                modifying the variables, required for batched evaluation.
             **kwargs: Additional arguments, not used.
 
         Returns:
             List of delta tensors corresponding to the updates for each optimized variable.
         """
-        unperturbed_loss = fn_loss(**arguments)
-
-        # First sample
-        perturbations = [tf.random_normal(shape=util.shape(variable)) * self.learning_rate for variable in variables]
-        applied = self.apply_step(variables=variables, deltas=perturbations)
-
-        with tf.control_dependencies(control_inputs=(applied,)):
-            perturbed_loss = fn_loss(**arguments)
-            direction = tf.sign(x=(unperturbed_loss - perturbed_loss))
-            deltas_sum = [direction * perturbation for perturbation in perturbations]
-
-        if self.unroll_loop:
-            # Unrolled for loop
-            previous_perturbations = perturbations
-            for sample in xrange(self.num_samples):
-
-                with tf.control_dependencies(control_inputs=deltas_sum):
-                    perturbations = [tf.random_normal(shape=util.shape(variable)) * self.learning_rate for variable in variables]
+        if self.batched:
+            if fn_offset_loss is None:
+                raise TensorForceError("Batched evolutionary optimizer requires fn_offset_loss.")
+            return self.tf_batched_step(
+                variables=variables,
+                arguments=arguments,
+                fn_loss=fn_loss,
+                fn_offset_loss=fn_offset_loss
+            )
+
+        if self.antithetic:
+            unperturbed_loss = None
+        else:
+            unperturbed_loss = fn_loss(**arguments)
+
+        def sample(previous_perturbations, control_inputs):
+            # Returns the sampled perturbations, their direction and the resulting variable offsets.
+            with tf.control_dependencies(control_inputs=control_inputs):
+                perturbations = [
+                    tf.random_normal(shape=util.shape(variable)) * self.learning_rate for variable in variables
+                ]
+                if previous_perturbations is None:
+                    perturbation_deltas = perturbations
+                else:
                     perturbation_deltas = [
                         pert - prev_pert for pert, prev_pert in zip(perturbations, previous_perturbations)
                     ]
-                    applied = self.apply_step(variables=variables, deltas=perturbation_deltas)
-                    previous_perturbations = perturbations
+                applied = self.apply_step(variables=variables, deltas=perturbation_deltas)
 
-                with tf.control_dependencies(control_inputs=(applied,)):
-                    perturbed_loss = fn_loss(**arguments)
-                    direction = tf.sign(x=(unperturbed_loss - perturbed_loss))
-                    deltas_sum = [delta + direction * perturbation for delta, perturbation in zip(deltas_sum, perturbations)]
+            with tf.control_dependencies(control_inputs=(applied,)):
+                perturbed_loss = fn_loss(**arguments)
 
-        else:
-            # TensorFlow while loop
-            def body(iteration, deltas_sum, previous_perturbations):
+            if not self.antithetic:
+                direction = tf.sign(x=(unperturbed_loss - perturbed_loss))
+                return perturbations, direction, perturbations
 
-                with tf.control_dependencies(control_inputs=deltas_sum):
-                    perturbations = [tf.random_normal(shape=util.shape(variable)) * self.learning_rate for variable in variables]
-                    perturbation_deltas = [
-                        pert - prev_pert for pert, prev_pert in zip(perturbations, previous_perturbations)
-                    ]
-                    applied = self.apply_step(variables=variables, deltas=perturbation_deltas)
+            with tf.control_dependencies(control_inputs=(perturbed_loss,)):
+                applied = self.apply_step(variables=variables, deltas=[-2.0 * pert for pert in perturbations])
 
-                with tf.control_dependencies(control_inputs=(applied,)):
-                    perturbed_loss = fn_loss(**arguments)
-                    direction = tf.sign(x=(unperturbed_loss - perturbed_loss))
-                    deltas_sum = [delta + direction * perturbation for delta, perturbation in zip(deltas_sum, perturbations)]
+            with tf.control_dependencies(control_inputs=(applied,)):
+                negated_loss = fn_loss(**arguments)
+                direction = tf.sign(x=(negated_loss - perturbed_loss))
+                return perturbations, direction, [-pert for pert in perturbations]
 
-                return iteration + 1, deltas_sum, perturbations
+        # First sample
+        if unperturbed_loss is None:
+            control_inputs = ()
+        else:
+            control_inputs = (unperturbed_loss,)
+        perturbations, direction, offsets = sample(previous_perturbations=None, control_inputs=control_inputs)
+        deltas_sum = [direction * perturbation for perturbation in perturbations]
 
-            def cond(iteration, deltas_sum, previous_perturbation):
+        if self.unroll_loop:
+            # Unrolled for loop
+            for _ in xrange(self.num_samples - 1):
+                perturbations, direction, offsets = sample(previous_perturbations=offsets, control_inputs=deltas_sum)
+                deltas_sum = [delta + direction * perturbation for delta, perturbation in zip(deltas_sum, perturbations)]
+
+        else:
+            # TensorFlow while loop
+            def body(iteration, deltas_sum, previous_offsets):
+                perturbations, direction, offsets = sample(
+                    previous_perturbations=previous_offsets,
+                    control_inputs=deltas_sum
+                )
+                deltas_sum = [delta + direction * perturbation for delta, perturbation in zip(deltas_sum, perturbations)]
+                return iteration + 1, deltas_sum, offsets
+
+            def cond(iteration, deltas_sum, previous_offsets):
                 return iteration < self.num_samples - 1
 
-            _, deltas_sum, perturbations = tf.while_loop(cond=cond, body=body, loop_vars=(0, deltas_sum, perturbations))
+            _, deltas_sum, offsets = tf.while_loop(cond=cond, body=body, loop_vars=(0, deltas_sum, offsets))
 
         with tf.control_dependencies(control_inputs=deltas_sum):
             deltas = [delta / self.num_samples for delta in deltas_sum]
-            perturbation_deltas = [delta - pert for delta, pert in zip(deltas, perturbations)]
+            perturbation_deltas = [delta - offset for delta, offset in zip(deltas, offsets)]
             applied = self.apply_step(variables=variables, deltas=perturbation_deltas)
 
         with tf.control_dependencies(control_inputs=(applied,)):
             # Trivial operation to enforce control dependency
             return [delta + 0.0 for delta in deltas]
+
+    def tf_batched_step(self, variables, arguments, fn_loss, fn_offset_loss):
+        """
+        Creates the TensorFlow operations for performing an optimization step, evaluating all  
+        perturbations as independent losses for offset variables instead of applying them to the  
+        variables one after another.
+
+        Args:
+            variables: List of variables to optimize.
+            arguments: Dict of arguments for callables, like fn_loss.
+            fn_loss: A callable returning the loss of the current model.
+            fn_offset_loss: A callable returning the loss for variables plus given offsets.
+
+        Returns:
+            List of delta tensors corresponding to the updates for each optimized variable.
+        """
+        if self.antithetic:
+            unperturbed_loss = None
+        else:
+            unperturbed_loss = fn_loss(**arguments)
+
+        deltas_sum = [tf.zeros_like(tensor=variable) for variable in variables]
+        for _ in xrange(self.num_samples):
+            perturbations = [
+                tf.random_normal(shape=util.shape(variable)) * self.learning_rate for variable in variables
+            ]
+            perturbed_loss = fn_offset_loss(variables=variables, offsets=perturbations, **arguments)
+
+            if self.antithetic:
+                negated_loss = fn_offset_loss(
+                    variables=variables,
+                    offsets=[-pert for pert in perturbations],
+                    **arguments
+                )
+                direction = tf.sign(x=(negated_loss - perturbed_loss))
+            else:
+                direction = tf.sign(x=(unperturbed_loss - perturbed_loss))
+
+            deltas_sum = [delta + direction * perturbation for delta, perturbation in zip(deltas_sum, perturbations)]
+
+        deltas = [delta / self.num_samples for delta in deltas_sum]
+        applied = self.apply_step(variables=variables, deltas=deltas)
+
+        with tf.control_dependencies(control_inputs=(applied,)):
+            # Trivial operation to enforce control dependency
+            return [delta + 0.0 for delta in deltas]
@@ -38,6 +38,7 @@ class OptimizedStep(MetaOptimizer):
         ls_mode='exponential',
         ls_parameter=0.5,
         ls_unroll_loop=False,
+        ls_batched=False,
         scope='optimized-step',
         summary_labels=()
     ):
@@ -51,13 +52,16 @@ class OptimizedStep(MetaOptimizer):
             ls_mode: Line search mode, see LineSearch solver.
             ls_parameter: Line search parameter, see LineSearch solver.
             ls_unroll_loop: Unroll line search loop if true.
+            ls_batched: Evaluate all line search candidates at once if true, see LineSearch solver.  
+                Requires the loss to be evaluable for offset variables via fn_offset_loss.
         """
         self.solver = LineSearch(
             max_iterations=ls_max_iterations,
             accept_ratio=ls_accept_ratio,
             mode=ls_mode,
             parameter=ls_parameter,
-            unroll_loop=ls_unroll_loop
+            unroll_loop=ls_unroll_loop,
+            batched=ls_batched
         )
 
         super(OptimizedStep, self).__init__(optimizer=optimizer, scope=scope, summary_labels=summary_labels)
@@ -69,6 +73,7 @@ class OptimizedStep(MetaOptimizer):
         arguments,
         fn_loss,
         fn_reference,
+        fn_offset_loss=None,
         **kwargs
     ):
         """
@@ -80,6 +85,8 @@ class OptimizedStep(MetaOptimizer):
             arguments: Dict of arguments for callables, like fn_loss.
             fn_loss: A callable returning the loss of the current model.
             fn_reference: A callable returning the reference values, in case of a comparative loss.
+            fn_offset_loss: A callable returning the loss for variables plus given offsets, without  
+                modifying the variables, required for batched line search.
             **kwargs: Additional arguments passed on to the internal optimizer.
 
         Returns:
@@ -98,6 +105,7 @@ class OptimizedStep(MetaOptimizer):
                 variables=variables,
                 arguments=arguments,
                 fn_loss=fn_loss,
+                fn_offset_loss=fn_offset_loss,
                 return_estimated_improvement=True,
                 **kwargs
             )
@@ -116,6 +124,35 @@ class OptimizedStep(MetaOptimizer):
                 # Negative value since line search maximizes.
             loss_step = -fn_loss(**arguments)
 
+        if self.solver.batched:
+            if fn_offset_loss is None:
+                raise TensorForceError("Batched line search requires fn_offset_loss.")
+
+            with tf.control_dependencies(control_inputs=(loss_step,)):
+
+                def evaluate_solution(x):
+                    # Variables currently correspond to x_0 = deltas.
+                    offsets = [t - delta for t, delta in zip(x, deltas)]
+                    # Negative value since line search maximizes.
+                    return -fn_offset_loss(variables=variables, offsets=offsets, **arguments)
+
+                solution = self.solver.solve(
+                    fn_x=evaluate_solution,
+                    x_init=deltas,
+                    base_value=loss_before,
+                    target_value=loss_step,
+                    estimated_improvement=estimated_improvement
+                )
+
+                applied = self.apply_step(
+                    variables=variables,
+                    deltas=[t - delta for t, delta in zip(solution, deltas)]
+                )
+
+            with tf.control_dependencies(control_inputs=(applied,)):
+                # Trivial operation to enforce control dependency
+                return [t + 0.0 for t in solution]
+
         with tf.control_dependencies(control_inputs=(loss_step,)):
 
             def evaluate_step(deltas):
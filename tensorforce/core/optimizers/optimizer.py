@@ -96,6 +96,8 @@ class Optimizer(object):
                 by some optimizers:
             - arguments: Dict of arguments for callables, like fn_loss.
             - fn_loss: A callable returning the loss of the current model.
+            - fn_offset_loss: A callable returning the loss of the current model as if given  
+                offsets were added to the variables, without modifying them.
             - fn_reference: A callable returning the reference values, in case of a comparative  
                 loss.
             - fn_kl_divergence: A callable returning the KL-divergence relative to the
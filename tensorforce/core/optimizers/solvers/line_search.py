@@ -26,7 +26,7 @@ class LineSearch(Iterative):
     moving towards $x'$.
     """
 
-    def __init__(self, max_iterations, accept_ratio, mode, parameter, unroll_loop=False):
+    def __init__(self, max_iterations, accept_ratio, mode, parameter, unroll_loop=False, batched=False):
         """
         Creates a new line search solver instance.
 
@@ -38,6 +38,9 @@ class LineSearch(Iterative):
             mode: Mode of movement between $x_0$ and $x'$, either 'linear' or 'exponential'.
             parameter: Movement mode parameter, additive or multiplicative, respectively.
             unroll_loop: Unrolls the TensorFlow while loop if true.
+            batched: Evaluates all candidate solutions at once instead of iteratively if true, in  
+                which case $f(x)$ has to be given as side-effect-free function of $x$ instead of  
+                the step $x_t - x_{t-1}$.
         """
         assert accept_ratio >= 0.0
         self.accept_ratio = accept_ratio
@@ -48,6 +51,9 @@ class LineSearch(Iterative):
         self.mode = mode
         self.parameter = parameter
 
+        assert isinstance(batched, bool)
+        self.batched = batched
+
         super(LineSearch, self).__init__(max_iterations=max_iterations, unroll_loop=unroll_loop)
 
     def tf_solve(self, fn_x, x_init, base_value, target_value, estimated_improvement=None):
@@ -64,8 +70,66 @@ class LineSearch(Iterative):
         Returns:
             A solution $x$ to the problem as given by the solver.
         """
+        if self.batched:
+            return self.tf_batched_solve(fn_x, x_init, base_value, target_value, estimated_improvement)
         return super(LineSearch, self).tf_solve(fn_x, x_init, base_value, target_value, estimated_improvement)
 
+    def tf_batched_solve(self, fn_x, x_init, base_value, target_value, estimated_improvement=None):
+        """
+        Evaluates $f(x)$ for all candidates $x_t$ on the line between $x'$ and $x_0$ at once and  
+        takes the first acceptable one. Since fn_x has no side effects, the candidate evaluations  
+        are independent of each other and do not have to be executed sequentially. If no  
+        candidate is acceptable, the best one is taken, or $x'$ if none improves on $f(x')$.
+
+        Args:
+            fn_x: A callable returning the value $f(x)$ at $x$, without side effects.
+            x_init: Initial solution guess $x_0$.
+            base_value: Value $f(x')$ at $x = x'$.
+            target_value: Value $f(x_0)$ at $x = x_0$.
+            estimated_improvement: Estimated improvement for $x = x_0$, $f(x')$ if None.
+
+        Returns:
+            A solution $x$ to the problem as given by the solver.
+        """
+        if estimated_improvement is None:
+            estimated_improvement = tf.abs(x=base_value)
+
+        # Scaling factors $x_t / x_0$ of all candidates, the same as in the iterative version.
+        if self.mode == 'linear':
+            factors = [1.0 - t * self.parameter for t in range(self.max_iterations + 1)]
+            factors = [factor for factor in factors if factor > 0.0]
+
+        elif self.mode == 'exponential':
+            factors = [self.parameter ** t for t in range(self.max_iterations + 1)]
+
+        values = [target_value]
+        for factor in factors[1:]:
+            values.append(fn_x([t * factor for t in x_init]))
+        values = tf.stack(values=values)
+
+        improvements = tf.divide(
+            x=(values - base_value),
+            y=tf.maximum(x=(estimated_improvement * tf.constant(value=factors)), y=util.epsilon)
+        )
+
+        # Index of first acceptable candidate, otherwise best improving candidate or $x'$.
+        num_candidates = len(factors)
+        indices = tf.range(num_candidates)
+        first_accepted = tf.reduce_min(input_tensor=tf.where(
+            condition=(improvements >= self.accept_ratio),
+            x=indices,
+            y=tf.fill(dims=(num_candidates,), value=num_candidates)
+        ))
+        best = tf.argmax(input=values, output_type=tf.int32)
+        index = tf.where(
+            condition=(first_accepted < num_candidates),
+            x=first_accepted,
+            y=tf.where(condition=(values[best] > base_value), x=best, y=num_candidates)
+        )
+
+        factor = tf.gather(params=tf.constant(value=(factors + [0.0])), indices=index)
+        return [t * factor for t in x_init]
+
     def tf_initialize(self, x_init, base_value, target_value, estimated_improvement):
         """
         Initialization step preparing the arguments for the first iteration of the loop body.
@@ -47,7 +47,7 @@ class Synchronization(Optimizer):
 
         super(Synchronization, self).__init__(scope=scope, summary_labels=summary_labels)
 
-    def tf_step(self, time, variables, source_variables, **kwargs):
+    def tf_step(self, time, variables, source_variables, return_deltas=True, **kwargs):
         """
         Creates the TensorFlow operations for performing an optimization step.
 
@@ -55,10 +55,13 @@ class Synchronization(Optimizer):
             time: Time tensor.
             variables: List of variables to optimize.
             source_variables: List of source variables to synchronize with.
+            return_deltas: Returns the synchronization operation instead of delta tensors if  
+                false, in which case the variables are updated in-place without creating deltas.
             **kwargs: Additional arguments, not used.
 
         Returns:
-            List of delta tensors corresponding to the updates for each optimized variable.
+            List of delta tensors corresponding to the updates for each optimized variable, or  
+            the synchronization operation if return_deltas is false.
         """
         assert all(util.shape(source) == util.shape(target) for source, target in zip(source_variables, variables))
 
@@ -89,5 +92,37 @@ class Synchronization(Optimizer):
                 deltas.append(delta)
             return deltas
 
+        def sync_in_place():
+            assignments = list()
+            for source_variable, target_variable in zip(source_variables, variables):
+                if self.update_weight == 1.0:
+                    assignments.append(tf.assign(ref=target_variable, value=source_variable))
+                else:
+                    # Polyak averaging
+                    assignments.append(tf.assign_add(
+                        ref=target_variable,
+                        value=(self.update_weight * (source_variable - target_variable))
+                    ))
+            assignments.append(last_sync.assign(value=time))
+            return tf.group(*assignments)
+
         do_sync = (time - last_sync >= self.sync_frequency)
-        return tf.cond(pred=do_sync, true_fn=sync, false_fn=no_sync)
+        if return_deltas:
+            return tf.cond(pred=do_sync, true_fn=sync, false_fn=no_sync)
+        else:
+            return tf.cond(pred=do_sync, true_fn=sync_in_place, false_fn=tf.no_op)
+
+    def minimize(self, time, variables, **kwargs):
+        """
+        Performs a synchronization step, updating the variables in-place as a single grouped  
+        operation without creating delta tensors.
+
+        Args:
+            time: Time tensor.
+            variables: List of variables to optimize.
+            **kwargs: Additional arguments, see tf_step.
+
+        Returns:
+            The synchronization operation.
+        """
+        return self.step(time=time, variables=variables, return_deltas=False, **kwargs)
@@ -0,0 +1,169 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from multiprocessing.connection import Client
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import util, TensorForceError
+from tensorforce.core.optimizers import MetaOptimizer, Evolutionary, NaturalGradient, OptimizedStep, \
+    Synchronization
+
+
+class SynchronousReplicas(MetaOptimizer):
+    """
+    The synchronous-replicas meta optimizer averages the loss gradients over all worker replicas,  
+    as computed by a `ReplicaCoordinator` (see `tensorforce.execution.SynchronousRunner`), and  
+    subsequently applies another optimizer based on the averaged gradients. Since all replicas  
+    apply the same step, optimizer state like Adam moments stays identical too. Before the first  
+    update, the variables of all replicas are set to the values of the first worker. The internal  
+    optimizer has to be gradient-based.
+    """
+
+    def __init__(self, optimizer, address, task_index, authkey=None, scope='synchronous-replicas', summary_labels=()):
+        """
+        Creates a new synchronous-replicas meta optimizer instance.
+
+        Args:
+            optimizer: The optimizer which is modified by this meta optimizer.
+            address: Address of the replica coordinator.
+            task_index: Index of this worker replica.
+            authkey: Authentication key of the replica coordinator.
+        """
+        self.address = tuple(address) if isinstance(address, list) else address
+        self.task_index = task_index
+        self.authkey = authkey
+        self.connection = None
+
+        super(SynchronousReplicas, self).__init__(optimizer=optimizer, scope=scope, summary_labels=summary_labels)
+
+        # Optimizers which do not follow the gradients of the loss produce wrong steps for the
+        # surrogate loss of the averaged gradients.
+        internal_optimizer = self.optimizer
+        while True:
+            if isinstance(internal_optimizer, (Evolutionary, NaturalGradient, OptimizedStep, Synchronization)):
+                raise TensorForceError(
+                    "Synchronous-replicas optimizer requires a gradient-based internal optimizer, but {} given.".format(
+                        type(internal_optimizer).__name__
+                    )
+                )
+            elif isinstance(internal_optimizer, MetaOptimizer):
+                internal_optimizer = internal_optimizer.optimizer
+            else:
+                break
+
+    def exchange(self, key, operation, values):
+        """
+        Sends values to the replica coordinator and blocks until all replicas have contributed.
+
+        Args:
+            key: Identifier shared by the corresponding optimizers of all replicas.
+            operation: Either 'broadcast' or 'average'.
+            values: List of NumPy arrays.
+
+        Returns:
+            List of NumPy arrays, either the first worker's or the averaged values.
+        """
+        try:
+            if self.connection is None:
+                self.connection = Client(address=self.address, authkey=self.authkey)
+            self.connection.send((key, operation, self.task_index, values))
+            values = self.connection.recv()
+        except (EOFError, OSError):
+            raise TensorForceError("Connection to replica coordinator at {} lost.".format(self.address))
+        return [np.asarray(value, dtype=util.np_dtype('float')) for value in values]
+
+    def tf_step(self, time, variables, arguments, fn_loss, broadcast_variables=(), **kwargs):
+        """
+        Creates the TensorFlow operations for performing an optimization step.
+
+        Args:
+            time: Time tensor.
+            variables: List of variables to optimize.
+            arguments: Dict of arguments for callables, like fn_loss.
+            fn_loss: A callable returning the loss of the current model.
+            broadcast_variables: List of further variables which are not optimized, but set to the  
+                values of the first worker before the first update, like target network variables.
+            **kwargs: Additional arguments passed on to the internal optimizer.
+
+        Returns:
+            List of delta tensors corresponding to the updates for each optimized variable.
+        """
+        key = variables[0].name
+        broadcast_variables = list(variables) + list(broadcast_variables)
+
+        initialized = tf.get_variable(
+            name='initialized',
+            dtype=util.tf_dtype('bool'),
+            initializer=False,
+            trainable=False
+        )
+
+        def broadcast():
+            values = tf.py_func(
+                func=(lambda *values: self.exchange(key=key, operation='broadcast', values=list(values))),
+                inp=broadcast_variables,
+                Tout=[util.tf_dtype('float') for _ in broadcast_variables],
+                stateful=True
+            )
+            assignments = [
+                tf.assign(ref=variable, value=tf.reshape(tensor=value, shape=util.shape(variable)))
+                for variable, value in zip(broadcast_variables, values)
+            ]
+            assignments.append(tf.assign(ref=initialized, value=True))
+            with tf.control_dependencies(control_inputs=assignments):
+                return tf.constant(value=True)
+
+        synchronized = tf.cond(pred=initialized, true_fn=(lambda: tf.constant(value=True)), false_fn=broadcast)
+
+        with tf.control_dependencies(control_inputs=(synchronized,)):
+            loss = fn_loss(**arguments)
+            gradients = tf.gradients(ys=loss, xs=variables)
+            gradients = [
+                tf.zeros_like(tensor=variable) if gradient is None else gradient
+                for variable, gradient in zip(variables, gradients)
+            ]
+
+            averaged_gradients = tf.py_func(
+                func=(lambda *gradients: self.exchange(key=key, operation='average', values=list(gradients))),
+                inp=gradients,
+                Tout=[util.tf_dtype('float') for _ in variables],
+                stateful=True
+            )
+            averaged_gradients = [
+                tf.reshape(tensor=averaged_gradient, shape=util.shape(variable))
+                for variable, averaged_gradient in zip(variables, averaged_gradients)
+            ]
+
+        # Surrogate loss whose gradients are the averaged gradients.
+        def fn_averaged_loss(**kwargs):
+            return tf.add_n(inputs=[
+                tf.reduce_sum(input_tensor=(tf.stop_gradient(input=averaged_gradient) * variable))
+                for averaged_gradient, variable in zip(averaged_gradients, variables)
+            ])
+
+        return self.optimizer.step(
+            time=time,
+            variables=variables,
+            arguments=arguments,
+            fn_loss=fn_averaged_loss,
+            **kwargs
+        )
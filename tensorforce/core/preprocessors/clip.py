@@ -17,7 +17,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
 import tensorflow as tf
+
 from tensorforce.core.preprocessors import Preprocessor
 
 
@@ -33,3 +35,6 @@ class Clip(Preprocessor):
 
     def tf_process(self, tensor):
         return tf.clip_by_value(t=tensor, clip_value_min=self.min_value, clip_value_max=self.max_value)
+
+    def np_process(self, array):
+        return np.clip(array, self.min_value, self.max_value)
@@ -17,6 +17,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import tensorflow as tf
+
+from tensorforce import util
 from tensorforce.core.preprocessors import Preprocessor
 
 
@@ -30,4 +33,11 @@ class Divide(Preprocessor):
         super(Divide, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_process(self, tensor):
+        tensor = tf.cast(x=tensor, dtype=util.tf_dtype('float'))
         return tensor / self.scale
+
+    def np_process(self, array):
+        return array.astype(util.np_dtype('float')) / util.np_dtype('float')(self.scale)
+
+    def processed_dtype(self, dtype):
+        return 'float'
@@ -25,15 +25,18 @@ from tensorforce.core.preprocessors import Preprocessor
 
 class Flatten(Preprocessor):
     """
-    Normalize state. Subtract minimal value and divide by range.
+    Flatten state to a vector.
     """
 
-    def __init__(self, scope='flatten', summary_labels=()):
-        super(Flatten, self).__init__(scope=scope, summary_labels=summary_labels)
+    def __init__(self, shape, scope='flatten', summary_labels=()):
+        super(Flatten, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def processed_shape(self, shape):
-        return -1, util.prod(shape[1:])
+        return (util.prod(shape),)
 
     def tf_process(self, tensor):
-        # Flatten tensor
-        return tf.reshape(tensor=tensor, shape=self.processed_shape(util.shape(tensor)))
+        # Flatten tensor, keeping the batch dimension
+        return tf.reshape(tensor=tensor, shape=((-1,) + self.processed_shape(util.shape(tensor)[1:])))
+
+    def np_process(self, array):
+        return array.reshape((array.shape[0],) + self.processed_shape(array.shape[1:]))
@@ -17,6 +17,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
 import tensorflow as tf
 
 from tensorforce import util
@@ -39,8 +40,22 @@ class Grayscale(Preprocessor):
         super(Grayscale, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_process(self, tensor):
+        dtype = tensor.dtype
+        tensor = tf.cast(x=tensor, dtype=util.tf_dtype('float'))
         weights = tf.reshape(tensor=self.weights, shape=(tuple(1 for _ in range(util.rank(tensor) - 1)) + (3,)))
         weighted_sum = tf.reduce_sum(input_tensor=(weights * tensor), axis=-1, keepdims=(not self.remove_rank))
+        if dtype.is_integer:
+            # Integer (e.g. uint8) images stay integer.
+            weighted_sum = tf.cast(x=tf.round(x=weighted_sum), dtype=dtype)
+        return weighted_sum
+
+    def np_process(self, array):
+        weights = np.asarray(self.weights, dtype=util.np_dtype('float'))
+        weighted_sum = np.dot(array.astype(util.np_dtype('float')), weights)
+        if not self.remove_rank:
+            weighted_sum = np.expand_dims(weighted_sum, axis=-1)
+        if np.issubdtype(array.dtype, np.integer):
+            weighted_sum = np.round(weighted_sum).astype(array.dtype)
         return weighted_sum
 
     def processed_shape(self, shape):
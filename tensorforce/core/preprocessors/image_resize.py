@@ -17,7 +17,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
 import tensorflow as tf
+
+from tensorforce import util
 from tensorforce.core.preprocessors import Preprocessor
 
 
@@ -31,7 +34,33 @@ class ImageResize(Preprocessor):
         super(ImageResize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_process(self, tensor):
-        return tf.image.resize_images(images=tensor, size=self.size)
+        resized = tf.image.resize_images(images=tensor, size=self.size)
+        if tensor.dtype.is_integer:
+            # Integer (e.g. uint8) images stay integer.
+            resized = tf.cast(x=tf.round(x=resized), dtype=tensor.dtype)
+        return resized
+
+    def np_process(self, array):
+        # Bilinear sampling as in tf.image.resize_images (without corner alignment).
+        rows_lower, rows_upper, rows_weight = self.interpolation(size=array.shape[-3], new_size=self.size[0])
+        cols_lower, cols_upper, cols_weight = self.interpolation(size=array.shape[-2], new_size=self.size[1])
+        resized = array.astype(util.np_dtype('float'))
+        left = np.take(resized, cols_lower, axis=-2)
+        right = np.take(resized, cols_upper, axis=-2)
+        resized = left + (right - left) * cols_weight.reshape(-1, 1)
+        top = np.take(resized, rows_lower, axis=-3)
+        bottom = np.take(resized, rows_upper, axis=-3)
+        resized = top + (bottom - top) * rows_weight.reshape(-1, 1, 1)
+        if np.issubdtype(array.dtype, np.integer):
+            resized = np.round(resized).astype(array.dtype)
+        return resized
+
+    @staticmethod
+    def interpolation(size, new_size):
+        position = np.arange(new_size, dtype=util.np_dtype('float')) * util.np_dtype('float')(size / new_size)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, size - 1)
+        return lower, upper, (position - lower).astype(util.np_dtype('float'))
 
     def processed_shape(self, shape):
         return self.size + (shape[-1],)
@@ -17,6 +17,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
 import tensorflow as tf
 
 from tensorforce import util
@@ -32,6 +33,8 @@ class Normalize(Preprocessor):
         super(Normalize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_process(self, tensor):
+        tensor = tf.cast(x=tensor, dtype=util.tf_dtype('float'))
+
         # Min/max across every axis except batch dimension.
         min_value = tensor
         max_value = tensor
@@ -40,3 +43,13 @@ class Normalize(Preprocessor):
             max_value = tf.reduce_max(input_tensor=max_value, axis=axis, keep_dims=True)
 
         return (tensor - min_value) / (max_value - min_value + util.epsilon)
+
+    def np_process(self, array):
+        array = array.astype(util.np_dtype('float'))
+        axes = tuple(range(1, array.ndim))
+        min_value = np.amin(array, axis=axes, keepdims=True)
+        max_value = np.amax(array, axis=axes, keepdims=True)
+        return (array - min_value) / (max_value - min_value + util.np_dtype('float')(util.epsilon))
+
+    def processed_dtype(self, dtype):
+        return 'float'
@@ -20,7 +20,7 @@ from __future__ import division
 import tensorflow as tf
 import copy
 
-from tensorforce import util
+from tensorforce import util, TensorForceError
 import tensorforce.core.preprocessors
 
 
@@ -56,6 +56,16 @@ class Preprocessor(object):
             func_=self.tf_reset,
             custom_getter_=custom_getter
         )
+        self.reset_slots = tf.make_template(
+            name_=(scope + '/reset-slots'),
+            func_=self.tf_reset_slots,
+            custom_getter_=custom_getter
+        )
+        self.synchronize = tf.make_template(
+            name_=(scope + '/synchronize'),
+            func_=self.tf_synchronize,
+            custom_getter_=custom_getter
+        )
 
     def tf_reset(self):
         """
@@ -65,6 +75,31 @@ class Preprocessor(object):
         """
         pass
 
+    def tf_reset_slots(self, slots):
+        """
+        Resets the state of the given batch slots, for preprocessors which keep state per batch slot
+        when acting batched (e.g. one slot per environment).
+
+        Args:
+            slots (tf.Tensor): The batch slots to reset.
+
+        Returns: List of reset operations, if any.
+        """
+        pass
+
+    def tf_synchronize(self, source):
+        """
+        Synchronizes the state of this preprocessor with the given source preprocessor, for
+        preprocessors which keep statistics to be shared across the replicas of a distributed
+        model. Called at episode ends with the corresponding preprocessor of the global model.
+
+        Args:
+            source (Preprocessor): The corresponding preprocessor of the global model.
+
+        Returns: List of synchronization operations, if any.
+        """
+        pass
+
     def tf_process(self, tensor):
         """
         Process state (tensor).
@@ -76,6 +111,20 @@ class Preprocessor(object):
         """
         return tensor
 
+    def np_process(self, array):
+        """
+        Process state (array) on the host, the NumPy counterpart of `tf_process`. Only stateless
+        preprocessors implement it, so a preprocessing stack can be executed where observations are
+        produced (e.g. in environment worker processes) instead of in the model's graph.
+
+        Args:
+            array (np.ndarray): The batch of states to process.
+
+        Returns: The pre-processed batch of states.
+        """
+        raise TensorForceError("Preprocessor {} does not support host-side processing.".format(
+            self.__class__.__name__))
+
     def processed_shape(self, shape):
         """
         Shape of preprocessed state given original shape.
@@ -87,6 +136,18 @@ class Preprocessor(object):
         """
         return shape
 
+    def processed_dtype(self, dtype):
+        """
+        Type of preprocessed state given original type. Preprocessors keep the type by default,
+        so integer (e.g. uint8 image) states stay integer until the network input.
+
+        Args:
+            dtype (str): The original (unprocessed) type.
+
+        Returns: The processed type.
+        """
+        return dtype
+
     def get_variables(self):
         """
         Returns the TensorFlow variables used by the preprocessor.
@@ -96,6 +157,16 @@ class Preprocessor(object):
         """
         return [self.variables[key] for key in sorted(self.variables)]
 
+    def get_transient_variables(self):
+        """
+        Returns the variables which only hold transient state, for instance statistics pending
+        synchronization, and which are hence excluded from saving.
+
+        Returns:
+            List of variables.
+        """
+        return list()
+
 
 class PreprocessorStack(object):
     """
@@ -118,6 +189,37 @@ class PreprocessorStack(object):
             fetches.extend(processor.reset() or [])
         return fetches
 
+    def reset_slots(self, slots):
+        """
+        Calls `reset_slots` on all our Preprocessor objects.
+
+        Args:
+            slots: Tensor of batch slots to reset.
+
+        Returns:
+            A list of reset operations.
+        """
+        operations = []
+        for processor in self.preprocessors:
+            operations.extend(processor.reset_slots(slots=slots) or [])
+        return operations
+
+    def synchronize(self, source):
+        """
+        Calls `synchronize` on all our Preprocessor objects, with the corresponding Preprocessor
+        objects of the given source stack.
+
+        Args:
+            source: PreprocessorStack to synchronize with.
+
+        Returns:
+            A list of synchronization operations.
+        """
+        operations = []
+        for processor, source_processor in zip(self.preprocessors, source.preprocessors):
+            operations.extend(processor.synchronize(source=source_processor) or [])
+        return operations
+
     def process(self, tensor):
         """
         Process state.
@@ -132,6 +234,20 @@ class PreprocessorStack(object):
             tensor = processor.process(tensor=tensor)
         return tensor
 
+    def np_process(self, array):
+        """
+        Process state on the host with NumPy, requires all preprocessors to be stateless.
+
+        Args:
+            array: batch of states to process
+
+        Returns: processed batch of states
+
+        """
+        for processor in self.preprocessors:
+            array = processor.np_process(array=array)
+        return array
+
     def processed_shape(self, shape):
         """
         Shape of preprocessed state given original shape.
@@ -145,9 +261,27 @@ class PreprocessorStack(object):
             shape = processor.processed_shape(shape=shape)
         return shape
 
+    def processed_dtype(self, dtype):
+        """
+        Type of preprocessed state given original type.
+
+        Args:
+            dtype: original state type
+
+        Returns: processed state type
+        """
+        for processor in self.preprocessors:
+            dtype = processor.processed_dtype(dtype=dtype)
+        return dtype
+
     def get_variables(self):
         return [variable for preprocessor in self.preprocessors for variable in preprocessor.get_variables()]
 
+    def get_transient_variables(self):
+        return [
+            variable for preprocessor in self.preprocessors for variable in preprocessor.get_transient_variables()
+        ]
+
     @staticmethod
     def from_spec(spec, kwargs=None):
         """
@@ -26,19 +26,32 @@ class RunningStandardize(Preprocessor):
     """
     Standardize state w.r.t past states.
     Subtract mean and divide by standard deviation of sequence of past states.
-    Based on https://www.johndcook.com/blog/standard_deviation/.
+    The running moments are updated per batch with the parallel algorithm of Chan et al.
+    (https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm), so
+    batched acting yields the same statistics as acting one state at a time. Replicas of a
+    distributed model merge their statistics into the global model at episode ends, see
+    `tf_synchronize`.
     """
 
     def __init__(
         self,
         shape,
-        reset_after_batch=True,
+        reset_after_batch=False,
         scope='running_standardize',
         summary_labels=()
     ):
+        """
+        Args:
+            reset_after_batch (bool): Resets the running statistics whenever the model is reset
+                (i.e. on episode start) if true.
+        """
         self.reset_after_batch = reset_after_batch
         # The op that resets our stats variables.
         self.reset_op = None
+        # Running (count, mean, variance sum) variables, and those of the batches since the last
+        # synchronization.
+        self.moments = None
+        self.pending_moments = None
         super(RunningStandardize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_reset(self):
@@ -46,6 +59,8 @@ class RunningStandardize(Preprocessor):
             return [self.reset_op]
 
     def tf_process(self, tensor):
+        tensor = tf.cast(x=tensor, dtype=util.tf_dtype('float'))
+
         count = tf.get_variable(
             name='count',
             dtype=util.tf_dtype('float'),
@@ -66,28 +81,101 @@ class RunningStandardize(Preprocessor):
             initializer=tf.zeros_initializer(),
             trainable=False
         )
-        self.reset_op = tf.variables_initializer([count, mean_estimate, variance_sum_estimate], name='reset-op')
+        pending_count = tf.get_variable(
+            name='pending-count',
+            dtype=util.tf_dtype('float'),
+            initializer=0.0,
+            trainable=False
+        )
+        pending_mean = tf.get_variable(
+            name='pending-mean',
+            shape=self.shape,
+            dtype=util.tf_dtype('float'),
+            initializer=tf.zeros_initializer(),
+            trainable=False
+        )
+        pending_variance_sum = tf.get_variable(
+            name='pending-variance-sum',
+            shape=self.shape,
+            dtype=util.tf_dtype('float'),
+            initializer=tf.zeros_initializer(),
+            trainable=False
+        )
+        self.moments = (count, mean_estimate, variance_sum_estimate)
+        self.pending_moments = (pending_count, pending_mean, pending_variance_sum)
+        self.reset_op = tf.variables_initializer(self.moments + self.pending_moments, name='reset-op')
 
-        assignment = tf.assign_add(ref=count, value=1.0)
+        # Moments of the batch
+        batch_count = tf.cast(x=tf.shape(input=tensor)[0], dtype=util.tf_dtype('float'))
+        batch_mean = tf.reduce_mean(input_tensor=tensor, axis=0)
+        batch_variance_sum = tf.reduce_sum(input_tensor=tf.square(x=(tensor - batch_mean)), axis=0)
+        batch_moments = (batch_count, batch_mean, batch_variance_sum)
 
-        with tf.control_dependencies(control_inputs=(assignment,)):
-            # Mean update
-            mean = tf.reduce_sum(input_tensor=(tensor - mean_estimate), axis=0)  # reduce_mean?
-            assignment = tf.assign_add(ref=mean_estimate, value=(mean / count))
+        moments = self.merge_moments(moments=self.moments, other_moments=batch_moments)
+        pending_moments = self.merge_moments(moments=self.pending_moments, other_moments=batch_moments)
+        assignments = [
+            tf.assign(ref=variable, value=value) for variable, value in
+            zip(self.moments + self.pending_moments, moments + pending_moments)
+        ]
 
-        with tf.control_dependencies(control_inputs=(assignment,)):
+        with tf.control_dependencies(control_inputs=assignments):
+            count, mean, variance_sum = (tf.identity(input=value) for value in moments)
 
             def first_run():
                 # No meaningful mean and variance yet.
                 return tensor
 
             def later_run():
-                # Variance update
-                variance = tf.reduce_sum(input_tensor=((tensor - mean_estimate) * mean), axis=0)  # reduce_mean?
-                assignment = tf.assign_add(ref=variance_sum_estimate, value=variance)
-                with tf.control_dependencies(control_inputs=(assignment,)):
-                    variance_estimate = variance_sum_estimate / (count - 1.0)
-                    # Standardize tensor
-                    return (tensor - mean_estimate) / tf.maximum(x=tf.sqrt(x=variance_estimate), y=util.epsilon)
+                variance_estimate = variance_sum / (count - 1.0)
+                # Standardize tensor
+                return (tensor - mean) / tf.maximum(x=tf.sqrt(x=variance_estimate), y=util.epsilon)
 
             return tf.cond(pred=(count > 1.0), true_fn=later_run, false_fn=first_run)
+
+    def tf_synchronize(self, source):
+        """
+        Merges the statistics of the batches processed since the last synchronization into those of
+        the given source preprocessor (i.e. its counterpart in the global model), and continues with
+        the merged statistics. Note that the merge is not atomic: if replicas synchronize
+        concurrently, the pending statistics of one of them may be lost, so the shared statistics
+        are then based on fewer states, but remain consistent.
+
+        Args:
+            source (RunningStandardize): The preprocessor keeping the shared statistics.
+
+        Returns: List of synchronization operations.
+        """
+        moments = self.merge_moments(moments=source.moments, other_moments=self.pending_moments)
+        assignments = [tf.assign(ref=variable, value=value) for variable, value in zip(source.moments, moments)]
+        with tf.control_dependencies(control_inputs=assignments):
+            assignments = [
+                tf.assign(ref=variable, value=value) for variable, value in zip(self.moments, moments)
+            ]
+            assignments.extend(
+                tf.assign(ref=variable, value=tf.zeros_like(tensor=variable)) for variable in self.pending_moments
+            )
+        return assignments
+
+    def get_transient_variables(self):
+        # The pending moments are only kept until the next synchronization.
+        if self.pending_moments is None:
+            return list()
+        return list(self.pending_moments)
+
+    @staticmethod
+    def merge_moments(moments, other_moments):
+        """
+        Combines the (count, mean, variance sum) moments of two sets of values.
+        """
+        count, mean, variance_sum = moments
+        other_count, other_mean, other_variance_sum = other_moments
+        merged_count = count + other_count
+        # Zero if both sets are empty
+        other_weight = other_count / tf.maximum(x=merged_count, y=1.0)
+        delta = other_mean - mean
+        merged_mean = mean + delta * other_weight
+        merged_variance_sum = variance_sum + other_variance_sum + tf.square(x=delta) * count * other_weight
+        return merged_count, merged_mean, merged_variance_sum
+
+    def processed_dtype(self, dtype):
+        return 'float'
@@ -27,9 +27,14 @@ class Sequence(Preprocessor):
     """
     Concatenate `length` state vectors. Example: Used in Atari
     problems to create the Markov property (velocity of game objects as they move across the screen).
+
+    Keeps an independent ring buffer per batch slot, so batched acting (e.g. one slot per environment
+    of a VectorEnvironment) is supported. Row n of a batch is stacked with the previous states of slot n,
+    in chronological order with the current state last. Slots are reset together on episode start, or
+    individually via `reset_slots`, e.g. for environments which terminated.
     """
 
-    def __init__(self, shape, length=2, add_rank=False, scope='sequence', summary_labels=()):
+    def __init__(self, shape, length=2, add_rank=False, num_slots=1, scope='sequence', summary_labels=()):
         """
         Args:
             length (int): The number of states to concatenate. In the beginning, when no previous state is available,
@@ -37,55 +42,78 @@ class Sequence(Preprocessor):
             add_rank (bool): Whether to add another rank to the end of the input with dim=length-of-the-sequence.
                 This could be useful if e.g. a grayscale image of w x h pixels is coming from the env
                 (no color channel). The output of the preprocessor would then be of shape [batch] x w x h x [length].
+            num_slots (int): Max. batch size, i.e. number of independent state sequences (default: 1).
         """
-        # raise TensorForceError("The sequence preprocessor is temporarily broken; use version 0.3.2 if required.")
         self.length = length
         self.add_rank = add_rank
-        # The op that resets index back to -1.
+        self.num_slots = num_slots
+        # The op that resets all slot indices back to -1, and the slot index variable.
         self.reset_op = None
+        self.index = None
         super(Sequence, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_reset(self):
         return [self.reset_op]
 
+    def tf_reset_slots(self, slots):
+        return [tf.scatter_update(ref=self.index, indices=slots, updates=tf.fill(dims=tf.shape(slots), value=-1))]
+
     def tf_process(self, tensor):
-        # or just always the same?
-        tf.assert_equal(x=tf.shape(input=tensor)[0], y=1)
+        batch_size = tf.shape(input=tensor)[0]
+        state_shape = util.shape(tensor)[1:]
+        rank = len(state_shape)
 
         states_buffer = tf.get_variable(
             name='states-buffer',
-            shape=((self.length,) + util.shape(tensor)[1:]),
+            shape=((self.num_slots, self.length) + tuple(state_shape)),
             dtype=tensor.dtype,
             trainable=False
         )
-        index = tf.get_variable(
+        self.index = tf.get_variable(
             name='index',
             dtype=util.tf_dtype('int'),
-            initializer=-1,
+            initializer=tf.constant(value=-1, dtype=util.tf_dtype('int'), shape=(self.num_slots,)),
             trainable=False
         )
-        self.reset_op = tf.variables_initializer([index], name='reset-op')
-
-        def first_run():
-            fill_buffer = (self.length,) + tuple(1 for _ in range(util.rank(tensor) - 1))
-            return tf.assign(ref=states_buffer, value=tf.tile(input=tensor, multiples=fill_buffer))
+        self.reset_op = tf.variables_initializer([self.index], name='reset-op')
 
-        def later_run():
-            return tf.assign(ref=states_buffer[index], value=tensor[0])
+        assertion = tf.assert_less_equal(x=batch_size, y=self.num_slots)
+        with tf.control_dependencies(control_inputs=(assertion,)):
+            slots = tf.range(start=0, limit=batch_size)
 
-        assignment = tf.cond(pred=(index >= 0), true_fn=later_run, false_fn=first_run)
+        # Write the state at the current position of each slot, or to all positions of new slots.
+        index = tf.gather(params=self.index, indices=slots)
+        position = tf.maximum(x=index, y=0)
+        write = tf.logical_or(
+            x=tf.equal(x=tf.expand_dims(input=tf.range(self.length), axis=0), y=tf.expand_dims(input=position, axis=1)),
+            y=tf.expand_dims(input=(index < 0), axis=1)
+        )
+        write = tf.reshape(tensor=write, shape=((-1, self.length) + tuple(1 for _ in range(rank))))
+        write = tf.tile(input=write, multiples=((1, 1) + tuple(state_shape)))
+        previous = tf.gather(params=states_buffer, indices=slots)
+        current = tf.tile(input=tf.expand_dims(input=tensor, axis=1), multiples=((1, self.length) + (1,) * rank))
+        sequences = tf.where(condition=write, x=current, y=previous)
 
+        assignment = tf.scatter_update(ref=states_buffer, indices=slots, updates=sequences)
         with tf.control_dependencies(control_inputs=(assignment,)):
-            previous_states = [states_buffer[(index - n - 1) % self.length] for n in range(self.length)]
-            assignment = tf.assign(ref=index, value=((tf.maximum(x=index, y=0) + 1) % self.length))
+            assignment = tf.scatter_update(ref=self.index, indices=slots, updates=((position + 1) % self.length))
+
+        # Chronological order, oldest state first and current state last.
+        order = (tf.expand_dims(input=position, axis=1) + 1 + tf.expand_dims(input=tf.range(self.length), axis=0)) % \
+            self.length
+        order += tf.expand_dims(input=(slots * self.length), axis=1)
+        sequences = tf.reshape(tensor=sequences, shape=((-1,) + tuple(state_shape)))
+        sequences = tf.gather(params=sequences, indices=order)
 
         with tf.control_dependencies(control_inputs=(assignment,)):
             if self.add_rank:
-                stack = tf.stack(values=previous_states, axis=-1)
+                # batch x length x shape -> batch x shape x length
+                return tf.transpose(a=sequences, perm=((0,) + tuple(range(2, rank + 2)) + (1,)))
             else:
-                stack = tf.concat(values=previous_states, axis=-1)
-            batch_one = tf.expand_dims(input=stack, axis=0)
-            return batch_one
+                # batch x length x shape -> batch x shape[:-1] x (length * shape[-1])
+                sequences = tf.transpose(a=sequences, perm=((0,) + tuple(range(2, rank + 1)) + (1, rank + 1)))
+                return tf.reshape(tensor=sequences, shape=((-1,) + tuple(state_shape[:-1]) +
+                                                           (self.length * state_shape[-1],)))
 
     def processed_shape(self, shape):
         if self.add_rank:
@@ -39,6 +39,8 @@ class Standardize(Preprocessor):
         super(Standardize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
     def tf_process(self, tensor):
+        tensor = tf.cast(x=tensor, dtype=util.tf_dtype('float'))
+
         if self.across_batch:
             axes = tuple(range(util.rank(tensor)))
         else:
@@ -46,3 +48,6 @@ class Standardize(Preprocessor):
 
         mean, variance = tf.nn.moments(x=tensor, axes=axes, keep_dims=True)
         return (tensor - mean) / tf.maximum(x=tf.sqrt(variance), y=util.epsilon)
+
+    def processed_dtype(self, dtype):
+        return 'float'
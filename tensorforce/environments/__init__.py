@@ -15,6 +15,9 @@
 
 
 from tensorforce.environments.environment import Environment
+from tensorforce.environments.process_environment import ProcessEnvironment
+from tensorforce.environments.vector_environment import VectorEnvironment
+from tensorforce.environments.preprocessed_environment import PreprocessedEnvironment
 from tensorforce.tests.minimal_test import MinimalTest
 
 
@@ -22,4 +25,4 @@ environments = dict(
     minimal_test=MinimalTest,
 )
 
-__all__ = ['Environment', 'MinimalTest']
+__all__ = ['Environment', 'ProcessEnvironment', 'VectorEnvironment', 'PreprocessedEnvironment', 'MinimalTest']
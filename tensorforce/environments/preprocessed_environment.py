@@ -0,0 +1,134 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import numpy as np
+
+from tensorforce import util
+from tensorforce.core.preprocessors import PreprocessorStack
+from tensorforce.environments import Environment
+
+
+class PreprocessedEnvironment(Environment):
+    """
+    Environment wrapper which applies a states preprocessing spec on the host via the NumPy
+    implementations of stateless preprocessors (e.g. grayscale, image_resize, divide). Wrapping
+    the environments of worker processes or remote environment servers means only the (usually
+    much smaller) processed states are transferred, and the agent is created for the processed
+    states spec without any states preprocessing of its own.
+    """
+
+    def __init__(self, environment, preprocessing, batched=False):
+        """
+        Initializes a preprocessed environment.
+
+        Args:
+            environment (Environment): The wrapped environment.
+            preprocessing (spec / dict of specs): States preprocessing specification, as for the
+                model's `states_preprocessing`. All preprocessors have to be stateless.
+            batched (bool): Whether the wrapped environment returns states batched along the first
+                dimension (e.g. a `VectorEnvironment`).
+        """
+        self.environment = environment
+        self.batched = batched
+
+        states = self.environment.states
+        self.unique_state = ('shape' in states)
+        if self.unique_state:
+            states = dict(state=states)
+
+        self.unprocessed_states = dict()
+        for name, state in states.items():
+            shape = state['shape']
+            self.unprocessed_states[name] = dict(state, shape=((shape,) if isinstance(shape, int) else tuple(shape)))
+
+        self.preprocessing = dict()
+        if not isinstance(preprocessing, list) and \
+                all(name in self.unprocessed_states for name in preprocessing):
+            # Specs per state component
+            names = list(preprocessing)
+        else:
+            # One spec for all state components
+            names = list(self.unprocessed_states)
+            preprocessing = {name: preprocessing for name in names}
+        for name in names:
+            self.preprocessing[name] = PreprocessorStack.from_spec(
+                spec=preprocessing[name],
+                kwargs=dict(shape=self.unprocessed_states[name]['shape'])
+            )
+
+        self.processed_states = dict()
+        for name, state in self.unprocessed_states.items():
+            state = dict(state)
+            if name in self.preprocessing:
+                state['shape'] = self.preprocessing[name].processed_shape(shape=state['shape'])
+                state['type'] = self.preprocessing[name].processed_dtype(dtype=state.get('type', 'float'))
+            self.processed_states[name] = state
+
+    def __str__(self):
+        return 'PreprocessedEnvironment({})'.format(self.environment)
+
+    def close(self):
+        self.environment.close()
+
+    def seed(self, seed):
+        return self.environment.seed(seed=seed)
+
+    def reset(self):
+        return self.process(states=self.environment.reset())
+
+    def execute(self, actions):
+        states, terminal, reward = self.environment.execute(actions=actions)
+        return self.process(states=states), terminal, reward
+
+    def process(self, states):
+        """
+        Applies the preprocessing to a (batch of) state(s) as returned by the wrapped environment.
+        """
+        if self.unique_state:
+            states = dict(state=states)
+
+        processed = dict()
+        for name, state in states.items():
+            if name not in self.preprocessing:
+                processed[name] = state
+                continue
+            array = np.asarray(state, dtype=util.np_dtype(self.unprocessed_states[name].get('type', 'float')))
+            if not self.batched:
+                array = np.expand_dims(array, axis=0)
+            array = self.preprocessing[name].np_process(array=array)
+            if not self.batched:
+                array = array[0]
+            processed[name] = array
+
+        if self.unique_state:
+            return processed['state']
+        else:
+            return processed
+
+    @property
+    def states(self):
+        if self.unique_state:
+            return self.processed_states['state']
+        else:
+            return self.processed_states
+
+    @property
+    def actions(self):
+        return self.environment.actions
@@ -0,0 +1,168 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import multiprocessing
+
+import numpy as np
+
+from tensorforce import util, TensorForceError
+from tensorforce.environments import Environment
+
+
+class ProcessEnvironment(Environment):
+    """
+    Environment wrapper which hosts another environment in a subprocess, so CPU-bound environments  
+    are not serialized by the GIL. States are written into preallocated shared-memory NumPy buffers,  
+    and only actions and small control messages are sent over a pipe. The subprocess is forked, so  
+    the wrapped environment object is inherited by (and afterwards only used in) the subprocess.
+    """
+
+    def __init__(self, environment, copy_states=False):
+        """
+        Initializes a process environment and starts its subprocess.
+
+        Args:
+            environment (Environment): The environment to host in a subprocess.
+            copy_states (bool): Whether to return copies of the shared state buffers, otherwise the
+                returned states are overwritten by the next call to reset/execute (default: false).
+        """
+        self.environment = environment
+        self.copy_states = copy_states
+
+        states = environment.states
+        self.unique_state = ('shape' in states)
+        if self.unique_state:
+            states = dict(state=states)
+
+        # Preallocated shared-memory state buffers, inherited by the subprocess.
+        self.state_buffers = dict()
+        for name, state in states.items():
+            shape = (state['shape'],) if isinstance(state['shape'], int) else tuple(state['shape'])
+            dtype = np.dtype(util.np_dtype(state.get('type', 'float')))
+            buffer = multiprocessing.RawArray('B', max(util.prod(shape) * dtype.itemsize, 1))
+            self.state_buffers[name] = np.frombuffer(buffer, dtype=dtype, count=util.prod(shape)).reshape(shape)
+
+        self.connection, process_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=self.run_process, args=(process_connection,))
+        self.process.daemon = True
+        self.process.start()
+        process_connection.close()
+
+    def __str__(self):
+        return 'ProcessEnvironment({})'.format(self.environment)
+
+    def run_process(self, connection):
+        """
+        The target function of the subprocess, executes commands received via the given connection until
+        the environment is closed.
+
+        Args:
+            connection: Subprocess end of the pipe.
+        """
+        while True:
+            try:
+                command, argument = connection.recv()
+            except (EOFError, KeyboardInterrupt):
+                break
+
+            try:
+                if command == 'reset':
+                    self.write_states(states=self.environment.reset())
+                    result = None
+                elif command == 'execute':
+                    states, terminal, reward = self.environment.execute(actions=argument)
+                    self.write_states(states=states)
+                    result = (terminal, reward)
+                elif command == 'seed':
+                    result = self.environment.seed(seed=argument)
+                elif command == 'close':
+                    self.environment.close()
+                    result = None
+                else:
+                    raise TensorForceError("Invalid process environment command: {}.".format(command))
+                connection.send((True, result))
+            except Exception as exception:
+                connection.send((False, '{}: {}'.format(type(exception).__name__, exception)))
+
+            if command == 'close':
+                break
+
+        connection.close()
+
+    def write_states(self, states):
+        if self.unique_state:
+            states = dict(state=states)
+        for name, buffer in self.state_buffers.items():
+            buffer[...] = states[name]
+
+    def read_states(self):
+        if self.copy_states:
+            states = {name: np.array(buffer) for name, buffer in self.state_buffers.items()}
+        else:
+            states = dict(self.state_buffers)
+        if self.unique_state:
+            return states['state']
+        else:
+            return states
+
+    def send_command(self, command, argument=None):
+        self.send_request(command=command, argument=argument)
+        return self.receive_result()
+
+    def send_request(self, command, argument=None):
+        """
+        Sends a command to the subprocess without waiting for its result, so that multiple process
+        environments can work in parallel (see `VectorEnvironment`).
+        """
+        self.connection.send((command, argument))
+
+    def receive_result(self):
+        """
+        Waits for and returns the result of the last command sent via `send_request`.
+        """
+        success, result = self.connection.recv()
+        if not success:
+            raise TensorForceError("Process environment failed: {}".format(result))
+        return result
+
+    def close(self):
+        if self.process.is_alive():
+            self.send_command(command='close')
+            self.process.join()
+        self.connection.close()
+
+    def seed(self, seed):
+        return self.send_command(command='seed', argument=seed)
+
+    def reset(self):
+        self.send_command(command='reset')
+        return self.read_states()
+
+    def execute(self, actions):
+        terminal, reward = self.send_command(command='execute', argument=actions)
+        return self.read_states(), terminal, reward
+
+    @property
+    def states(self):
+        return self.environment.states
+
+    @property
+    def actions(self):
+        return self.environment.actions
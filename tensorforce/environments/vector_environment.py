@@ -0,0 +1,179 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.environments import Environment, ProcessEnvironment
+
+
+class VectorEnvironment(Environment):
+    """
+    Vectorized environment wrapping a number of sub-environments with identical specification.  
+    `reset` and `execute` operate on all sub-environments at once and return states, terminals  
+    and rewards stacked along a leading batch dimension. Terminated sub-environments are reset  
+    automatically, in which case the returned state is the initial state of the next episode.
+    """
+
+    def __init__(self, environments, mode='serial'):
+        """
+        Initializes a vector environment.
+
+        Args:
+            environments (List[Environment]): The sub-environments.
+            mode (str): How sub-environments are executed, one of 'serial', 'thread' (one thread per
+                sub-environment) or 'process' (one subprocess per sub-environment, see
+                `ProcessEnvironment`) (default: 'serial').
+        """
+        if len(environments) == 0:
+            raise TensorForceError("Vector environment requires at least one environment.")
+        if mode not in ('serial', 'thread', 'process'):
+            raise TensorForceError("Invalid vector environment mode: {}.".format(mode))
+        self.mode = mode
+
+        if self.mode == 'process':
+            self.environments = [
+                env if isinstance(env, ProcessEnvironment) else ProcessEnvironment(environment=env)
+                for env in environments
+            ]
+        else:
+            self.environments = list(environments)
+
+        if self.mode == 'thread':
+            self.pool = ThreadPool(processes=len(self.environments))
+        else:
+            self.pool = None
+
+        self.unique_state = ('shape' in self.states)
+        self.unique_action = ('type' in self.actions)
+
+    def __str__(self):
+        return 'VectorEnvironment({})'.format(self.environments[0])
+
+    @property
+    def num_environments(self):
+        return len(self.environments)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+        for environment in self.environments:
+            environment.close()
+
+    def seed(self, seed):
+        """
+        Seeds the sub-environments with consecutive seeds starting from the given one.
+
+        Returns: List of actual seeds.
+        """
+        if seed is None:
+            return [environment.seed(seed=None) for environment in self.environments]
+        return [environment.seed(seed=(seed + n)) for n, environment in enumerate(self.environments)]
+
+    def reset(self):
+        """
+        Resets all sub-environments.
+
+        Returns:
+            Stacked initial states.
+        """
+        if self.mode == 'serial':
+            states = [environment.reset() for environment in self.environments]
+
+        elif self.mode == 'thread':
+            states = self.pool.map(lambda environment: environment.reset(), self.environments)
+
+        else:
+            for environment in self.environments:
+                environment.send_request(command='reset')
+            states = list()
+            for environment in self.environments:
+                environment.receive_result()
+                states.append(environment.read_states())
+
+        return self.stack_states(states=states)
+
+    def execute(self, actions):
+        """
+        Executes one action per sub-environment and resets terminated sub-environments.
+
+        Args:
+            actions: (Dict of) actions batched along the first dimension.
+
+        Returns:
+            Stacked next states, terminal array and reward array.
+        """
+        actions = [self.unstack_actions(actions=actions, index=n) for n in range(len(self.environments))]
+
+        if self.mode == 'serial':
+            results = [
+                self.execute_single(environment, action)
+                for environment, action in zip(self.environments, actions)
+            ]
+
+        elif self.mode == 'thread':
+            results = self.pool.map(lambda args: self.execute_single(*args), zip(self.environments, actions))
+
+        else:
+            for environment, action in zip(self.environments, actions):
+                environment.send_request(command='execute', argument=action)
+            results = [environment.receive_result() for environment in self.environments]
+            terminated = [environment for environment, (terminal, _) in zip(self.environments, results) if terminal]
+            for environment in terminated:
+                environment.send_request(command='reset')
+            for environment in terminated:
+                environment.receive_result()
+            results = [
+                (environment.read_states(), terminal, reward)
+                for environment, (terminal, reward) in zip(self.environments, results)
+            ]
+
+        states, terminal, reward = zip(*results)
+        return self.stack_states(states=states), np.asarray(terminal, dtype=np.bool_), \
+            np.asarray(reward, dtype=np.float32)
+
+    def execute_single(self, environment, action):
+        state, terminal, reward = environment.execute(actions=action)
+        if terminal:
+            state = environment.reset()
+        return state, terminal, reward
+
+    def stack_states(self, states):
+        if self.unique_state:
+            return np.stack([np.asarray(state) for state in states])
+        else:
+            return {name: np.stack([np.asarray(state[name]) for state in states]) for name in states[0]}
+
+    def unstack_actions(self, actions, index):
+        if self.unique_action:
+            return actions[index]
+        else:
+            return {name: action[index] for name, action in actions.items()}
+
+    @property
+    def states(self):
+        return self.environments[0].states
+
+    @property
+    def actions(self):
+        return self.environments[0].actions
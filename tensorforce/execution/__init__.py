@@ -13,8 +13,20 @@
 # limitations under the License.
 # ==============================================================================
 
+from tensorforce.execution.episode_statistics import EpisodeStatistics
+from tensorforce.execution.runner_profiler import RunnerProfiler
+from tensorforce.execution.checkpointer import Checkpointer
+from tensorforce.execution.evaluator import Evaluator
 from tensorforce.execution.base_runner import BaseRunner
 from tensorforce.execution.runner import Runner, SingleRunner, DistributedTFRunner
 from tensorforce.execution.threaded_runner import ThreadedRunner, WorkerAgentGenerator
+from tensorforce.execution.multiprocess_runner import MultiprocessRunner
+from tensorforce.execution.synchronous_runner import SynchronousRunner, ReplicaCoordinator
+from tensorforce.execution.actor_learner_runner import ActorLearnerRunner
+from tensorforce.execution.cluster_launcher import ClusterLauncher
+from tensorforce.execution.session_autotuner import SessionAutotuner
 
-__all__ = ['BaseRunner', 'SingleRunner', 'DistributedTFRunner', 'Runner', 'ThreadedRunner', 'WorkerAgentGenerator']
+__all__ = ['BaseRunner', 'SingleRunner', 'DistributedTFRunner', 'Runner', 'ThreadedRunner', 'WorkerAgentGenerator',
+           'MultiprocessRunner', 'SynchronousRunner', 'ReplicaCoordinator', 'ActorLearnerRunner',
+           'ClusterLauncher', 'EpisodeStatistics', 'RunnerProfiler', 'Evaluator',
+           'Checkpointer', 'SessionAutotuner']
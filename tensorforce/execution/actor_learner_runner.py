@@ -0,0 +1,266 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from inspect import getargspec
+import multiprocessing
+import time
+
+import numpy as np
+from six.moves import queue as Queue
+from six.moves import xrange
+
+from tensorforce import TensorForceError
+from tensorforce.execution.base_runner import BaseRunner
+
+
+class ActorLearnerRunner(BaseRunner):
+    """
+    Runner for decoupled actor-learner execution (IMPALA-style) on one machine. Several actor  
+    processes each run a copy of the policy and stream trajectory segments via a local queue into  
+    the learner, which owns the model and updates it on every segment. Actors pull fresh weights  
+    every few segments, and the learner corrects for their lag via V-trace, so the agent has to  
+    specify `vtrace_threshold` (see `PGModel.off_policy_update`).
+    """
+
+    def __init__(self, agent, environment, num_actors, segment_length=20, weights_frequency=1, repeat_actions=1,
+                 history=None):
+        """
+        Initialize an ActorLearnerRunner object.
+
+        Args:
+            agent (dict): Agent specification (including network), see `Agent.from_spec`. The learner and
+                each actor create their own agent from it.
+            environment (callable): Function returning a new Environment object, called once per actor
+                and once by the learner to retrieve the states and actions specification.
+            num_actors (int): Number of actor processes.
+            segment_length (int): Number of timesteps per trajectory segment.
+            weights_frequency (int): Every how many segments an actor pulls the learner's weights.
+        """
+        super(ActorLearnerRunner, self).__init__(agent, environment, repeat_actions, history)
+
+        if num_actors < 1:
+            raise TensorForceError("Invalid number of actors: {}.".format(num_actors))
+        self.num_actors = num_actors
+        self.segment_length = segment_length
+        self.weights_frequency = weights_frequency
+
+        self.learner = None
+        self.should_stop = None
+
+    def close(self):
+        if self.learner is not None:
+            self.learner.close()
+
+    def run(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None, deterministic=False,
+            episode_finished=None, summary_report=None, summary_interval=None):
+        """
+        Executes this runner by starting all actor processes and updating the learner on their segments.
+
+        Args:
+            num_timesteps (int): Max. number of time steps in total (across all actors).
+            num_episodes (int): Max. number of episodes in total (across all actors).
+            episode_finished (callable): Function called after each episode of an actor, taking this runner and
+                the actor index. Returning False stops all actors.
+        """
+        from tensorforce.agents import Agent
+
+        if summary_report is not None or summary_interval is not None:
+            raise TensorForceError("ActorLearnerRunner does not support summary_report, use episode_finished.")
+        if episode_finished is not None and len(getargspec(episode_finished).args) == 1:
+            raise TensorForceError("ActorLearnerRunner requires episode_finished to take runner and actor index.")
+
+        self.reset()
+        self.global_episode = 0
+        self.global_timestep = 0
+
+        # Start actors before the learner creates its TensorFlow session.
+        self.should_stop = multiprocessing.Event()
+        queue = multiprocessing.Queue()
+        connections = list()
+        actors = list()
+        for actor_index in xrange(self.num_actors):
+            connection, actor_connection = multiprocessing.Pipe()
+            connections.append(connection)
+            actors.append(multiprocessing.Process(
+                target=self._run_actor,
+                args=(actor_index, actor_connection, queue),
+                kwargs=dict(max_episode_timesteps=max_episode_timesteps, deterministic=deterministic)
+            ))
+
+        self.start_time = time.time()
+        for actor in actors:
+            actor.start()
+
+        if self.learner is None:
+            environment = self.environment()
+            self.learner = Agent.from_spec(
+                spec=self.agent,
+                kwargs=dict(states=environment.states, actions=environment.actions)
+            )
+            environment.close()
+
+        weights = self.learner.model.get_variable_values()
+        for connection in connections:
+            connection.send(weights)
+
+        num_running = self.num_actors
+        try:
+            while num_running > 0:
+                message = queue.get()
+
+                if message[0] == 'segment':
+                    _, actor_index, segment, pull = message
+                    self.learner.model.off_policy_update(**segment)
+                    self.global_timestep += len(segment['terminal'])
+                    if pull:
+                        connections[actor_index].send(self.learner.model.get_variable_values())
+
+                    if num_timesteps is not None and self.global_timestep >= num_timesteps:
+                        self.should_stop.set()
+
+                elif message[0] == 'episode':
+                    _, actor_index, episode_reward, episode_timestep, episode_time = message
+                    self.statistics.add_episode(reward=episode_reward, timesteps=episode_timestep, time=episode_time)
+                    self.global_episode += 1
+
+                    if episode_finished is not None and not episode_finished(self, actor_index):
+                        self.should_stop.set()
+                    if num_episodes is not None and self.global_episode >= num_episodes:
+                        self.should_stop.set()
+
+                elif message[0] == 'error':
+                    self.should_stop.set()
+                    raise TensorForceError("Actor {} failed: {}".format(message[1], message[2]))
+
+                else:
+                    num_running -= 1
+
+        except KeyboardInterrupt:
+            print('Keyboard interrupt, sending stop command to actors')
+            self.should_stop.set()
+
+        finally:
+            self.should_stop.set()
+            for connection in connections:
+                connection.close()
+            # Actors only exit once their queued messages are consumed, so keep reading until all are done.
+            while num_running > 0 and any(actor.is_alive() for actor in actors):
+                try:
+                    message = queue.get(timeout=1.0)
+                except Queue.Empty:
+                    continue
+                if message[0] == 'done':
+                    num_running -= 1
+            for actor in actors:
+                actor.join()
+
+    def _run_actor(self, actor_index, connection, queue, max_episode_timesteps, deterministic):
+        """
+        The target function for an actor process, generates trajectory segments with the most recently
+        pulled weights until signaled to stop.
+        """
+        from tensorforce.agents import Agent
+
+        try:
+            environment = self.environment()
+            agent = Agent.from_spec(
+                spec=self.agent,
+                kwargs=dict(states=environment.states, actions=environment.actions)
+            )
+            agent.model.set_variable_values(values=connection.recv())
+
+            state = environment.reset()
+            agent.reset()
+            episode_reward = 0.0
+            episode_timestep = 0
+            episode_start_time = time.time()
+
+            num_segments = 0
+            while not self.should_stop.is_set():
+                segment = dict(
+                    states=dict(), internals=dict(), actions=dict(), terminal=list(), reward=list(),
+                    behaviour_log_prob=list()
+                )
+
+                for _ in xrange(self.segment_length):
+                    action, fetched = agent.act(
+                        states=state,
+                        deterministic=deterministic,
+                        independent=True,
+                        fetch_tensors=['log_probability']
+                    )
+                    for key, values in (('states', agent.current_states), ('internals', agent.current_internals),
+                                        ('actions', agent.current_actions)):
+                        for name, value in values.items():
+                            segment[key].setdefault(name, list()).append(value)
+                    segment['behaviour_log_prob'].append(fetched['log_probability'][0])
+
+                    reward = 0.0
+                    for _ in xrange(self.repeat_actions):
+                        state, terminal, step_reward = environment.execute(actions=action)
+                        reward += step_reward
+                        if terminal:
+                            break
+
+                    episode_reward += reward
+                    episode_timestep += 1
+                    if max_episode_timesteps is not None and episode_timestep >= max_episode_timesteps:
+                        terminal = True
+
+                    segment['terminal'].append(terminal)
+                    segment['reward'].append(reward)
+
+                    if terminal:
+                        queue.put((
+                            'episode', actor_index, episode_reward, episode_timestep,
+                            time.time() - episode_start_time
+                        ))
+                        state = environment.reset()
+                        agent.reset()
+                        episode_reward = 0.0
+                        episode_timestep = 0
+                        episode_start_time = time.time()
+
+                for key in ('states', 'internals', 'actions'):
+                    segment[key] = {name: np.stack(values) for name, values in segment[key].items()}
+                # State following the segment, to bootstrap the value targets of a non-terminal segment end
+                if agent.unique_state:
+                    segment['bootstrap_states'] = dict(state=np.asarray(state))
+                else:
+                    segment['bootstrap_states'] = {name: np.asarray(value) for name, value in state.items()}
+                segment['bootstrap_internals'] = dict(agent.next_internals)
+                for key in ('terminal', 'reward', 'behaviour_log_prob'):
+                    segment[key] = np.asarray(segment[key])
+
+                num_segments += 1
+                pull = (num_segments % self.weights_frequency == 0)
+                queue.put(('segment', actor_index, segment, pull))
+                if pull:
+                    agent.model.set_variable_values(values=connection.recv())
+
+            agent.close()
+            environment.close()
+
+        except Exception as exception:
+            # Losing the learner connection after a stop request is the expected way to end.
+            if not self.should_stop.is_set():
+                queue.put(('error', actor_index, str(exception)))
+
+        queue.put(('done', actor_index))
@@ -17,13 +17,19 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+from six.moves import zip_longest
+
+from tensorforce.execution.episode_statistics import EpisodeStatistics
+from tensorforce.execution.runner_profiler import RunnerProfiler
+
 
 class BaseRunner(object):
     """
     Base class for all runner classes.
     Implements the `run` method.
     """
-    def __init__(self, agent, environment, repeat_actions=1, history=None):
+    def __init__(self, agent, environment, repeat_actions=1, history=None, profile=False, profile_path=None,
+                 evaluator=None, statistics=None):
         """
         Args:
             agent (Agent): Agent object (or list of Agent objects) to use for the run.
@@ -33,20 +39,33 @@ class BaseRunner(object):
                 as a sum in the following call to Agent's `observe` method.
             history (dict): A dictionary containing an already run experiment's results. Keys should be:
                 episode_rewards (list of rewards), episode_timesteps (lengths of episodes), episode_times (run-times)
+            profile (bool): Whether to instrument the run loop with a RunnerProfiler, which splits the time per step
+                into act/execute/observe/update phases and reports steps/sec and updates/sec per episode.
+            profile_path (str): Optional CSV or JSON lines file to write the profiler's episode reports to.
+            evaluator (Evaluator): Optional evaluation service, notified after every episode to periodically
+                evaluate the agent's current weights in parallel to training.
+            statistics (dict): Optional arguments of the runner's EpisodeStatistics, e.g. the number of retained
+                recent episodes `capacity` (default 10000) and a CSV file `path` for the full episode history.
         """
         self.agent = agent
         self.environment = environment
         self.repeat_actions = repeat_actions
 
+        if profile:
+            self.profiler = RunnerProfiler(path=profile_path)
+        else:
+            self.profiler = None
+
+        self.evaluator = evaluator
+        self.statistics_spec = statistics or dict()
+
         self.global_episode = None  # the global episode number (across all (parallel) agents)
         self.global_timestep = None  # the global time step (across all (parallel) agents)
 
         self.start_time = None  # TODO: is this necessary here? global start time (episode?, overall?)
 
-        # lists of episode data (rewards, wall-times/timesteps)
-        self.episode_rewards = None  # list of accumulated episode rewards
-        self.episode_timesteps = None  # list of total timesteps taken in the episodes
-        self.episode_times = None  # list of durations for the episodes
+        # bounded episode data (rewards, wall-times/timesteps), see episode_rewards etc. properties
+        self.statistics = None
 
         self.reset(history)
 
@@ -57,14 +76,23 @@ class BaseRunner(object):
 
         Args:
             history (dict): A dictionary containing an already run experiment's results. Keys should be:
-                episode_rewards (list of rewards), episode_timesteps (lengths of episodes), episode_times (run-times)
+                episode_rewards (list of rewards), episode_timesteps (lengths of episodes), episode_times (run-times).
+                Missing values of shorter lists are recorded as 0.
         """
         if not history:
             history = dict()
 
-        self.episode_rewards = history.get("episode_rewards", list())
-        self.episode_timesteps = history.get("episode_timesteps", list())
-        self.episode_times = history.get("episode_times", list())
+        if self.statistics is not None:
+            self.statistics.flush()
+        self.statistics = EpisodeStatistics(**self.statistics_spec)
+
+        for reward, timesteps, time in zip_longest(
+            history.get("episode_rewards", list()),
+            history.get("episode_timesteps", list()),
+            history.get("episode_times", list()),
+            fillvalue=0
+        ):
+            self.statistics.add_episode(reward=reward, timesteps=timesteps, time=time)
 
     def close(self):
         """
@@ -94,6 +122,53 @@ class BaseRunner(object):
         """
         raise NotImplementedError
 
+    @property
+    def episode_rewards(self):
+        """
+        Accumulated rewards of the most recent episodes (across all workers).
+        """
+        return self.statistics.recent(field='reward')
+
+    @episode_rewards.setter
+    def episode_rewards(self, episode_rewards):
+        self.replace_history(episode_rewards=episode_rewards)
+
+    @property
+    def episode_timesteps(self):
+        """
+        Lengths of the most recent episodes (across all workers).
+        """
+        return self.statistics.recent(field='timesteps')
+
+    @episode_timesteps.setter
+    def episode_timesteps(self, episode_timesteps):
+        self.replace_history(episode_timesteps=episode_timesteps)
+
+    @property
+    def episode_times(self):
+        """
+        Durations of the most recent episodes (across all workers).
+        """
+        return self.statistics.recent(field='time')
+
+    @episode_times.setter
+    def episode_times(self, episode_times):
+        self.replace_history(episode_times=episode_times)
+
+    def replace_history(self, **history):
+        """
+        Replaces the recorded episode data of the given fields, as for assignments to `episode_rewards`,
+        `episode_timesteps` and `episode_times`. The other fields keep the values of the same number of
+        most recent episodes, so for instance assigning an empty list clears all episode data. Note that
+        this resets the running aggregates to the retained episodes.
+        """
+        num_episodes = max(len(values) for values in history.values())
+        for key, values in (('episode_rewards', self.episode_rewards), ('episode_timesteps', self.episode_timesteps),
+                            ('episode_times', self.episode_times)):
+            if key not in history:
+                history[key] = list(values)[-num_episodes:] if num_episodes > 0 else list()
+        self.reset(history)
+
     # keep backwards compatibility
     @property
     def episode(self):
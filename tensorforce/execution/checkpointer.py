@@ -0,0 +1,163 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import os
+import threading
+
+import numpy as np
+from six.moves import queue as Queue
+
+from tensorforce import TensorForceError
+
+
+class Checkpointer(object):
+    """
+    Non-blocking checkpointing of a model. `save` only fetches the variable values into memory
+    with a single session call, the snapshot is then written by a background thread. Files are
+    first written under a temporary name and atomically renamed, so a checkpoint on disk is
+    always complete. If the maximum number of in-flight saves is reached, further saves are
+    skipped instead of stalling the caller.
+    """
+
+    def __init__(self, model, path, max_in_flight=1, max_to_keep=5, include_memory=True):
+        """
+        Initializes a checkpointer and starts its writer thread.
+
+        Args:
+            model (Model): The model to checkpoint.
+            path (str): Checkpoint path prefix, checkpoints are written to '<path>-<timestep>.npz'.
+            max_in_flight (int): Max. number of snapshots waiting for or being written.
+            max_to_keep (int): Max. number of recent checkpoint files to keep, or None to keep all.
+            include_memory (bool): Includes the replay memory variables of memory-based models if true.
+        """
+        if max_in_flight < 1:
+            raise TensorForceError("Invalid number of in-flight checkpoints.")
+        self.model = model
+        self.path = path
+        self.max_to_keep = max_to_keep
+        self.include_memory = include_memory
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.logger = logging.getLogger(__name__)
+        self.slots = threading.BoundedSemaphore(value=max_in_flight)
+        self.queue = Queue.Queue()
+        self.files = list()
+        self.latest = None
+        self.error = None
+
+        self.thread = threading.Thread(target=self._write_loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        """
+        Waits for all in-flight checkpoints to be written and stops the writer thread.
+        """
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def save(self, block=False):
+        """
+        Snapshots the model's variables and schedules them to be written.
+
+        Args:
+            block (bool): Waits for an in-flight slot, and for the checkpoint to be written, if true.
+
+        Returns:
+            The checkpoint file, or None if the save was skipped.
+        """
+        if self.thread is None:
+            raise TensorForceError("Checkpointer is closed.")
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise TensorForceError("Writing checkpoint failed: {}".format(error))
+        if not self.slots.acquire(block):
+            return None
+
+        try:
+            values = self.model.snapshot(include_memory=self.include_memory)
+        except Exception:
+            self.slots.release()
+            raise
+        timestep = values.get(self.model.global_timestep.name)
+        file = '{}-{}.npz'.format(self.path, int(timestep) if timestep is not None else len(self.files))
+
+        written = threading.Event()
+        self.queue.put((file, values, written))
+        if block:
+            written.wait()
+        return file
+
+    def restore(self, file=None):
+        """
+        Restores a checkpoint into the model.
+
+        Args:
+            file (str): Checkpoint file, by default the latest one written by this checkpointer.
+        """
+        if file is None:
+            file = self.latest
+        if file is None:
+            raise TensorForceError("No checkpoint to restore.")
+
+        with np.load(file) as data:
+            values = {name: data[name] for name in data.files}
+        self.model.restore_snapshot(values=values)
+
+    def _write_loop(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            file, values, written = item
+            try:
+                self._write(file=file, values=values)
+            except Exception as exception:
+                self.logger.error("Writing checkpoint {} failed: {}".format(file, exception))
+                self.error = exception
+            finally:
+                self.slots.release()
+                written.set()
+
+    def _write(self, file, values):
+        temporary_file = file + '.tmp'
+        with open(temporary_file, 'wb') as fp:
+            np.savez(fp, **values)
+            fp.flush()
+            os.fsync(fp.fileno())
+        # Rename is atomic, so readers only ever see complete checkpoints (os.replace also overwrites on Windows).
+        getattr(os, 'replace', os.rename)(temporary_file, file)
+
+        if file in self.files:
+            self.files.remove(file)
+        self.files.append(file)
+        self.latest = file
+
+        if self.max_to_keep is not None:
+            while len(self.files) > self.max_to_keep:
+                old_file = self.files.pop(0)
+                if os.path.isfile(old_file):
+                    os.remove(old_file)
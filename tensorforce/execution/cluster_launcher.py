@@ -0,0 +1,224 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from inspect import getargspec
+import multiprocessing
+import socket
+import time
+
+from six.moves import queue as Queue
+
+from tensorforce import TensorForceError
+from tensorforce.execution.base_runner import BaseRunner
+from tensorforce.execution.runner import Runner
+
+
+def free_ports(num_ports, host='127.0.0.1'):
+    """
+    Returns the given number of currently unused ports on the given host.
+    """
+    sockets = list()
+    ports = list()
+    for _ in range(num_ports):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind((host, 0))
+        sockets.append(sock)
+        ports.append(sock.getsockname()[1])
+    for sock in sockets:
+        sock.close()
+    return ports
+
+
+class ClusterLauncher(BaseRunner):
+    """
+    Launcher for distributed (parameter server) training on the local machine. Spawns the parameter  
+    server and worker processes for a given agent specification on free ports, monitors their  
+    health, restarts failed workers, and collects the workers' episode statistics centrally.
+    """
+
+    def __init__(self, agent, environment, num_workers, num_parameter_servers=1, repeat_actions=1, history=None,
+                 host='127.0.0.1', protocol='grpc', max_restarts=3):
+        """
+        Initialize a ClusterLauncher object.
+
+        Args:
+            agent (dict): Agent specification (including network), see `Agent.from_spec`. Device and
+                distributed specification are added per process.
+            environment (callable): Function returning a new Environment object, called once per process.
+            num_workers (int): Number of worker processes.
+            num_parameter_servers (int): Number of parameter server processes.
+            host (str): Host to run the cluster on.
+            protocol (str): TensorFlow server protocol.
+            max_restarts (int): Max. number of restarts per failed worker.
+        """
+        super(ClusterLauncher, self).__init__(agent, environment, repeat_actions, history)
+
+        if num_workers < 1 or num_parameter_servers < 1:
+            raise TensorForceError("Cluster requires at least one worker and one parameter server.")
+        self.num_workers = num_workers
+        self.num_parameter_servers = num_parameter_servers
+        self.host = host
+        self.protocol = protocol
+        self.max_restarts = max_restarts
+
+        self.cluster = None
+        self.should_stop = None
+        self.restarts = None
+
+    def close(self):
+        # Agents and environments are closed by their processes.
+        pass
+
+    def run(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None, deterministic=False,
+            episode_finished=None, summary_report=None, summary_interval=None):
+        """
+        Executes this launcher by starting the cluster processes and collecting the workers' episode statistics
+        until all workers are done.
+
+        Args:
+            num_timesteps (int): Max. number of time steps per worker, counted by the shared global timestep.
+            num_episodes (int): Max. number of episodes per worker, counted by the shared global episode.
+            episode_finished (callable): Function called after each episode of a worker, taking this launcher and
+                the worker index. Returning False stops all workers.
+        """
+        if summary_report is not None or summary_interval is not None:
+            raise TensorForceError("ClusterLauncher does not support summary_report, use episode_finished.")
+        if episode_finished is not None and len(getargspec(episode_finished).args) == 1:
+            raise TensorForceError("ClusterLauncher requires episode_finished to take launcher and worker index.")
+
+        self.reset()
+        self.global_episode = 0
+        self.global_timestep = 0
+
+        ports = free_ports(num_ports=(self.num_parameter_servers + self.num_workers), host=self.host)
+        addresses = ['{}:{}'.format(self.host, port) for port in ports]
+        self.cluster = dict(ps=addresses[:self.num_parameter_servers], worker=addresses[self.num_parameter_servers:])
+
+        self.should_stop = multiprocessing.Event()
+        self.restarts = [0 for _ in range(self.num_workers)]
+        queue = multiprocessing.Queue()
+        run_kwargs = dict(
+            num_timesteps=num_timesteps,
+            num_episodes=num_episodes,
+            max_episode_timesteps=max_episode_timesteps,
+            deterministic=deterministic
+        )
+
+        def start_process(parameter_server, task_index, restarted=False):
+            process = multiprocessing.Process(
+                target=self._run_process,
+                args=(parameter_server, task_index, restarted, queue, run_kwargs)
+            )
+            process.daemon = parameter_server
+            process.start()
+            return process
+
+        self.start_time = time.time()
+        parameter_servers = [start_process(True, task_index) for task_index in range(self.num_parameter_servers)]
+        workers = [start_process(False, task_index) for task_index in range(self.num_workers)]
+        finished = set()
+
+        try:
+            while len(finished) < self.num_workers:
+                try:
+                    message = queue.get(timeout=1.0)
+                except Queue.Empty:
+                    message = None
+
+                if message is not None and message[0] == 'episode':
+                    _, task_index, episode_reward, episode_timestep, episode_time = message
+                    self.statistics.add_episode(reward=episode_reward, timesteps=episode_timestep, time=episode_time)
+                    self.global_episode += 1
+                    self.global_timestep += episode_timestep
+
+                    if episode_finished is not None and not episode_finished(self, task_index):
+                        self.should_stop.set()
+
+                elif message is not None and message[0] == 'done':
+                    finished.add(message[1])
+
+                # Health monitoring
+                for task_index, process in enumerate(parameter_servers):
+                    if not process.is_alive():
+                        raise TensorForceError("Parameter server {} failed.".format(task_index))
+
+                for task_index, process in enumerate(workers):
+                    if task_index in finished or process.is_alive():
+                        continue
+                    elif process.exitcode == 0:
+                        finished.add(task_index)
+                    elif self.should_stop.is_set():
+                        finished.add(task_index)
+                    elif self.restarts[task_index] < self.max_restarts:
+                        self.restarts[task_index] += 1
+                        workers[task_index] = start_process(False, task_index, restarted=True)
+                    else:
+                        raise TensorForceError(
+                            "Worker {} failed {} times.".format(task_index, self.restarts[task_index] + 1)
+                        )
+
+        except KeyboardInterrupt:
+            print('Keyboard interrupt, sending stop command to workers')
+            self.should_stop.set()
+
+        finally:
+            self.should_stop.set()
+            for process in workers:
+                process.join()
+            # Parameter servers do nothing actively and never return.
+            for process in parameter_servers:
+                process.terminate()
+                process.join()
+
+    def _run_process(self, parameter_server, task_index, restarted, queue, run_kwargs):
+        """
+        The target function for a cluster process, either starts a parameter server or runs a worker until
+        its termination criteria are met or all workers are signaled to stop. A restarted worker rejoins
+        the running cluster without re-initializing the shared variables.
+        """
+        import tensorflow as tf
+        from tensorforce.agents import Agent
+
+        environment = self.environment()
+        agent_spec = dict(self.agent)
+        agent_spec['device'] = '/job:{}/task:{}'.format('ps' if parameter_server else 'worker', task_index)
+        agent_spec['distributed'] = dict(
+            cluster_spec=tf.train.ClusterSpec(self.cluster),
+            task_index=task_index,
+            parameter_server=parameter_server,
+            protocol=self.protocol,
+            restarted=restarted
+        )
+
+        # A parameter server blocks within the agent constructor.
+        agent = Agent.from_spec(
+            spec=agent_spec,
+            kwargs=dict(states=environment.states, actions=environment.actions)
+        )
+        runner = Runner(agent=agent, environment=environment, repeat_actions=self.repeat_actions, id_=task_index)
+
+        def worker_episode_finished(r, id_):
+            queue.put(('episode', id_, r.episode_rewards[-1], r.episode_timesteps[-1], r.episode_times[-1]))
+            return not self.should_stop.is_set()
+
+        runner.run(episode_finished=worker_episode_finished, **run_kwargs)
+        runner.close()
+
+        queue.put(('done', task_index))
@@ -0,0 +1,356 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import csv
+import itertools
+import math
+import threading
+
+import numpy as np
+
+from tensorforce import TensorForceError
+
+
+class RingBuffer(object):
+    """
+    Fixed-capacity sequence which retains the most recent values. Supports appending, `len`,
+    iteration and (negative) indexing and slicing relative to the retained values, so it can be
+    used in place of the unbounded lists runners used to keep.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity < 1:
+            raise TensorForceError("Invalid ring buffer capacity.")
+        self.capacity = capacity
+        self.values = np.zeros(shape=(capacity,), dtype=dtype)
+        self.start = 0
+        self.size = 0
+
+    def append(self, value):
+        self.values[(self.start + self.size) % self.capacity] = value
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = np.arange(*index.indices(self.size))
+            return self.values[(self.start + indices) % self.capacity].tolist()
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("Ring buffer index out of range.")
+        return self.values[(self.start + index) % self.capacity].item()
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __repr__(self):
+        return repr(self[:])
+
+    def to_array(self):
+        return self.values[(self.start + np.arange(self.size)) % self.capacity]
+
+
+class QuantileSketch(object):
+    """
+    Mergeable approximate quantile sketch. Values are summarized by at most about `compression`
+    weighted centroids, each covering a similar share of the observed values, which bounds the
+    rank error of quantile estimates by roughly 1 / compression.
+    """
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.means = np.zeros(shape=(0,))
+        self.weights = np.zeros(shape=(0,))
+        self.buffer = list()
+
+    def add(self, value):
+        self.buffer.append(value)
+        if len(self.buffer) >= self.compression:
+            self.compress()
+
+    def compress(self):
+        if len(self.buffer) > 0:
+            self.means = np.concatenate([self.means, self.buffer])
+            self.weights = np.concatenate([self.weights, np.ones(shape=(len(self.buffer),))])
+            self.buffer = list()
+        order = np.argsort(self.means, kind='mergesort')
+        means = self.means[order]
+        weights = self.weights[order]
+
+        max_weight = max(weights.sum() / self.compression, 1.0)
+        compressed_means = list()
+        compressed_weights = list()
+        for mean, weight in zip(means, weights):
+            if len(compressed_weights) > 0 and compressed_weights[-1] + weight <= max_weight:
+                total = compressed_weights[-1] + weight
+                compressed_means[-1] += (mean - compressed_means[-1]) * weight / total
+                compressed_weights[-1] = total
+            else:
+                compressed_means.append(mean)
+                compressed_weights.append(weight)
+        self.means = np.asarray(compressed_means, dtype=np.float64)
+        self.weights = np.asarray(compressed_weights, dtype=np.float64)
+
+    def merge(self, other):
+        """
+        Returns a new sketch summarizing the values of both sketches.
+        """
+        sketch = QuantileSketch(compression=max(self.compression, other.compression))
+        sketch.means = np.concatenate([self.means, other.means])
+        sketch.weights = np.concatenate([self.weights, other.weights])
+        sketch.buffer = self.buffer + other.buffer
+        sketch.compress()
+        return sketch
+
+    def quantile(self, q):
+        """
+        Returns the approximate q-quantile, or NaN if no values were added.
+        """
+        self.compress()
+        if len(self.means) == 0:
+            return float('nan')
+        # Each centroid is located at the center of the ranks it covers.
+        ranks = np.cumsum(self.weights) - 0.5 * self.weights
+        return float(np.interp(q * self.weights.sum(), ranks, self.means))
+
+
+class RunningStatistics(object):
+    """
+    Running count, mean, variance, extrema and quantiles of a stream of values in constant
+    memory. Instances can be merged, which combines the moments according to Chan et al.
+    """
+
+    def __init__(self, compression=100):
+        self.count = 0
+        self.mean = 0.0
+        self.squared_deviations = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sketch = QuantileSketch(compression=compression)
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.squared_deviations += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+
+    def merge(self, other):
+        """
+        Returns new statistics of the values of both instances.
+        """
+        statistics = RunningStatistics()
+        statistics.count = self.count + other.count
+        if statistics.count > 0:
+            delta = other.mean - self.mean
+            statistics.mean = self.mean + delta * other.count / statistics.count
+            statistics.squared_deviations = self.squared_deviations + other.squared_deviations + \
+                delta * delta * self.count * other.count / statistics.count
+        statistics.min = min(self.min, other.min)
+        statistics.max = max(self.max, other.max)
+        statistics.sketch = self.sketch.merge(other.sketch)
+        return statistics
+
+    @property
+    def variance(self):
+        if self.count == 0:
+            return float('nan')
+        return self.squared_deviations / self.count
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        if self.count == 0:
+            return float('nan')
+        return min(max(self.sketch.quantile(q), self.min), self.max)
+
+
+class WorkerStatistics(object):
+    """
+    Episode statistics of a single worker. Only the owning worker thread writes to it. The lock
+    is only contended by readers of the retained episodes, which require consistent buffers.
+    """
+
+    fields = ('reward', 'timesteps', 'time')
+
+    def __init__(self, capacity, compression):
+        self.sequence = RingBuffer(capacity=capacity, dtype=np.int64)
+        self.rewards = RingBuffer(capacity=capacity, dtype=np.float64)
+        self.timesteps = RingBuffer(capacity=capacity, dtype=np.int64)
+        self.times = RingBuffer(capacity=capacity, dtype=np.float64)
+        self.statistics = {field: RunningStatistics(compression=compression) for field in self.fields}
+        self.pending_rows = list()
+        self.lock = threading.Lock()
+
+
+class EpisodeStatistics(object):
+    """
+    Bounded episode statistics of a runner. Every worker records its episodes into its own fixed-size
+    ring buffers and running aggregates (mean, variance, extrema, quantile sketch), which are merged
+    when read. The full history can optionally be spilled to a CSV file in batches.
+    """
+
+    def __init__(self, capacity=10000, compression=100, path=None, flush_frequency=100):
+        """
+        Initializes episode statistics.
+
+        Args:
+            capacity (int): Number of most recent episodes retained per worker.
+            compression (int): Number of centroids of the quantile sketches.
+            path (str): Optional CSV file the full episode history is appended to.
+            flush_frequency (int): Every how many episodes a worker appends its episodes to the file.
+        """
+        self.capacity = capacity
+        self.compression = compression
+        self.path = path
+        self.flush_frequency = flush_frequency
+
+        self.workers = dict()
+        # Global episode sequence numbers, `next` on a count iterator is atomic under the interpreter lock.
+        self.counter = itertools.count()
+        self.file_lock = threading.Lock()
+
+        if self.path is not None:
+            with open(self.path, 'a') as fp:
+                if fp.tell() == 0:
+                    csv.writer(fp).writerow(('episode', 'worker') + WorkerStatistics.fields)
+
+    def worker(self, worker_id=0):
+        """
+        Returns the statistics of the given worker, creating them if necessary.
+        """
+        if worker_id not in self.workers:
+            # Workers are usually added before their threads start, setdefault keeps this safe otherwise.
+            self.workers.setdefault(worker_id, WorkerStatistics(capacity=self.capacity, compression=self.compression))
+        return self.workers[worker_id]
+
+    def add_episode(self, reward, timesteps, time, worker_id=0):
+        """
+        Records an episode of the given worker, only to be called from the worker's own thread.
+
+        Args:
+            reward (float): Accumulated episode reward.
+            timesteps (int): Episode length.
+            time (float): Episode duration in seconds.
+            worker_id (int): ID of the recording worker.
+        """
+        worker = self.worker(worker_id=worker_id)
+        sequence = next(self.counter)
+
+        with worker.lock:
+            worker.sequence.append(sequence)
+            worker.rewards.append(reward)
+            worker.timesteps.append(timesteps)
+            worker.times.append(time)
+        worker.statistics['reward'].add(reward)
+        worker.statistics['timesteps'].add(timesteps)
+        worker.statistics['time'].add(time)
+
+        if self.path is not None:
+            worker.pending_rows.append((sequence, worker_id, reward, timesteps, time))
+            if len(worker.pending_rows) >= self.flush_frequency:
+                self.flush(worker_id=worker_id)
+
+    def flush(self, worker_id=None):
+        """
+        Appends the pending episodes of the given worker (or all workers) to the history file.
+        """
+        if self.path is None:
+            return
+        worker_ids = list(self.workers) if worker_id is None else [worker_id]
+        for worker_id in worker_ids:
+            worker = self.workers[worker_id]
+            rows, worker.pending_rows = worker.pending_rows, list()
+            if len(rows) > 0:
+                with self.file_lock:
+                    with open(self.path, 'a') as fp:
+                        csv.writer(fp).writerows(rows)
+
+    @property
+    def num_episodes(self):
+        return sum(worker.statistics['reward'].count for worker in list(self.workers.values()))
+
+    def recent(self, field):
+        """
+        Returns the retained values of a field ('reward', 'timesteps' or 'time') in episode order,
+        directly as ring buffer for a single worker, otherwise merged into a list of at most capacity
+        values.
+        """
+        workers = list(self.workers.values())
+        buffers = dict(reward='rewards', timesteps='timesteps', time='times')
+        if field not in buffers:
+            raise TensorForceError("Invalid episode statistics field: {}.".format(field))
+        if len(workers) == 0:
+            return list()
+        elif len(workers) == 1:
+            return getattr(workers[0], buffers[field])
+
+        sequences = list()
+        values = list()
+        for worker in workers:
+            # A worker may record an episode meanwhile, so read sequence numbers and values together.
+            with worker.lock:
+                sequences.append(worker.sequence.to_array())
+                values.append(getattr(worker, buffers[field]).to_array())
+        sequences = np.concatenate(sequences)
+        values = np.concatenate(values)
+        order = np.argsort(sequences, kind='mergesort')[-self.capacity:]
+        return values[order].tolist()
+
+    def aggregate(self, field, worker_id=None):
+        """
+        Returns the running statistics of a field over the full history, for one or all workers.
+        """
+        if worker_id is not None:
+            return self.worker(worker_id=worker_id).statistics[field]
+        statistics = RunningStatistics(compression=self.compression)
+        for worker in list(self.workers.values()):
+            statistics = statistics.merge(worker.statistics[field])
+        return statistics
+
+    def summary(self, worker_id=None, quantiles=(0.1, 0.5, 0.9)):
+        """
+        Returns a dict summarizing all episodes, or those of one worker.
+        """
+        summary = dict()
+        for field in WorkerStatistics.fields:
+            statistics = self.aggregate(field=field, worker_id=worker_id)
+            summary['episodes'] = statistics.count
+            summary[field + '_mean'] = statistics.mean
+            summary[field + '_std'] = statistics.std
+            summary[field + '_min'] = statistics.min
+            summary[field + '_max'] = statistics.max
+            for q in quantiles:
+                summary['{}_q{:g}'.format(field, q * 100)] = statistics.quantile(q)
+        return summary
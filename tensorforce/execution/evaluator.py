@@ -0,0 +1,188 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import multiprocessing
+import threading
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import TensorForceError
+
+
+# Per-process agent and environment of the evaluation pool.
+evaluation_agent = None
+evaluation_environment = None
+
+
+def initialize_evaluation_process(agent, environment):
+    global evaluation_agent, evaluation_environment
+    from tensorforce.agents import Agent
+
+    evaluation_environment = environment()
+    evaluation_agent = Agent.from_spec(
+        spec=agent,
+        kwargs=dict(states=evaluation_environment.states, actions=evaluation_environment.actions)
+    )
+
+
+def evaluate(weights, num_episodes, max_episode_timesteps):
+    """
+    Runs deterministic episodes with the given policy weights in an evaluation process. The weights
+    are a model snapshot, so they include non-trainable state like preprocessing statistics.
+
+    Returns:
+        Tuple of lists of episode rewards and episode lengths, or None and an error message.
+    """
+    try:
+        for variable in evaluation_agent.model.get_variables():
+            if variable.name not in weights:
+                raise TensorForceError("Missing value for variable {}.".format(variable.name))
+        evaluation_agent.model.restore_snapshot(values=weights)
+
+        episode_rewards = list()
+        episode_timesteps = list()
+        for _ in range(num_episodes):
+            state = evaluation_environment.reset()
+            evaluation_agent.reset()
+            episode_reward = 0.0
+            timestep = 0
+            while True:
+                action = evaluation_agent.act(states=state, deterministic=True, independent=True)
+                state, terminal, reward = evaluation_environment.execute(actions=action)
+                episode_reward += reward
+                timestep += 1
+                if terminal or (max_episode_timesteps is not None and timestep >= max_episode_timesteps):
+                    break
+            episode_rewards.append(episode_reward)
+            episode_timesteps.append(timestep)
+
+    except Exception as exception:
+        # Report failures as result, since the pool does not report exceptions of asynchronous calls.
+        return None, '{}: {}'.format(type(exception).__name__, exception)
+
+    return episode_rewards, episode_timesteps
+
+
+class Evaluator(object):
+    """
+    Periodic evaluation service which does not stall training. Every `frequency` episodes, the
+    training agent's current weights are snapshotted and deterministic episodes are run in a
+    separate process pool on copies of the environment. Results are reported asynchronously to
+    `results`, the training model's summarizer and an optional callback. Since the pool processes
+    are forked, the evaluator should be created before the training agent.
+    """
+
+    def __init__(self, agent, environment, frequency=100, num_episodes=10, max_episode_timesteps=None,
+                 num_processes=1, max_pending=1, callback=None):
+        """
+        Initializes an evaluator and starts its process pool.
+
+        Args:
+            agent (dict): Agent specification of the training agent, see `Agent.from_spec`.
+            environment (callable): Function returning a new Environment object, called once per process.
+            frequency (int): Every how many (global) episodes to evaluate.
+            num_episodes (int): Number of deterministic episodes per evaluation.
+            max_episode_timesteps (int): Max. number of timesteps per evaluation episode.
+            num_processes (int): Number of evaluation processes.
+            max_pending (int): Max. number of pending evaluations, further evaluations are skipped.
+            callback (callable): Optional function called with each result dict.
+        """
+        if frequency < 1 or num_episodes < 1:
+            raise TensorForceError("Invalid evaluation frequency or number of episodes.")
+        self.frequency = frequency
+        self.num_episodes = num_episodes
+        self.max_episode_timesteps = max_episode_timesteps
+        self.max_pending = max_pending
+        self.callback = callback
+
+        self.pool = multiprocessing.Pool(
+            processes=num_processes,
+            initializer=initialize_evaluation_process,
+            initargs=(agent, environment)
+        )
+
+        self.lock = threading.Lock()
+        self.num_pending = 0
+        self.next_evaluation = frequency
+        self.results = list()
+
+    def close(self):
+        """
+        Waits for pending evaluations and stops the process pool.
+        """
+        self.pool.close()
+        self.pool.join()
+
+    def episode_finished(self, agent, episode, timestep):
+        """
+        Called by the runner after each episode, starts an evaluation if due.
+
+        Args:
+            agent (Agent): The training agent.
+            episode (int): Global episode.
+            timestep (int): Global timestep.
+
+        Returns:
+            True if an evaluation was started.
+        """
+        with self.lock:
+            if episode < self.next_evaluation:
+                return False
+            while self.next_evaluation <= episode:
+                self.next_evaluation += self.frequency
+            if self.num_pending >= self.max_pending:
+                return False
+            self.num_pending += 1
+
+        # Snapshot without memory, but including non-trainable state like preprocessing statistics
+        weights = agent.model.snapshot(include_memory=False)
+        summarizer = agent.model.summarizer
+
+        def report(result):
+            episode_rewards, episode_timesteps = result
+            if episode_rewards is None:
+                result = dict(episode=episode, timestep=timestep, error=episode_timesteps)
+            else:
+                result = dict(
+                    episode=episode,
+                    timestep=timestep,
+                    mean_reward=float(np.mean(episode_rewards)),
+                    mean_timesteps=float(np.mean(episode_timesteps)),
+                    episode_rewards=episode_rewards
+                )
+            with self.lock:
+                self.num_pending -= 1
+                self.results.append(result)
+                if summarizer is not None and 'error' not in result:
+                    summary = tf.Summary(value=[
+                        tf.Summary.Value(tag='evaluation/mean_reward', simple_value=result['mean_reward']),
+                        tf.Summary.Value(tag='evaluation/mean_timesteps', simple_value=result['mean_timesteps'])
+                    ])
+                    summarizer.add_summary(summary=summary, global_step=timestep)
+            if self.callback is not None:
+                self.callback(result)
+
+        self.pool.apply_async(
+            func=evaluate,
+            args=(weights, self.num_episodes, self.max_episode_timesteps),
+            callback=report
+        )
+        return True
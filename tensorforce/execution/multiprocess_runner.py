@@ -0,0 +1,62 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from tensorforce.environments import ProcessEnvironment
+from tensorforce.execution.threaded_runner import ThreadedRunner
+
+
+class MultiprocessRunner(ThreadedRunner):
+    """
+    Runner for non-realtime threaded execution of multiple agents, where each environment is hosted in  
+    its own subprocess (see `ProcessEnvironment`), so CPU-bound environments are not serialized by the GIL.
+    """
+
+    def __init__(self, agent, environment, repeat_actions=1, save_path=None, save_frequency=None,
+                 save_frequency_unit=None, copy_states=False, profile=False, profile_path=None, evaluator=None,
+                 statistics=None, save_background=False):
+        """
+        Initialize a MultiprocessRunner object.
+
+        Args:
+            agent (List[Agent]): List of Agent objects sharing one model (see `clone_worker_agent`).
+            environment (List[Environment]): List of Environment objects, each moved to its own subprocess.
+            save_path (str): Path where to save the shared model.
+            save_frequency (int): The frequency with which to save the model (could be sec, steps, or episodes).
+            save_frequency_unit (str): "s" (sec), "t" (timesteps), "e" (episodes)
+            copy_states (bool): Whether states are copied out of the shared-memory buffers.
+            save_background (bool): Whether to save non-blocking snapshots via a Checkpointer.
+        """
+        environment = [
+            env if isinstance(env, ProcessEnvironment) else ProcessEnvironment(environment=env, copy_states=copy_states)
+            for env in environment
+        ]
+        super(MultiprocessRunner, self).__init__(
+            agent=agent,
+            environment=environment,
+            repeat_actions=repeat_actions,
+            save_path=save_path,
+            save_frequency=save_frequency,
+            save_frequency_unit=save_frequency_unit,
+            profile=profile,
+            profile_path=profile_path,
+            evaluator=evaluator,
+            statistics=statistics,
+            save_background=save_background
+        )
@@ -30,14 +30,16 @@ class Runner(BaseRunner):
     Simple runner for non-realtime single-process execution.
     """
 
-    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0):
+    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0, profile=False, profile_path=None,
+                 evaluator=None, statistics=None):
         """
         Initialize a single Runner object (one Agent/one Environment).
 
         Args:
             id_ (int): The ID of this Runner (for distributed TF runs).
         """
-        super(Runner, self).__init__(agent, environment, repeat_actions, history)
+        super(Runner, self).__init__(agent, environment, repeat_actions, history, profile, profile_path, evaluator,
+                                     statistics)
 
         self.id = id_  # the worker's ID in a distributed run (default=0)
         self.current_timestep = None  # the time step in the current episode
@@ -45,6 +47,11 @@ class Runner(BaseRunner):
     def close(self):
         self.agent.close()
         self.environment.close()
+        self.statistics.flush()
+        if self.profiler is not None:
+            self.profiler.close()
+        if self.evaluator is not None:
+            self.evaluator.close()
 
     # TODO: make average reward another possible criteria for runner-termination
     def run(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None, deterministic=False,
@@ -95,10 +102,20 @@ class Runner(BaseRunner):
             episode_reward = 0
             self.current_timestep = 0
 
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.start_episode(worker_id=self.id)
+
             # time step (within episode) loop
             while True:
+                if profiler is not None:
+                    phase_start = time.time()
+
                 action = self.agent.act(states=state, deterministic=deterministic)
 
+                if profiler is not None:
+                    phase_start = profiler.record(phase='act', start=phase_start, worker_id=self.id)
+
                 reward = 0
                 for repeat in xrange(self.repeat_actions):
                     state, terminal, step_reward = self.environment.execute(actions=action)
@@ -109,8 +126,16 @@ class Runner(BaseRunner):
                 if max_episode_timesteps is not None and self.current_timestep >= max_episode_timesteps:
                     terminal = True
 
+                if profiler is not None:
+                    phase_start = profiler.record(phase='execute', start=phase_start, worker_id=self.id)
+                    num_updates = self.agent.model.num_updates
+
                 self.agent.observe(terminal=terminal, reward=reward)
 
+                if profiler is not None:
+                    updated = (self.agent.model.num_updates != num_updates)
+                    profiler.record(phase=('update' if updated else 'observe'), start=phase_start, worker_id=self.id)
+
                 self.global_timestep += 1
                 self.current_timestep += 1
                 episode_reward += reward
@@ -120,12 +145,31 @@ class Runner(BaseRunner):
 
             # Update our episode stats.
             time_passed = time.time() - episode_start_time
-            self.episode_rewards.append(episode_reward)
-            self.episode_timesteps.append(self.current_timestep)
-            self.episode_times.append(time_passed)
+            self.statistics.add_episode(
+                reward=episode_reward,
+                timesteps=self.current_timestep,
+                time=time_passed,
+                worker_id=self.id
+            )
 
             self.global_episode += 1
 
+            if profiler is not None:
+                profiler.finish_episode(
+                    episode=self.global_episode,
+                    timesteps=self.current_timestep,
+                    worker_id=self.id,
+                    summarizer=self.agent.model.summarizer,
+                    step=self.global_timestep
+                )
+
+            if self.evaluator is not None:
+                self.evaluator.episode_finished(
+                    agent=self.agent,
+                    episode=self.global_episode,
+                    timestep=self.global_timestep
+                )
+
             # Check, whether we should stop this run.
             if episode_finished is not None:
                 # deprecated way (passing in only runner object):
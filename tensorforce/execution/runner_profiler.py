@@ -0,0 +1,141 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import csv
+import json
+import threading
+import time
+
+import tensorflow as tf
+
+
+class RunnerProfiler(object):
+    """
+    Low-overhead instrumentation of the runner loop. Splits the time per step into the phases  
+    'act', 'execute', 'observe' and 'update' (observe calls which triggered a model update), and  
+    reports steps/sec and updates/sec per episode. Reports can be written to TensorBoard via the  
+    model's summarizer and to a CSV or JSON lines file.
+    """
+
+    phases = ('act', 'execute', 'observe', 'update')
+
+    def __init__(self, path=None):
+        """
+        Initializes a runner profiler.
+
+        Args:
+            path (str): Optional file to append episode reports to, as CSV if the path ends with '.csv',
+                otherwise as JSON lines.
+        """
+        self.path = path
+        self.fields = ['worker', 'episode', 'timesteps', 'updates', 'time', 'steps_per_sec', 'updates_per_sec'] + \
+            [phase + '_time' for phase in self.phases]
+
+        self.file = None
+        self.csv_writer = None
+        if self.path is not None:
+            self.file = open(self.path, 'a')
+            if self.path.endswith('.csv'):
+                self.csv_writer = csv.DictWriter(self.file, fieldnames=self.fields)
+                if self.file.tell() == 0:
+                    self.csv_writer.writeheader()
+
+        # Per-worker phase times and update counts of the current episode, only modified by their worker.
+        self.timings = dict()
+        self.updates = dict()
+        self.episode_start_times = dict()
+
+        self.lock = threading.Lock()
+        self.last_report = None
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def start_episode(self, worker_id=0):
+        """
+        Resets the phase times of the given worker at the start of an episode.
+        """
+        self.timings[worker_id] = dict.fromkeys(self.phases, 0.0)
+        self.updates[worker_id] = 0
+        self.episode_start_times[worker_id] = time.time()
+
+    def record(self, phase, start, worker_id=0):
+        """
+        Adds the time elapsed since start to the given phase.
+
+        Args:
+            phase (str): One of 'act', 'execute', 'observe', 'update'.
+            start (float): Start time of the phase.
+            worker_id (int): ID of the recording worker.
+
+        Returns:
+            The current time, to be used as start of the next phase.
+        """
+        now = time.time()
+        self.timings[worker_id][phase] += now - start
+        if phase == 'update':
+            self.updates[worker_id] += 1
+        return now
+
+    def finish_episode(self, episode, timesteps, worker_id=0, summarizer=None, step=None):
+        """
+        Creates the report of the given worker's episode and exports it.
+
+        Args:
+            episode (int): Global episode number.
+            timesteps (int): Number of timesteps of the episode.
+            worker_id (int): ID of the reporting worker.
+            summarizer: Optional TensorFlow summary writer of the agent's model.
+            step (int): Global step for the TensorBoard summaries.
+
+        Returns:
+            The report as dict.
+        """
+        duration = max(time.time() - self.episode_start_times[worker_id], 1e-9)
+        report = dict(
+            worker=worker_id,
+            episode=episode,
+            timesteps=timesteps,
+            updates=self.updates[worker_id],
+            time=duration,
+            steps_per_sec=(timesteps / duration),
+            updates_per_sec=(self.updates[worker_id] / duration)
+        )
+        for phase in self.phases:
+            report[phase + '_time'] = self.timings[worker_id][phase]
+
+        with self.lock:
+            self.last_report = report
+
+            if self.csv_writer is not None:
+                self.csv_writer.writerow(report)
+            elif self.file is not None:
+                self.file.write(json.dumps(report) + '\n')
+
+            if summarizer is not None:
+                summary = tf.Summary(value=[
+                    tf.Summary.Value(tag=('runner/' + field), simple_value=float(report[field]))
+                    for field in self.fields[3:]
+                ])
+                summarizer.add_summary(summary=summary, global_step=step)
+
+        return report
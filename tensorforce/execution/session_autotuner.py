@@ -0,0 +1,205 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import multiprocessing
+import os
+
+from six.moves import queue as Queue
+
+from tensorforce import TensorForceError
+from tensorforce.execution.runner import Runner
+
+
+class SessionAutotuner(object):
+    """
+    Benchmarks the act and update throughput of an agent specification for different session
+    thread pool sizes, and recommends the configuration with the fewest threads whose time per
+    timestep is within a tolerance of the fastest one. The recommendation is meant for the
+    `session_config` of the agent's execution spec, so that several agents packed on one host do
+    not oversubscribe its cores.
+    """
+
+    def __init__(
+        self,
+        agent,
+        environment,
+        network=None,
+        intra_op_threads=None,
+        inter_op_threads=(1, 2),
+        timesteps=1000,
+        warmup_timesteps=100,
+        tolerance=0.05
+    ):
+        """
+        Initializes a session autotuner.
+
+        Args:
+            agent (spec): Agent specification, as for `Agent.from_spec`.
+            environment (callable): Function returning a new Environment object, called once per
+                configuration since each configuration is benchmarked in a separate process, for
+                instance creating the training environment or a `MinimalTest` with the same states
+                and actions. An Environment object is also accepted and used in every process.
+            network (spec): Network specification of the agent.
+            intra_op_threads (tuple): Candidate intra-op thread pool sizes, default powers of two up
+                to the number of CPUs.
+            inter_op_threads (tuple): Candidate inter-op thread pool sizes.
+            timesteps (int): Number of timed timesteps per configuration.
+            warmup_timesteps (int): Number of untimed timesteps per configuration.
+            tolerance (float): Relative slowdown accepted in favor of fewer threads.
+        """
+        self.agent_spec = agent
+        self.environment = environment
+        self.network_spec = network
+
+        if intra_op_threads is None:
+            num_cpus = multiprocessing.cpu_count()
+            intra_op_threads = [1]
+            while intra_op_threads[-1] * 2 <= num_cpus:
+                intra_op_threads.append(intra_op_threads[-1] * 2)
+        self.intra_op_threads = tuple(intra_op_threads)
+        self.inter_op_threads = tuple(inter_op_threads)
+        if len(self.intra_op_threads) == 0 or len(self.inter_op_threads) == 0:
+            raise TensorForceError("Session autotuner requires at least one candidate thread count.")
+
+        self.timesteps = timesteps
+        self.warmup_timesteps = warmup_timesteps
+        self.tolerance = tolerance
+
+    def tune(self):
+        """
+        Benchmarks all candidate configurations.
+
+        Returns:
+            The recommended session config as dict, and the list of benchmark result dicts with
+            keys 'session_config', 'process' (id of the benchmark process), 'act_throughput'
+            (timesteps/sec), 'update_throughput' (updates/sec), 'updates' and 'time_per_timestep'
+            (sec, act plus observe and update).
+        """
+        results = list()
+        for intra_op_threads in self.intra_op_threads:
+            for inter_op_threads in self.inter_op_threads:
+                session_config = dict(
+                    intra_op_parallelism_threads=intra_op_threads,
+                    inter_op_parallelism_threads=inter_op_threads
+                )
+                results.append(self.benchmark(session_config=session_config))
+
+        fastest = min(result['time_per_timestep'] for result in results)
+        acceptable = [
+            result for result in results if result['time_per_timestep'] <= fastest * (1.0 + self.tolerance)
+        ]
+        recommended = min(acceptable, key=(
+            lambda result: (sum(result['session_config'].values()), result['time_per_timestep'])
+        ))
+
+        return dict(recommended['session_config']), results
+
+    def benchmark(self, session_config):
+        """
+        Benchmarks the agent for one session configuration, in a fresh process since the first
+        session of a process fixes the thread pool sizes for all subsequent sessions.
+        """
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=self._benchmark_process, args=(session_config, queue))
+        process.start()
+
+        try:
+            while True:
+                try:
+                    message = queue.get(timeout=1.0)
+                    break
+                except Queue.Empty:
+                    # The message is sent last, hence a process which exited successfully has sent it
+                    if not process.is_alive() and process.exitcode != 0:
+                        raise TensorForceError(
+                            "Benchmark process failed for session config {}.".format(session_config)
+                        )
+        finally:
+            process.join()
+
+        if message[0] == 'error':
+            raise TensorForceError("Benchmark failed for session config {}: {}".format(session_config, message[1]))
+        return message[1]
+
+    def _benchmark_process(self, session_config, queue):
+        """
+        The target function for a benchmark process, runs the agent and sends back the result dict,
+        including the session config the agent's session was actually created with and the process
+        id, or an error message.
+        """
+        from tensorforce.agents import Agent
+
+        try:
+            if callable(self.environment):
+                environment = self.environment()
+            else:
+                environment = self.environment
+            agent_spec = dict(self.agent_spec)
+            agent_spec['execution'] = dict(agent_spec.get('execution') or (), session_config=session_config)
+            agent = Agent.from_spec(
+                spec=agent_spec,
+                kwargs=dict(
+                    states=environment.states,
+                    actions=environment.actions,
+                    network=self.network_spec
+                )
+            )
+            runner = Runner(agent=agent, environment=environment, profile=True)
+
+            # Untimed warmup, e.g. for memory allocation
+            runner.run(num_timesteps=self.warmup_timesteps)
+
+            totals = dict(timesteps=0, updates=0, act_time=0.0, observe_time=0.0, update_time=0.0)
+
+            def episode_finished(r, id_):
+                report = r.profiler.last_report
+                for key in totals:
+                    totals[key] += report[key]
+                return True
+
+            runner.run(num_timesteps=self.timesteps, episode_finished=episode_finished)
+            runner.profiler.close()
+            if callable(self.environment):
+                runner.close()
+            else:
+                # The given environment object is not owned by the autotuner
+                agent.close()
+
+            # Only finished episodes are profiled, a configuration without any would seem fastest
+            if totals['timesteps'] == 0:
+                raise TensorForceError(
+                    "No episode finished within {} timed timesteps, increase timesteps.".format(self.timesteps)
+                )
+
+            agent_time = totals['act_time'] + totals['observe_time'] + totals['update_time']
+            queue.put(('result', dict(
+                session_config=dict(
+                    intra_op_parallelism_threads=agent.model.session_config.intra_op_parallelism_threads,
+                    inter_op_parallelism_threads=agent.model.session_config.inter_op_parallelism_threads
+                ),
+                process=os.getpid(),
+                act_throughput=(totals['timesteps'] / max(totals['act_time'], 1e-9)),
+                update_throughput=(totals['updates'] / max(totals['update_time'], 1e-9)),
+                updates=totals['updates'],
+                time_per_timestep=(agent_time / totals['timesteps'])
+            )))
+
+        except Exception as exception:
+            queue.put(('error', str(exception)))
@@ -0,0 +1,342 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from inspect import getargspec
+import multiprocessing
+from multiprocessing.connection import Listener
+import threading
+import time
+
+import numpy as np
+from six.moves import queue as Queue
+
+from tensorforce import TensorForceError
+from tensorforce.execution.base_runner import BaseRunner
+from tensorforce.execution.runner import Runner
+
+
+class ReplicaCoordinator(object):
+    """
+    Local coordinator for synchronous data-parallel training, replacing the parameter server.
+    Every worker replica sends its proposed updates (see `SynchronousReplicas` optimizer), and the
+    coordinator replies with their average once all active replicas have contributed (allreduce).
+    Workers which finished or disconnected drop out of all subsequent exchanges.
+    """
+
+    def __init__(self, num_workers, address=('127.0.0.1', 0), authkey=None):
+        """
+        Initializes a replica coordinator listening on the given address.
+
+        Args:
+            num_workers (int): Number of worker replicas initially taking part in every exchange.
+            address (tuple): Address to listen on, port 0 picks a free port.
+            authkey (bytes): Authentication key required from connecting workers.
+        """
+        self.num_workers = num_workers
+        self.listener = Listener(address=address, authkey=authkey)
+        self.address = self.listener.address
+
+        self.condition = threading.Condition()
+        # Task indices of workers still taking part in exchanges.
+        self.active = set(range(num_workers))
+        # Per key: dict of contributed values by task index, pending operation, round counter and last result.
+        self.contributions = dict()
+        self.operations = dict()
+        self.rounds = dict()
+        self.results = dict()
+        self.closed = False
+
+        self.connections = list()
+        self.thread = None
+
+    def start(self):
+        """
+        Starts accepting worker connections in a background thread.
+        """
+        self.thread = threading.Thread(target=self._accept)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        """
+        Stops the coordinator and closes all worker connections.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.listener.close()
+        for connection in self.connections:
+            connection.close()
+
+    def remove_worker(self, task_index):
+        """
+        Removes a worker from all subsequent exchanges, and completes pending exchanges which only
+        waited for this worker.
+
+        Args:
+            task_index (int): Index of the finished worker.
+        """
+        with self.condition:
+            self.active.discard(task_index)
+            for key in list(self.contributions):
+                self._complete(key=key)
+
+    def _accept(self):
+        while not self.closed:
+            try:
+                connection = self.listener.accept()
+            except (EOFError, OSError):
+                break
+            self.connections.append(connection)
+            thread = threading.Thread(target=self._serve, args=(connection,))
+            thread.daemon = True
+            thread.start()
+
+    def _serve(self, connection):
+        task_index = None
+        try:
+            while True:
+                key, operation, task_index, values = connection.recv()
+                values = self.exchange(key=key, operation=operation, task_index=task_index, values=values)
+                if values is None:
+                    break
+                connection.send(values)
+        except (EOFError, OSError):
+            # A worker replica stopped, the remaining workers continue without it.
+            if task_index is not None:
+                self.remove_worker(task_index=task_index)
+        connection.close()
+
+    def _complete(self, key):
+        # Requires the condition lock. Completes the current round of an exchange once all active
+        # workers have contributed.
+        contributions = self.contributions[key]
+        if len(contributions) == 0 or not self.active.issubset(contributions):
+            return
+
+        operation = self.operations[key]
+        if operation == 'broadcast':
+            # Values of the first worker, or of the first still active worker
+            if len(self.active) > 0:
+                result = contributions[min(self.active)]
+            else:
+                result = contributions[min(contributions)]
+        elif operation == 'average':
+            result = [
+                np.mean([contributions[n][k] for n in sorted(contributions)], axis=0)
+                for k in range(len(contributions[min(contributions)]))
+            ]
+        else:
+            raise TensorForceError("Invalid exchange operation: {}.".format(operation))
+        self.results[key] = result
+        self.contributions[key] = dict()
+        self.rounds[key] += 1
+        self.condition.notify_all()
+
+    def exchange(self, key, operation, task_index, values):
+        """
+        Contributes the values of one worker and blocks until all active workers have contributed.
+
+        Args:
+            key (str): Identifier of the exchange, shared by the corresponding optimizers of all workers.
+            operation (str): Either 'broadcast' (values of the first active worker) or 'average' (mean over
+                contributing workers).
+            task_index (int): Index of the contributing worker.
+            values (list): List of NumPy arrays.
+
+        Returns:
+            List of NumPy arrays, or None if the coordinator was closed.
+        """
+        if operation not in ('broadcast', 'average'):
+            raise TensorForceError("Invalid exchange operation: {}.".format(operation))
+
+        with self.condition:
+            contributions = self.contributions.setdefault(key, dict())
+            current_round = self.rounds.setdefault(key, 0)
+            if task_index in contributions:
+                raise TensorForceError("Worker {} contributed twice to exchange {}.".format(task_index, key))
+            contributions[task_index] = values
+            self.operations[key] = operation
+
+            self._complete(key=key)
+
+            while self.rounds[key] == current_round and not self.closed:
+                self.condition.wait()
+
+            if self.rounds[key] == current_round:
+                return None
+            return self.results[key]
+
+
+class SynchronousRunner(BaseRunner):
+    """
+    Runner for synchronous data-parallel training with multiple local worker processes. Each worker
+    runs its own agent and environment, and the agents' updates are averaged via a `ReplicaCoordinator`
+    after every optimization step. Termination criteria are applied per worker, and a worker which
+    finished drops out of the update averaging of the remaining workers.
+    """
+
+    def __init__(self, agent, environment, num_workers, repeat_actions=1, history=None, authkey=None):
+        """
+        Initialize a SynchronousRunner object.
+
+        Args:
+            agent (dict): Agent specification (including network), see `Agent.from_spec`. Each worker creates
+                its own agent with an additional `distributed` specification.
+            environment (callable): Function returning a new Environment object, called once per worker.
+            num_workers (int): Number of worker processes.
+            authkey (bytes): Authentication key of the replica coordinator (default: random).
+        """
+        super(SynchronousRunner, self).__init__(agent, environment, repeat_actions, history)
+
+        if num_workers < 1:
+            raise TensorForceError("Invalid number of workers: {}.".format(num_workers))
+        self.num_workers = num_workers
+        self.authkey = authkey if authkey is not None else bytes(multiprocessing.current_process().authkey)
+
+        # Stop-condition flag shared with all worker processes.
+        self.should_stop = None
+
+    def close(self):
+        # Agents and environments are closed by their worker processes.
+        pass
+
+    def run(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None, deterministic=False,
+            episode_finished=None, summary_report=None, summary_interval=None):
+        """
+        Executes this runner by starting all worker processes and collecting their episode statistics.
+
+        Args:
+            num_timesteps (int): Max. number of time steps per worker.
+            num_episodes (int): Max. number of episodes per worker.
+            episode_finished (callable): Function called after each episode of a worker, taking this runner and
+                the worker index. Returning False stops all workers.
+        """
+        if summary_report is not None or summary_interval is not None:
+            raise TensorForceError("SynchronousRunner does not support summary_report, use episode_finished.")
+        if episode_finished is not None and len(getargspec(episode_finished).args) == 1:
+            raise TensorForceError("SynchronousRunner requires episode_finished to take runner and worker index.")
+
+        self.reset()
+        self.global_episode = 0
+        self.global_timestep = 0
+
+        coordinator = ReplicaCoordinator(num_workers=self.num_workers, authkey=self.authkey)
+        coordinator.start()
+
+        self.should_stop = multiprocessing.Event()
+        queue = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=self._run_worker,
+                args=(task_index, coordinator.address, queue),
+                kwargs=dict(
+                    num_timesteps=num_timesteps,
+                    num_episodes=num_episodes,
+                    max_episode_timesteps=max_episode_timesteps,
+                    deterministic=deterministic
+                )
+            ) for task_index in range(self.num_workers)
+        ]
+
+        self.start_time = time.time()
+        for worker in workers:
+            worker.start()
+
+        try:
+            num_running = self.num_workers
+            while num_running > 0:
+                message = queue.get()
+                if message[0] == 'episode':
+                    _, task_index, episode_reward, episode_timestep, episode_time = message
+                    self.statistics.add_episode(reward=episode_reward, timesteps=episode_timestep, time=episode_time)
+                    self.global_episode += 1
+                    self.global_timestep += episode_timestep
+
+                    if episode_finished is not None and not episode_finished(self, task_index):
+                        self.should_stop.set()
+
+                elif message[0] == 'error':
+                    self.should_stop.set()
+                    raise TensorForceError("Worker {} failed: {}".format(message[1], message[2]))
+
+                else:
+                    coordinator.remove_worker(task_index=message[1])
+                    num_running -= 1
+
+        except KeyboardInterrupt:
+            print('Keyboard interrupt, sending stop command to workers')
+            self.should_stop.set()
+
+        finally:
+            coordinator.close()
+            # Worker processes only terminate once their queued messages have been consumed.
+            while any(worker.is_alive() for worker in workers):
+                try:
+                    queue.get(timeout=0.1)
+                except Queue.Empty:
+                    pass
+            for worker in workers:
+                worker.join()
+
+    def _run_worker(self, task_index, address, queue, num_timesteps, num_episodes, max_episode_timesteps,
+                    deterministic):
+        """
+        The target function for a worker process, runs an agent and environment until its termination
+        criteria are met or all workers are signaled to stop.
+        """
+        from tensorforce.agents import Agent
+
+        try:
+            environment = self.environment()
+            agent_spec = dict(self.agent)
+            agent_spec['distributed'] = dict(
+                synchronous=True,
+                task_index=task_index,
+                address=address,
+                authkey=self.authkey
+            )
+            agent = Agent.from_spec(
+                spec=agent_spec,
+                kwargs=dict(states=environment.states, actions=environment.actions)
+            )
+            runner = Runner(agent=agent, environment=environment, repeat_actions=self.repeat_actions, id_=task_index)
+
+            def worker_episode_finished(r, id_):
+                queue.put((
+                    'episode', id_, r.episode_rewards[-1], r.episode_timesteps[-1], r.episode_times[-1]
+                ))
+                return not self.should_stop.is_set()
+
+            runner.run(
+                num_timesteps=num_timesteps,
+                num_episodes=num_episodes,
+                max_episode_timesteps=max_episode_timesteps,
+                deterministic=deterministic,
+                episode_finished=worker_episode_finished
+            )
+            runner.close()
+
+        except Exception as exception:
+            # Losing the coordinator after a stop request is the expected way for other workers to end.
+            if not self.should_stop.is_set():
+                queue.put(('error', task_index, str(exception)))
+
+        queue.put(('done', task_index))
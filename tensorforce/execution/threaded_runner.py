@@ -26,6 +26,7 @@ import warnings
 
 from tensorforce import TensorForceError
 from tensorforce.execution.base_runner import BaseRunner
+from tensorforce.execution.checkpointer import Checkpointer
 from tensorforce.agents.learning_agent import LearningAgent
 from tensorforce.agents import agents as AgentsDictionary
 
@@ -36,7 +37,8 @@ class ThreadedRunner(BaseRunner):
     """
 
     def __init__(self, agent, environment, repeat_actions=1, save_path=None, save_episodes=None, save_frequency=None,
-                 save_frequency_unit=None, agents=None, environments=None):
+                 save_frequency_unit=None, agents=None, environments=None, profile=False, profile_path=None,
+                 evaluator=None, statistics=None, save_background=False):
         """
         Initialize a ThreadedRunner object.
 
@@ -45,6 +47,8 @@ class ThreadedRunner(BaseRunner):
             save_episodes (int): Deprecated: Every how many (global) episodes do we save the shared model?
             save_frequency (int): The frequency with which to save the model (could be sec, steps, or episodes).
             save_frequency_unit (str): "s" (sec), "t" (timesteps), "e" (episodes)
+            save_background (bool): Whether to save non-blocking snapshots via a Checkpointer, written by a
+                background thread to '<save_path>-<timestep>.npz', instead of saving via the TensorFlow saver.
             agents (List[Agent]): Deprecated: List of Agent objects. Use `agent`, instead.
             environments (List[Environment]): Deprecated: List of Environment objects. Use `environment`, instead.
         """
@@ -56,7 +60,8 @@ class ThreadedRunner(BaseRunner):
             warnings.warn("WARNING: `environments` parameter is deprecated, use `environments` instead.",
                           category=DeprecationWarning)
             environment = environments
-        super(ThreadedRunner, self).__init__(agent, environment, repeat_actions)
+        super(ThreadedRunner, self).__init__(agent, environment, repeat_actions, profile=profile,
+                                             profile_path=profile_path, evaluator=evaluator, statistics=statistics)
 
         if len(agent) != len(environment):
             raise TensorForceError("Each agent must have its own environment. Got {a} agents and {e} environments.".
@@ -72,9 +77,9 @@ class ThreadedRunner(BaseRunner):
         else:
             self.save_frequency = save_frequency
             self.save_frequency_unit = save_frequency_unit
+        self.save_background = save_background
+        self.checkpointer = None
 
-        # Initialize stats for parallel runs.
-        self.episode_list_lock = threading.Lock()
         # Stop-condition flag that each worker abides to (aborts if True).
         self.should_stop = False
         # Global time counter (sec).
@@ -84,6 +89,11 @@ class ThreadedRunner(BaseRunner):
         self.agent[0].close()  # only close first agent as we just have one shared model
         for e in self.environment:
             e.close()
+        self.statistics.flush()
+        if self.profiler is not None:
+            self.profiler.close()
+        if self.evaluator is not None:
+            self.evaluator.close()
 
     def run(
         self,
@@ -124,6 +134,12 @@ class ThreadedRunner(BaseRunner):
                           category=DeprecationWarning)
 
         self.reset()
+        # Create the per-thread statistics before the threads start recording.
+        for t in range(len(self.agent)):
+            self.statistics.worker(worker_id=t)
+
+        if self.save_path and self.save_background:
+            self.checkpointer = Checkpointer(model=self.agent[0].model, path=self.save_path)
 
         # Reset counts/stop-condition for this run.
         self.global_episode = 0
@@ -166,7 +182,11 @@ class ThreadedRunner(BaseRunner):
                         do_save = False
 
                     if do_save:
-                        self.agent[0].save_model(self.save_path)
+                        if self.checkpointer is not None:
+                            # Skipped if the previous snapshot is still being written.
+                            self.checkpointer.save()
+                        else:
+                            self.agent[0].save_model(self.save_path)
                         # Make sure next save is later than right now.
                         while next_save < current:
                             next_save += self.save_frequency
@@ -179,6 +199,9 @@ class ThreadedRunner(BaseRunner):
 
         # Join threads.
         [t.join() for t in threads]
+        if self.checkpointer is not None:
+            self.checkpointer.close()
+            self.checkpointer = None
         print('All threads stopped')
 
     def _run_single(self, thread_id, agent, environment, deterministic=False,
@@ -210,11 +233,22 @@ class ThreadedRunner(BaseRunner):
             self.global_timestep, self.global_episode = agent.timestep, agent.episode
             episode_reward = 0
 
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.start_episode(worker_id=thread_id)
+
             # Time step (within episode) loop
             time_step = 0
             time_start = time.time()
             while True:
+                if profiler is not None:
+                    phase_start = time.time()
+
                 action = agent.act(states=state, deterministic=deterministic)
+
+                if profiler is not None:
+                    phase_start = profiler.record(phase='act', start=phase_start, worker_id=thread_id)
+
                 reward = 0
                 for repeat in xrange(self.repeat_actions):
                     state, terminal, step_reward = environment.execute(actions=action)
@@ -222,8 +256,17 @@ class ThreadedRunner(BaseRunner):
                     if terminal:
                         break
 
+                if profiler is not None:
+                    phase_start = profiler.record(phase='execute', start=phase_start, worker_id=thread_id)
+                    num_updates = agent.model.num_updates
+
                 agent.observe(reward=reward, terminal=terminal)
 
+                if profiler is not None:
+                    # The model is shared, so other threads' updates may be attributed to this one.
+                    updated = (agent.model.num_updates != num_updates)
+                    profiler.record(phase=('update' if updated else 'observe'), start=phase_start, worker_id=thread_id)
+
                 time_step += 1
                 episode_reward += reward
 
@@ -236,12 +279,29 @@ class ThreadedRunner(BaseRunner):
 
             self.global_timestep += time_step
 
-            # Avoid race condition where order in episode_rewards won't match order in episode_timesteps.
-            self.episode_list_lock.acquire()
-            self.episode_rewards.append(episode_reward)
-            self.episode_timesteps.append(time_step)
-            self.episode_times.append(time.time() - time_start)
-            self.episode_list_lock.release()
+            # Each thread records into its own statistics, merged when read.
+            self.statistics.add_episode(
+                reward=episode_reward,
+                timesteps=time_step,
+                time=(time.time() - time_start),
+                worker_id=thread_id
+            )
+
+            if profiler is not None:
+                profiler.finish_episode(
+                    episode=self.global_episode,
+                    timesteps=time_step,
+                    worker_id=thread_id,
+                    summarizer=agent.model.summarizer,
+                    step=self.global_timestep
+                )
+
+            if self.evaluator is not None:
+                self.evaluator.episode_finished(
+                    agent=agent,
+                    episode=self.global_episode,
+                    timestep=self.global_timestep
+                )
 
             if episode_finished is not None:
                 # old way of calling episode_finished
@@ -21,7 +21,8 @@ import tensorflow as tf
 
 from tensorforce import util
 from tensorforce.core.networks import Network
-from tensorforce.core.distributions import Distribution, Bernoulli, Categorical, Gaussian, Beta
+from tensorforce.core.distributions import Distribution, Bernoulli, Categorical, Gaussian, Beta, \
+    HierarchicalCategorical
 from tensorforce.models import MemoryModel
 
 
@@ -51,10 +52,14 @@ class DistributionModel(MemoryModel):
         network,
         distributions,
         entropy_regularization,
-        requires_deterministic
+        requires_deterministic,
+        fused_parameterization=False,
+        execution=None
     ):
         self.network_spec = network
         self.distributions_spec = distributions
+        # Compute the parameters of all distributions with one fused projection
+        self.fused_parameterization = fused_parameterization
 
         # Entropy regularization
         assert entropy_regularization is None or entropy_regularization >= 0.0
@@ -83,7 +88,8 @@ class DistributionModel(MemoryModel):
             update_mode=update_mode,
             memory=memory,
             optimizer=optimizer,
-            discount=discount
+            discount=discount,
+            execution=execution
         )
 
     def initialize(self, custom_getter):
@@ -159,25 +165,81 @@ class DistributionModel(MemoryModel):
             return_internals=True
         )
 
-        actions = dict()
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
+        actions = self.sample_distributions(
+            distributions=self.distributions,
+            distr_params=distr_params,
+            deterministic=tf.logical_or(x=deterministic, y=self.requires_deterministic)
+        )
+
+        log_probs = list()
         for name, distribution in self.distributions.items():
-            distr_params = distribution.parameterize(x=embedding)
-            actions[name] = distribution.sample(
-                distr_params=distr_params,
-                deterministic=tf.logical_or(x=deterministic, y=self.requires_deterministic)
-            )
+            log_prob = distribution.log_probability(distr_params=distr_params[name], action=actions[name])
+            collapsed_size = util.prod(util.shape(log_prob)[1:])
+            log_probs.append(tf.reshape(tensor=log_prob, shape=(-1, collapsed_size)))
             # Prefix named variable with "name_" if more than 1 distribution
             if len(self.distributions.items()) > 1:
                 name_prefix = name + "_"
             else:
                 name_prefix = ""
-            # parameterize() returns list as [logits, probabilities, state_value]
-            self.network.set_named_tensor(name_prefix + "logits", distr_params[0])
-            self.network.set_named_tensor(name_prefix + "probabilities", distr_params[1])
-            self.network.set_named_tensor(name_prefix + "state_value", distr_params[2])
+            if isinstance(distribution, HierarchicalCategorical):
+                # parameterize() returns list as [input, cluster logits, cluster probabilities]
+                self.network.set_named_tensor(name_prefix + "cluster_logits", distr_params[name][1])
+                self.network.set_named_tensor(name_prefix + "cluster_probabilities", distr_params[name][2])
+            else:
+                # parameterize() returns list as [logits, probabilities, state_value]
+                self.network.set_named_tensor(name_prefix + "logits", distr_params[name][0])
+                self.network.set_named_tensor(name_prefix + "probabilities", distr_params[name][1])
+                self.network.set_named_tensor(name_prefix + "state_value", distr_params[name][2])
+
+        # Joint log probability of the sampled actions (before exploration), e.g. for off-policy correction
+        log_prob = tf.reduce_sum(input_tensor=tf.concat(values=log_probs, axis=1), axis=1)
+        self.network.set_named_tensor("log_probability", log_prob)
 
         return actions, internals
 
+    def parameterize_distributions(self, distributions, embedding):
+        """
+        Parameterizes the given distributions conditioned on the embedding, with one fused  
+        projection if fused parameterization is enabled (see `Distribution.fused_parameterize`).
+
+        Args:
+            distributions: Dict of distributions.
+            embedding: Embedding tensor.
+
+        Returns:
+            Dict of distribution parameter tuples.
+        """
+        if self.fused_parameterization:
+            return Distribution.fused_parameterize(distributions=distributions, x=embedding)
+        else:
+            return {name: distribution.parameterize(x=embedding) for name, distribution in distributions.items()}
+
+    def sample_distributions(self, distributions, distr_params, deterministic):
+        """
+        Samples actions from the given distributions, jointly for compatible distributions if  
+        fused parameterization is enabled (see `Distribution.joint_sample`).
+
+        Args:
+            distributions: Dict of distributions.
+            distr_params: Dict of distribution parameter tuples.
+            deterministic: Boolean tensor indicating whether to return the maximum likelihood actions.
+
+        Returns:
+            Dict of action tensors.
+        """
+        if self.fused_parameterization:
+            return Distribution.joint_sample(
+                distributions=distributions,
+                distr_params=distr_params,
+                deterministic=deterministic
+            )
+        else:
+            return {
+                name: distribution.sample(distr_params=distr_params[name], deterministic=deterministic)
+                for name, distribution in distributions.items()
+            }
+
     def tf_regularization_losses(self, states, internals, update):
         losses = super(DistributionModel, self).tf_regularization_losses(
             states=states,
@@ -200,9 +262,9 @@ class DistributionModel(MemoryModel):
         if self.entropy_regularization is not None and self.entropy_regularization > 0.0:
             entropies = list()
             embedding = self.network.apply(x=states, internals=internals, update=update)
+            distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
             for name, distribution in self.distributions.items():
-                distr_params = distribution.parameterize(x=embedding)
-                entropy = distribution.entropy(distr_params=distr_params)
+                entropy = distribution.entropy(distr_params=distr_params[name])
                 collapsed_size = util.prod(util.shape(entropy)[1:])
                 entropy = tf.reshape(tensor=entropy, shape=(-1, collapsed_size))
                 entropies.append(entropy)
@@ -218,12 +280,15 @@ class DistributionModel(MemoryModel):
 
     def tf_kl_divergence(self, states, internals, actions, terminal, reward, next_states, next_internals, update, reference=None):
         embedding = self.network.apply(x=states, internals=internals, update=update)
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
         kl_divergences = list()
 
         for name, distribution in self.distributions.items():
-            distr_params = distribution.parameterize(x=embedding)
-            fixed_distr_params = tuple(tf.stop_gradient(input=value) for value in distr_params)
-            kl_divergence = distribution.kl_divergence(distr_params1=fixed_distr_params, distr_params2=distr_params)
+            fixed_distr_params = tuple(tf.stop_gradient(input=value) for value in distr_params[name])
+            kl_divergence = distribution.kl_divergence(
+                distr_params1=fixed_distr_params,
+                distr_params2=distr_params[name]
+            )
             collapsed_size = util.prod(util.shape(kl_divergence)[1:])
             kl_divergence = tf.reshape(tensor=kl_divergence, shape=(-1, collapsed_size))
             kl_divergences.append(kl_divergence)
@@ -121,7 +121,9 @@ class DPGTargetModel(DistributionModel):
         critic_network,
         critic_optimizer,
         target_sync_frequency,
-        target_update_weight
+        target_update_weight,
+        fused_parameterization=False,
+        execution=None
     ):
 
         self.critic_network_spec = critic_network
@@ -159,12 +161,18 @@ class DPGTargetModel(DistributionModel):
             network=network,
             distributions=distributions,
             entropy_regularization=entropy_regularization,
-            requires_deterministic=True
+            requires_deterministic=True,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
         assert self.memory_spec["include_next_states"]
         assert self.requires_deterministic == True
 
+    def as_synchronous_model(self):
+        super(DPGTargetModel, self).as_synchronous_model()
+        self.critic_optimizer_spec = self.synchronous_optimizer(optimizer=self.critic_optimizer_spec)
+
     def initialize(self, custom_getter):
         super(DPGTargetModel, self).initialize(custom_getter)
 
@@ -221,13 +229,12 @@ class DPGTargetModel(DistributionModel):
             return_internals=True
         )
 
-        actions = dict()
-        for name, distribution in self.target_distributions.items():
-            distr_params = distribution.parameterize(x=embedding)
-            actions[name] = distribution.sample(
-                distr_params=distr_params,
-                deterministic=tf.logical_or(x=deterministic, y=self.requires_deterministic)
-            )
+        distr_params = self.parameterize_distributions(distributions=self.target_distributions, embedding=embedding)
+        actions = self.sample_distributions(
+            distributions=self.target_distributions,
+            distr_params=distr_params,
+            deterministic=tf.logical_or(x=deterministic, y=self.requires_deterministic)
+        )
 
         return actions, internals
 
@@ -239,6 +246,24 @@ class DPGTargetModel(DistributionModel):
         q_value = self.target_critic.apply(dict(states=states, actions=actions), internals=internals, update=update)
         return reward + (1. - tf.cast(terminal, dtype=tf.float32)) * self.discount * q_value
 
+    def optimizer_arguments(self, states, internals, actions, terminal, reward, next_states, next_internals):
+        arguments = super(DPGTargetModel, self).optimizer_arguments(
+            states=states,
+            internals=internals,
+            actions=actions,
+            terminal=terminal,
+            reward=reward,
+            next_states=next_states,
+            next_internals=next_internals
+        )
+        if self.distributed_spec is not None and self.distributed_spec.get('synchronous'):
+            # Replicas start with the target actor of the first worker as well
+            arguments['broadcast_variables'] = self.target_network.get_variables() + [
+                variable for name in sorted(self.target_distributions)
+                for variable in self.target_distributions[name].get_variables(include_nontrainable=False)
+            ]
+        return arguments
+
     def tf_optimization(self, states, internals, actions, terminal, reward, next_states=None, next_internals=None):
         update = tf.constant(value=True)
 
@@ -261,14 +286,19 @@ class DPGTargetModel(DistributionModel):
         def fn_critic_loss(predicted_q, real_q):
             return tf.reduce_mean(tf.square(real_q - predicted_q))
 
-        critic_optimization = self.critic_optimizer.minimize(
+        critic_arguments = dict(
             time=self.timestep,
             variables=self.critic.get_variables(),
             arguments=dict(
                 predicted_q=predicted_q,
                 real_q=real_q
             ),
-            fn_loss=fn_critic_loss)
+            fn_loss=fn_critic_loss
+        )
+        if self.distributed_spec is not None and self.distributed_spec.get('synchronous'):
+            # Replicas start with the target critic of the first worker as well
+            critic_arguments['broadcast_variables'] = self.target_critic.get_variables()
+        critic_optimization = self.critic_optimizer.minimize(**critic_arguments)
 
         # Update actor
         predicted_actions, predicted_internals = self.fn_actions_and_internals(
@@ -296,17 +326,19 @@ class DPGTargetModel(DistributionModel):
             for variable in self.target_distributions[name].get_variables(include_nontrainable=False)
         ]
 
-        target_optimization = self.target_network_optimizer.minimize(
-            time=self.timestep,
-            variables=self.target_network.get_variables() + target_distributions_variables,
-            source_variables=self.network.get_variables() + network_distributions_variables
-        )
+        # Target networks synchronized with the updated networks
+        with tf.control_dependencies(control_inputs=(critic_optimization, optimization)):
+            target_optimization = self.target_network_optimizer.minimize(
+                time=self.timestep,
+                variables=self.target_network.get_variables() + target_distributions_variables,
+                source_variables=self.network.get_variables() + network_distributions_variables
+            )
 
-        target_critic_optimization = self.target_critic_optimizer.minimize(
-            time=self.timestep,
-            variables=self.target_critic.get_variables(),
-            source_variables=self.critic.get_variables()
-        )
+            target_critic_optimization = self.target_critic_optimizer.minimize(
+                time=self.timestep,
+                variables=self.target_critic.get_variables(),
+                source_variables=self.critic.get_variables()
+            )
 
         return tf.group(critic_optimization, optimization, target_optimization, target_critic_optimization)
 
@@ -47,7 +47,8 @@ class MemoryModel(Model):
         update_mode,
         memory,
         optimizer,
-        discount
+        discount,
+        execution=None
     ):
         """
         Memory model.
@@ -74,9 +75,21 @@ class MemoryModel(Model):
             memory (spec): Memory.
             optimizer (spec): Dict specifying the tf optimizer to use for tuning the model's trainable parameters.
             discount (float): The RL reward discount factor (gamma).
+            execution (spec): Dict specifying how the model's graph is executed, see `Model`.
         """
         self.update_mode = update_mode
         self.memory_spec = memory
+
+        # Gradient accumulation over successive updates, effective batch size is accumulation_steps
+        # times batch_size.
+        accumulation_steps = update_mode.get('accumulation_steps', 1)
+        assert isinstance(accumulation_steps, int) and accumulation_steps > 0
+        if accumulation_steps > 1:
+            optimizer = dict(
+                type='accumulated_step',
+                optimizer=optimizer,
+                num_steps=accumulation_steps
+            )
         self.optimizer_spec = optimizer
 
         # Discount
@@ -103,7 +116,8 @@ class MemoryModel(Model):
             variable_noise=variable_noise,
             states_preprocessing=states_preprocessing,
             actions_exploration=actions_exploration,
-            reward_preprocessing=reward_preprocessing
+            reward_preprocessing=reward_preprocessing,
+            execution=execution
         )
 
     def as_local_model(self):
@@ -113,6 +127,10 @@ class MemoryModel(Model):
             optimizer=self.optimizer_spec
         )
 
+    def as_synchronous_model(self):
+        super(MemoryModel, self).as_synchronous_model()
+        self.optimizer_spec = self.synchronous_optimizer(optimizer=self.optimizer_spec)
+
     def initialize(self, custom_getter):
         super(MemoryModel, self).initialize(custom_getter)
 
@@ -437,12 +455,28 @@ class MemoryModel(Model):
                 update=tf.constant(value=True)
             ),
             fn_reference=self.fn_reference,
-            fn_loss=self.fn_loss
+            fn_loss=self.fn_loss,
+            fn_offset_loss=self.offset_loss
         )
         if self.global_model is not None:
             arguments['global_variables'] = self.global_model.get_variables()
         return arguments
 
+    def offset_loss(self, variables, offsets, **kwargs):
+        """
+        Creates the TensorFlow operations for calculating the full loss of a batch as if the given  
+        offsets were added to the given variables, see `Model.offset_variables`.
+
+        Args:
+            variables: List of variables.
+            offsets: List of offset tensors of same length.
+            **kwargs: Arguments for fn_loss.
+
+        Returns:
+            Loss tensor.
+        """
+        return self.offset_variables(variables=variables, offsets=offsets, fn=self.fn_loss, **kwargs)
+
     def tf_optimization(self, states, internals, actions, terminal, reward, next_states=None, next_internals=None):
         """
         Creates the TensorFlow operations for performing an optimization update step based
@@ -535,11 +569,13 @@ class MemoryModel(Model):
                 tensors=batch
             )
 
-            optimization = tf.cond(
-                pred=optimize,
-                true_fn=(lambda: self.fn_optimization(**batch)),
-                false_fn=tf.no_op
-            )
+            def optimization_and_count():
+                with self.jit_scope():
+                    optimization = self.fn_optimization(**batch)
+                with tf.control_dependencies(control_inputs=(optimization,)):
+                    return tf.group(tf.assign_add(ref=self.update_count, value=1))
+
+            optimization = tf.cond(pred=optimize, true_fn=optimization_and_count, false_fn=tf.no_op)
 
         return optimization
 
@@ -602,6 +638,15 @@ class MemoryModel(Model):
 
         return model_variables
 
+    def get_snapshot_variables(self, include_memory=True):
+        snapshot_variables = super(MemoryModel, self).get_snapshot_variables(include_memory=include_memory)
+
+        if not include_memory:
+            memory_variables = self.memory.get_variables()
+            snapshot_variables = [variable for variable in snapshot_variables if variable not in memory_variables]
+
+        return snapshot_variables
+
     def get_summaries(self):
         model_summaries = super(MemoryModel, self).get_summaries()
         memory_summaries = self.memory.get_summaries()
@@ -51,8 +51,10 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+from contextlib import contextmanager
 from copy import deepcopy
 import os
+import warnings
 
 import numpy as np
 import tensorflow as tf
@@ -80,7 +82,8 @@ class Model(object):
         variable_noise,
         states_preprocessing,
         actions_exploration,
-        reward_preprocessing
+        reward_preprocessing,
+        execution=None
     ):
         """
         Model.
@@ -103,6 +106,9 @@ class Model(object):
                 "action outputs" (e.g. epsilon-greedy).
             reward_preprocessing (spec): Dict specifying whether and how to preprocess rewards coming
                 from the Environment (e.g. reward normalization).
+            execution (spec): Dict specifying how the model's graph is executed, 'jit' enables XLA JIT
+                compilation of the act and optimization subgraphs, 'session_config' is a TensorFlow
+                ConfigProto or dict of its fields (e.g. thread pool sizes) for the model's session.
         """
         # Network crated from network_spec in distribution_model.py
         # Needed for named_tensor access
@@ -129,6 +135,22 @@ class Model(object):
 
         self.distributed_spec = distributed
 
+        # Execution, XLA JIT compilation falls back to regular execution if not available
+        self.execution_spec = execution or dict()
+        self.jit = self.execution_spec.get('jit', False)
+        # JIT scope function rather than module, since the model is deep-copied for distributed execution
+        self.experimental_jit_scope = None
+        if self.jit:
+            try:
+                from tensorflow.contrib.compiler import jit
+                self.experimental_jit_scope = jit.experimental_jit_scope
+            except ImportError:
+                warnings.warn("XLA JIT compilation is not available in this TensorFlow installation.")
+                self.jit = False
+        self.session_config = self.execution_spec.get('session_config')
+        if isinstance(self.session_config, dict):
+            self.session_config = tf.ConfigProto(**self.session_config)
+
         # TensorFlow summaries
         if self.summarizer_spec is None:
             self.summary_labels = set()
@@ -159,6 +181,9 @@ class Model(object):
         self.registered_variables = None
         self.summaries = None
 
+        self.variable_offsets = None
+        self.applied_offsets = None
+
         self.timestep = None
         self.episode = None
         self.global_timestep = None
@@ -171,6 +196,7 @@ class Model(object):
         self.reward_input = None
         self.deterministic_input = None
         self.independent_input = None
+        self.reset_slots_input = None
         self.update_input = None
         self.internals_init = None
 
@@ -182,23 +208,44 @@ class Model(object):
         self.graph = None
         self.global_model = None
         self.scaffold = None
+        self.saver_variables = None
         self.saver_directory = None
         self.session = None
         self.monitored_session = None
         self.summary_writer = None
         self.summary_writer_hook = None
+        self.summarizer = None
 
         self.increment_episode = None
 
         self.actions_output = None
         self.internals_output = None
         self.timestep_output = None
+        self.episode_output = None
+        self.update_count_output = None
+        self.reset_slots_output = None
+
+        # Number of updates performed so far, as of the last call to observe.
+        self.num_updates = 0
 
         self.summary_configuration_op = None
 
         # Setup TensorFlow graph and session
         self.setup()
 
+    @contextmanager
+    def jit_scope(self):
+        """
+        Context in which the created operations are marked for XLA JIT compilation, if enabled via  
+        the execution spec. Marked operations without XLA kernel are not compiled and executed as  
+        usual.
+        """
+        if self.jit:
+            with self.experimental_jit_scope(compile_ops=True):
+                yield
+        else:
+            yield
+
     def setup(self):
         """
         Sets up the TensorFlow model graph and initializes (and enters) the TensorFlow session.
@@ -215,6 +262,14 @@ class Model(object):
             default_graph = self.graph.as_default()
             default_graph.__enter__()
             self.global_model = None
+        # Synchronous data-parallel setup (each worker process builds its own local graph and averages its
+        # updates with the other workers via the replica coordinator at the given address).
+        elif self.distributed_spec.get('synchronous'):
+            self.graph = tf.Graph()
+            default_graph = self.graph.as_default()
+            default_graph.__enter__()
+            self.global_model = None
+            self.as_synchronous_model()
         # Distributed tensorflow setup (each process gets its own (identical) graph).
         # We are the parameter server.
         elif self.distributed_spec.get('parameter_server'):
@@ -265,13 +320,17 @@ class Model(object):
                         registered = True
                     # Top-level, hence no 'registered' argument.
                     variable = getter(name=name, **kwargs)
-                    if not registered:
+                    if not registered and name not in self.all_variables:
                         self.all_variables[name] = variable
                         if kwargs.get('trainable', True):
                             self.variables[name] = variable
                             if 'variables' in self.summary_labels:
                                 summary = tf.summary.histogram(name=name, values=variable)
                                 self.summaries.append(summary)
+                    # Optional functional offset, see offset_variables().
+                    if self.variable_offsets is not None and variable.name in self.variable_offsets:
+                        self.applied_offsets.add(variable.name)
+                        return variable + self.variable_offsets[variable.name]
                     return variable
 
                 # Global timestep
@@ -334,6 +393,14 @@ class Model(object):
 
                 states, actions, reward = self.fn_preprocess(states=states, actions=actions, reward=reward)
 
+                # Per-slot reset of states preprocessors (e.g. frame stacking for batched acting)
+                reset_slots = [
+                    operation for preprocessing in self.states_preprocessing.values()
+                    for operation in preprocessing.reset_slots(slots=self.reset_slots_input)
+                ]
+                if len(reset_slots) > 0:
+                    self.reset_slots_output = tf.group(*reset_slots)
+
                 self.create_operations(
                     states=states,
                     internals=internals,
@@ -357,7 +424,7 @@ class Model(object):
                     summary = tf.summary.histogram(name=(self.scope + '/inputs/rewards'), values=reward)
                     self.summaries.append(summary)
 
-        if self.distributed_spec is None:
+        if self.distributed_spec is None or self.distributed_spec.get('synchronous'):
             global_variables = self.get_variables(include_submodules=True, include_nontrainable=True)
             global_variables += [self.global_episode, self.global_timestep]
             init_op = tf.variables_initializer(var_list=global_variables)
@@ -376,7 +443,7 @@ class Model(object):
                     job_name='ps',
                     task_index=self.distributed_spec['task_index'],
                     protocol=self.distributed_spec.get('protocol'),
-                    config=None,
+                    config=self.session_config,
                     start=True
                 )
                 # Param server does nothing actively.
@@ -423,9 +490,17 @@ class Model(object):
         else:
             summary_op = None
 
+        # Variables written by the saver, also used for in-memory snapshots
+        if self.global_model is None:
+            transient_variables = self.get_transient_variables()
+        else:
+            transient_variables = self.global_model.get_transient_variables()
+        transient_variables = set(variable.name for variable in transient_variables)
+        self.saver_variables = [variable for variable in global_variables if variable.name not in transient_variables]
+
         # TensorFlow saver object
         self.saver = tf.train.Saver(
-            var_list=global_variables,  # should be given?
+            var_list=self.saver_variables,  # should be given?
             reshape=False,
             sharded=False,  # should be true?
             max_to_keep=5,
@@ -516,13 +591,13 @@ class Model(object):
         # tf.train.NanTensorHook(loss_tensor, fail_on_nan_loss=True)
         # tf.train.ProfilerHook(save_steps=None, save_secs=None, output_dir='', show_dataflow=True, show_memory=False)
 
-        if self.distributed_spec is None:
+        if self.distributed_spec is None or self.distributed_spec.get('synchronous'):
             # TensorFlow non-distributed monitored session object
             self.monitored_session = tf.train.SingularMonitoredSession(
                 hooks=hooks,
                 scaffold=self.scaffold,
                 master='',  # Default value.
-                config=None,  # self.distributed_spec.get('session_config'),
+                config=self.session_config,
                 checkpoint_dir=None
             )
 
@@ -532,26 +607,27 @@ class Model(object):
                 job_name='worker',
                 task_index=self.distributed_spec['task_index'],
                 protocol=self.distributed_spec.get('protocol'),
-                config=self.distributed_spec.get('session_config'),
+                config=self.distributed_spec.get('session_config', self.session_config),
                 start=True
             )
 
-            # if self.distributed_spec['task_index'] == 0:
-            # TensorFlow chief session creator object
-            session_creator = tf.train.ChiefSessionCreator(
-                scaffold=self.scaffold,
-                master=server.target,
-                config=self.distributed_spec.get('session_config'),
-                checkpoint_dir=None,
-                checkpoint_filename_with_path=None
-            )
-            # else:
-            #     # TensorFlow worker session creator object
-            #     session_creator = tf.train.WorkerSessionCreator(
-            #         scaffold=self.scaffold,
-            #         master=server.target,
-            #         config=self.distributed_spec.get('session_config'),
-            #     )
+            if not self.distributed_spec.get('restarted', False):
+                # TensorFlow chief session creator object
+                session_creator = tf.train.ChiefSessionCreator(
+                    scaffold=self.scaffold,
+                    master=server.target,
+                    config=self.distributed_spec.get('session_config', self.session_config),
+                    checkpoint_dir=None,
+                    checkpoint_filename_with_path=None
+                )
+            else:
+                # TensorFlow worker session creator object, which only runs the local init op since
+                # the shared variables of a running cluster must not be re-initialized
+                session_creator = tf.train.WorkerSessionCreator(
+                    scaffold=self.scaffold,
+                    master=server.target,
+                    config=self.distributed_spec.get('session_config', self.session_config)
+                )
 
             # TensorFlow monitored session object
             self.monitored_session = tf.train.MonitoredSession(
@@ -574,6 +650,31 @@ class Model(object):
     def as_local_model(self):
         pass
 
+    def as_synchronous_model(self):
+        """
+        Wraps the model's optimizers for synchronous data-parallel training, so that their updates are
+        averaged over all worker replicas (see `distributed` spec with `synchronous=True`).
+        """
+        pass
+
+    def synchronous_optimizer(self, optimizer):
+        """
+        Returns the given optimizer spec wrapped by a synchronous-replicas meta optimizer.
+
+        Args:
+            optimizer: Optimizer specification.
+
+        Returns:
+            Synchronous-replicas optimizer specification.
+        """
+        return dict(
+            type='synchronous_replicas',
+            optimizer=optimizer,
+            address=self.distributed_spec['address'],
+            task_index=self.distributed_spec['task_index'],
+            authkey=self.distributed_spec.get('authkey')
+        )
+
     def initialize(self, custom_getter):
         """
         Creates the TensorFlow placeholders and functions for this model. Moreover adds the
@@ -608,6 +709,7 @@ class Model(object):
                     )
                     state['unprocessed_shape'] = state['shape']
                     state['shape'] = preprocessing.processed_shape(shape=state['unprocessed_shape'])
+                    state['type'] = preprocessing.processed_dtype(dtype=state['type'])
                     self.states_preprocessing[name] = preprocessing
                 else:
                     state['unprocessed_shape'] = state['shape']
@@ -617,6 +719,7 @@ class Model(object):
             for name, state in self.states_spec.items():
                 state['unprocessed_shape'] = state['shape']
                 state['shape'] = preprocessing.processed_shape(shape=state['unprocessed_shape'])
+                state['type'] = preprocessing.processed_dtype(dtype=state['type'])
                 self.states_preprocessing[name] = preprocessing
         else:
             for name, state in self.states_spec.items():
@@ -626,6 +729,7 @@ class Model(object):
                 )
                 state['unprocessed_shape'] = state['shape']
                 state['shape'] = preprocessing.processed_shape(shape=state['unprocessed_shape'])
+                state['type'] = preprocessing.processed_dtype(dtype=state['type'])
                 self.states_preprocessing[name] = preprocessing
 
         # Internals
@@ -685,6 +789,9 @@ class Model(object):
         self.deterministic_input = tf.placeholder(dtype=util.tf_dtype('bool'), shape=(), name='deterministic')
         self.independent_input = tf.placeholder(dtype=util.tf_dtype('bool'), shape=(), name='independent')
 
+        # Batch slots of states preprocessors with per-slot state to reset
+        self.reset_slots_input = tf.placeholder(dtype=util.tf_dtype('int'), shape=(None,), name='reset-slots')
+
         # TensorFlow functions
         self.fn_initialize = tf.make_template(
             name_='initialize',
@@ -739,6 +846,14 @@ class Model(object):
             trainable=False
         )
 
+        # Update count
+        self.update_count = tf.get_variable(
+            name='update-count',
+            dtype=util.tf_dtype('int'),
+            initializer=0,
+            trainable=False
+        )
+
         if self.batching_capacity is None:
             capacity = 1
         else:
@@ -878,11 +993,12 @@ class Model(object):
         operations = list()
         if self.variable_noise is not None and self.variable_noise > 0.0:
             # Initialize variables
-            self.fn_actions_and_internals(
-                states=states,
-                internals=internals,
-                deterministic=deterministic
-            )
+            with self.jit_scope():
+                self.fn_actions_and_internals(
+                    states=states,
+                    internals=internals,
+                    deterministic=deterministic
+                )
 
             noise_deltas = list()
             for variable in self.get_variables():
@@ -891,7 +1007,7 @@ class Model(object):
                 operations.append(variable.assign_add(delta=noise_delta))
 
         # Retrieve actions and internals
-        with tf.control_dependencies(control_inputs=operations):
+        with tf.control_dependencies(control_inputs=operations), self.jit_scope():
             self.actions_output, self.internals_output = self.fn_actions_and_internals(
                 states=states,
                 internals=internals,
@@ -983,6 +1099,18 @@ class Model(object):
                 reward=reward
             )
 
+        if self.global_model is not None:
+            # Merge states preprocessing statistics (e.g. running standardization) with the global model's
+            def synchronize_preprocessing():
+                operations = [
+                    operation for name, preprocessing in self.states_preprocessing.items()
+                    for operation in preprocessing.synchronize(source=self.global_model.states_preprocessing[name])
+                ]
+                return tf.group(*operations)
+
+            with tf.control_dependencies(control_inputs=(observation,)):
+                observation = tf.cond(pred=(num_episodes > 0), true_fn=synchronize_preprocessing, false_fn=tf.no_op)
+
         with tf.control_dependencies(control_inputs=(observation,)):
             # Reset index
             reset_index = tf.assign(ref=self.buffer_index, value=0)
@@ -990,6 +1118,7 @@ class Model(object):
         with tf.control_dependencies(control_inputs=(reset_index,)):
             # Trivial operation to enforce control dependency
             self.episode_output = self.global_episode + 0
+            self.update_count_output = self.update_count + 0
 
         # TODO: add up rewards per episode and add summary_label 'episode-reward'
 
@@ -1041,6 +1170,59 @@ class Model(object):
 
         return model_variables
 
+    def get_transient_variables(self):
+        """
+        Returns the variables which only hold transient state, for instance preprocessing statistics
+        pending synchronization, and which are hence not saved.
+
+        Returns:
+            List of variables.
+        """
+        transient_variables = [
+            variable for preprocessing in self.states_preprocessing.values()
+            for variable in preprocessing.get_transient_variables()
+        ]
+        if self.reward_preprocessing is not None:
+            transient_variables += self.reward_preprocessing.get_transient_variables()
+        return transient_variables
+
+    def offset_variables(self, variables, offsets, fn, **kwargs):
+        """
+        Creates the TensorFlow operations of the given function as if the given offsets were added  
+        to the values of the given variables, without modifying the variables themselves. The  
+        offsets are applied by the model's custom getter, hence fn has to be a model function which  
+        retrieves the variables via `tf.get_variable`.
+
+        Args:
+            variables: List of variables.
+            offsets: List of offset tensors of same length.
+            fn: Model function, for instance `fn_loss`.
+            **kwargs: Arguments for fn.
+
+        Returns:
+            The output of fn for the offset variables.
+        """
+        if len(variables) != len(offsets):
+            raise TensorForceError("Invalid variables and offsets lists.")
+        if self.variable_offsets is not None:
+            raise TensorForceError("Variable offsets cannot be nested.")
+
+        self.variable_offsets = {variable.name: offset for variable, offset in zip(variables, offsets)}
+        self.applied_offsets = set()
+        try:
+            output = fn(**kwargs)
+            if self.applied_offsets != set(self.variable_offsets):
+                raise TensorForceError(
+                    "Variable offsets could not be applied to: {}.".format(
+                        ', '.join(sorted(set(self.variable_offsets) - self.applied_offsets))
+                    )
+                )
+        finally:
+            self.variable_offsets = None
+            self.applied_offsets = None
+
+        return output
+
     def get_summaries(self):
         """
         Returns the TensorFlow summaries reported by the model
@@ -1073,6 +1255,18 @@ class Model(object):
 
         return episode, timestep, self.internals_init
 
+    def reset_slots(self, slots):
+        """
+        Resets the per-slot state of states preprocessors (e.g. the frame buffers of the sequence  
+        preprocessor) for the given batch slots when acting batched, for instance for those  
+        environments of a VectorEnvironment which terminated.
+
+        Args:
+            slots: List of batch slots to reset.
+        """
+        if self.reset_slots_output is not None and len(slots) > 0:
+            self.monitored_session.run(fetches=self.reset_slots_output, feed_dict={self.reset_slots_input: slots})
+
     def get_feed_dict(
         self,
         states=None,
@@ -1228,7 +1422,7 @@ class Model(object):
         # terminal = np.asarray(terminal)
         # batched = (terminal.ndim == 1)
 
-        fetches = self.episode_output
+        fetches = [self.episode_output, self.update_count_output]
 
         feed_dict = self.get_feed_dict(terminal=terminal, reward=reward)
 
@@ -1239,7 +1433,7 @@ class Model(object):
         #     feed_dict = {self.terminal_input: (terminal,), self.reward_input: (reward,)}
 
         self.is_observe = True
-        episode = self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
+        episode, self.num_updates = self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
         self.is_observe = False
 
         return episode
@@ -1295,3 +1489,67 @@ class Model(object):
         #     raise TensorForceError("Invalid model directory/file.")
 
         self.saver.restore(sess=self.session, save_path=file)
+
+    def get_variable_values(self):
+        """
+        Returns the current values of the model's trainable variables, for instance to transfer  
+        the policy to another model instance with the same specification.
+
+        Returns:
+            Dict of variable names to NumPy arrays.
+        """
+        variables = self.get_variables()
+        values = self.monitored_session.run(fetches=variables)
+        return {variable.name: value for variable, value in zip(variables, values)}
+
+    def set_variable_values(self, values):
+        """
+        Sets the values of the model's trainable variables, see `get_variable_values`.
+
+        Args:
+            values: Dict of variable names to NumPy arrays.
+        """
+        for variable in self.get_variables():
+            if variable.name not in values:
+                raise TensorForceError("Missing value for variable {}.".format(variable.name))
+            variable.load(value=values[variable.name], session=self.monitored_session)
+
+    def get_snapshot_variables(self, include_memory=True):
+        """
+        Returns the variables of a snapshot, by default the same variables the saver writes.
+
+        Args:
+            include_memory: Includes the replay memory variables of memory-based models if true.
+
+        Returns:
+            List of variables.
+        """
+        return list(self.saver_variables)
+
+    def snapshot(self, include_memory=True):
+        """
+        Fetches the values of all snapshot variables in a single session call, without going  
+        through the monitored session hooks. Writing the values to disk can subsequently happen  
+        concurrently to the agent acting and observing, see `Checkpointer`.
+
+        Args:
+            include_memory: Includes the replay memory variables of memory-based models if true.
+
+        Returns:
+            Dict of variable names to NumPy arrays.
+        """
+        variables = self.get_snapshot_variables(include_memory=include_memory)
+        values = self.session.run(fetches=variables)
+        return {variable.name: value for variable, value in zip(variables, values)}
+
+    def restore_snapshot(self, values):
+        """
+        Loads the values of a snapshot into the model's variables, see `snapshot`. Variables  
+        missing from the snapshot, e.g. memory variables, keep their current values.
+
+        Args:
+            values: Dict of variable names to NumPy arrays.
+        """
+        for variable in self.get_snapshot_variables(include_memory=True):
+            if variable.name in values:
+                variable.load(value=values[variable.name], session=self.session)
@@ -30,11 +30,11 @@ class PGLogProbModel(PGModel):
 
     def tf_loss_per_instance(self, states, internals, actions, terminal, reward, next_states, next_internals, update, reference=None):
         embedding = self.network.apply(x=states, internals=internals, update=update)
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
         log_probs = list()
 
         for name, distribution in self.distributions.items():
-            distr_params = distribution.parameterize(x=embedding)
-            log_prob = distribution.log_probability(distr_params=distr_params, action=actions[name])
+            log_prob = distribution.log_probability(distr_params=distr_params[name], action=actions[name])
             collapsed_size = util.prod(util.shape(log_prob)[1:])
             log_prob = tf.reshape(tensor=log_prob, shape=(-1, collapsed_size))
             log_probs.append(log_prob)
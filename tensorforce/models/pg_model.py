@@ -19,6 +19,7 @@ from __future__ import division
 
 import tensorflow as tf
 
+from tensorforce import util, TensorForceError
 from tensorforce.core.baselines import Baseline, AggregatedBaseline
 from tensorforce.core.optimizers import Optimizer
 from tensorforce.models import DistributionModel
@@ -55,7 +56,10 @@ class PGModel(DistributionModel):
         baseline_mode,
         baseline,
         baseline_optimizer,
-        gae_lambda
+        gae_lambda,
+        vtrace_threshold=None,
+        fused_parameterization=False,
+        execution=None
     ):
         # Baseline mode
         assert baseline_mode is None or baseline_mode in ('states', 'network')
@@ -68,9 +72,21 @@ class PGModel(DistributionModel):
         assert gae_lambda is None or (0.0 <= gae_lambda <= 1.0 and self.baseline_mode is not None)
         self.gae_lambda = gae_lambda
 
+        # V-trace off-policy correction
+        assert vtrace_threshold is None or (vtrace_threshold > 0.0 and self.baseline_mode is not None)
+        if vtrace_threshold is not None and actions_exploration is not None:
+            # The behaviour log probability refers to the actions before exploration
+            raise TensorForceError("V-trace off-policy correction does not support actions exploration.")
+        self.vtrace_threshold = vtrace_threshold
+
         self.baseline = None
         self.baseline_optimizer = None
         self.fn_reward_estimation = None
+        self.fn_vtrace_estimation = None
+        self.behaviour_log_prob_input = None
+        self.bootstrap_value_input = None
+        self.off_policy_optimization_output = None
+        self.state_value_output = None
 
         super(PGModel, self).__init__(
             states=states,
@@ -92,7 +108,9 @@ class PGModel(DistributionModel):
             network=network,
             distributions=distributions,
             entropy_regularization=entropy_regularization,
-            requires_deterministic=False
+            requires_deterministic=False,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def as_local_model(self):
@@ -103,6 +121,11 @@ class PGModel(DistributionModel):
                 optimizer=self.baseline_optimizer_spec
             )
 
+    def as_synchronous_model(self):
+        super(PGModel, self).as_synchronous_model()
+        if self.baseline_optimizer_spec is not None:
+            self.baseline_optimizer_spec = self.synchronous_optimizer(optimizer=self.baseline_optimizer_spec)
+
     def initialize(self, custom_getter):
         super(PGModel, self).initialize(custom_getter)
 
@@ -144,6 +167,24 @@ class PGModel(DistributionModel):
             custom_getter_=custom_getter
         )
 
+        # V-trace off-policy correction
+        if self.vtrace_threshold is not None:
+            self.behaviour_log_prob_input = tf.placeholder(
+                dtype=util.tf_dtype('float'),
+                shape=(None,),
+                name='behaviour-log-prob'
+            )
+            self.bootstrap_value_input = tf.placeholder(
+                dtype=util.tf_dtype('float'),
+                shape=(),
+                name='bootstrap-value'
+            )
+            self.fn_vtrace_estimation = tf.make_template(
+                name_='vtrace-estimation',
+                func_=self.tf_vtrace_estimation,
+                custom_getter_=custom_getter
+            )
+
     def tf_reward_estimation(self, states, internals, terminal, reward, update):
         if self.baseline_mode is None:
             return self.fn_discounted_cumulative_reward(terminal=terminal, reward=reward, discount=self.discount)
@@ -194,6 +235,106 @@ class PGModel(DistributionModel):
 
             return advantage
 
+    def tf_vtrace_estimation(self, states, internals, actions, terminal, reward, behaviour_log_prob, bootstrap_value,
+                             update):
+        """
+        Creates the TensorFlow operations for the V-trace off-policy correction (Espeholt et al., 2018)
+        of a sequence of experiences generated by a possibly outdated behaviour policy.
+
+        Args:
+            states: Dict of state tensors.
+            internals: List of prior internal state tensors.
+            actions: Dict of action tensors.
+            terminal: Terminal boolean tensor.
+            reward: Reward tensor.
+            behaviour_log_prob: Log probability tensor of the actions under the behaviour policy.
+            bootstrap_value: Scalar value tensor of the state following the last experience, used if
+                the sequence ends with a non-terminal experience.
+            update: Boolean tensor indicating whether this call happens during an update.
+
+        Returns:
+            Importance-weighted advantage tensor and V-trace value target tensor.
+        """
+        embedding = self.network.apply(x=states, internals=internals, update=update)
+
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
+
+        log_probs = list()
+        for name, distribution in self.distributions.items():
+            log_prob = distribution.log_probability(distr_params=distr_params[name], action=actions[name])
+            collapsed_size = util.prod(util.shape(log_prob)[1:])
+            log_prob = tf.reshape(tensor=log_prob, shape=(-1, collapsed_size))
+            log_probs.append(log_prob)
+        log_prob = tf.reduce_sum(input_tensor=tf.concat(values=log_probs, axis=1), axis=1)
+
+        # Truncated importance weights, used both as rho and c.
+        importance_weight = tf.exp(x=tf.stop_gradient(input=(log_prob - behaviour_log_prob)))
+        importance_weight = tf.minimum(x=importance_weight, y=self.vtrace_threshold)
+
+        if self.baseline_mode == 'states':
+            state_value = self.baseline.predict(states=states, internals=internals, update=update)
+        elif self.baseline_mode == 'network':
+            state_value = self.baseline.predict(
+                states=tf.stop_gradient(input=embedding),
+                internals=internals,
+                update=update
+            )
+        state_value = tf.stop_gradient(input=state_value)
+
+        return self.vtrace_targets(
+            state_value=state_value,
+            importance_weight=importance_weight,
+            terminal=terminal,
+            reward=reward,
+            bootstrap_value=bootstrap_value,
+            discount=self.discount
+        )
+
+    @staticmethod
+    def vtrace_targets(state_value, importance_weight, terminal, reward, bootstrap_value, discount):
+        """
+        Creates the TensorFlow operations for the V-trace value targets and advantages of a sequence.
+
+        Args:
+            state_value: State value tensor.
+            importance_weight: Truncated importance weight tensor, used both as rho and c.
+            terminal: Terminal boolean tensor.
+            reward: Reward tensor.
+            bootstrap_value: Scalar value tensor of the state following the last experience.
+            discount: Discount factor.
+
+        Returns:
+            Importance-weighted advantage tensor and V-trace value target tensor.
+        """
+        bootstrap_value = tf.expand_dims(input=bootstrap_value, axis=0)
+        next_state_value = tf.concat(values=(state_value[1:], bootstrap_value), axis=0)
+        zeros = tf.zeros_like(tensor=next_state_value)
+        next_state_value = tf.where(condition=terminal, x=zeros, y=next_state_value)
+        td_residual = importance_weight * (reward + discount * next_state_value - state_value)
+
+        def cumulate(cumulative, residual_weight_and_terminal):
+            residual, weight, term = residual_weight_and_terminal
+            return tf.where(condition=term, x=residual, y=(residual + discount * weight * cumulative))
+
+        # Reverse since the correction is calculated right-to-left, but tf.scan only works left-to-right
+        correction = tf.scan(
+            fn=cumulate,
+            elems=(
+                tf.reverse(tensor=td_residual, axis=(0,)),
+                tf.reverse(tensor=importance_weight, axis=(0,)),
+                tf.reverse(tensor=terminal, axis=(0,))
+            ),
+            initializer=0.0
+        )
+        value_target = state_value + tf.reverse(tensor=correction, axis=(0,))
+
+        # The V-trace target of the state following the sequence is its value
+        next_value_target = tf.concat(values=(value_target[1:], bootstrap_value), axis=0)
+        next_value_target = tf.where(condition=terminal, x=zeros, y=next_value_target)
+        advantage = importance_weight * (reward + discount * next_value_target - state_value)
+
+        return advantage, value_target
+
     def tf_regularization_losses(self, states, internals, update):
         losses = super(PGModel, self).tf_regularization_losses(
             states=states,
@@ -277,16 +418,29 @@ class PGModel(DistributionModel):
             arguments['global_variables'] = self.global_model.baseline.get_variables()
         return arguments
 
-    def tf_optimization(self, states, internals, actions, terminal, reward, next_states=None, next_internals=None):
+    def tf_optimization(self, states, internals, actions, terminal, reward, next_states=None, next_internals=None,
+                        behaviour_log_prob=None, bootstrap_value=None):
         assert next_states is None and next_internals is None  # temporary
 
-        estimated_reward = self.fn_reward_estimation(
-            states=states,
-            internals=internals,
-            terminal=terminal,
-            reward=reward,
-            update=tf.constant(value=True)
-        )
+        if behaviour_log_prob is None:
+            estimated_reward = self.fn_reward_estimation(
+                states=states,
+                internals=internals,
+                terminal=terminal,
+                reward=reward,
+                update=tf.constant(value=True)
+            )
+        else:
+            estimated_reward, value_target = self.fn_vtrace_estimation(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward,
+                behaviour_log_prob=behaviour_log_prob,
+                bootstrap_value=bootstrap_value,
+                update=tf.constant(value=True)
+            )
         if self.baseline_optimizer is not None:
             estimated_reward = tf.stop_gradient(input=estimated_reward)
 
@@ -301,7 +455,14 @@ class PGModel(DistributionModel):
         )
 
         if self.baseline_optimizer is not None:
-            cumulative_reward = self.fn_discounted_cumulative_reward(terminal=terminal, reward=reward, discount=self.discount)
+            if behaviour_log_prob is None:
+                cumulative_reward = self.fn_discounted_cumulative_reward(
+                    terminal=terminal,
+                    reward=reward,
+                    discount=self.discount
+                )
+            else:
+                cumulative_reward = tf.stop_gradient(input=value_target)
 
             arguments = self.baseline_optimizer_arguments(
                 states=states,
@@ -314,6 +475,37 @@ class PGModel(DistributionModel):
 
         return optimization
 
+    def create_operations(self, states, internals, actions, terminal, reward, deterministic, independent):
+        super(PGModel, self).create_operations(
+            states=states,
+            internals=internals,
+            actions=actions,
+            terminal=terminal,
+            reward=reward,
+            deterministic=deterministic,
+            independent=independent
+        )
+
+        # Off-policy optimization operation, bypassing the memory.
+        if self.vtrace_threshold is not None:
+            self.off_policy_optimization_output = self.fn_optimization(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward,
+                behaviour_log_prob=tf.identity(input=self.behaviour_log_prob_input),
+                bootstrap_value=tf.identity(input=self.bootstrap_value_input)
+            )
+
+            # Value of the state following a sequence, to bootstrap its V-trace targets.
+            update = tf.constant(value=False)
+            if self.baseline_mode == 'states':
+                self.state_value_output = self.baseline.predict(states=states, internals=internals, update=update)
+            elif self.baseline_mode == 'network':
+                embedding = self.network.apply(x=states, internals=internals, update=update)
+                self.state_value_output = self.baseline.predict(states=embedding, internals=internals, update=update)
+
     def get_variables(self, include_submodules=False, include_nontrainable=False):
         model_variables = super(PGModel, self).get_variables(
             include_submodules=include_submodules,
@@ -339,3 +531,46 @@ class PGModel(DistributionModel):
             return super(PGModel, self).get_summaries()
         else:
             return super(PGModel, self).get_summaries() + self.baseline.get_summaries()
+
+    def off_policy_update(self, states, internals, actions, terminal, reward, behaviour_log_prob,
+                          bootstrap_states=None, bootstrap_internals=None):
+        """
+        Performs an optimization update step with V-trace off-policy correction on the given sequence of
+        experiences, for instance a trajectory segment generated by a lagging actor with an outdated policy.
+
+        Args:
+            states: Dict of batched state values.
+            internals: Dict of batched internal state values.
+            actions: Dict of batched action values.
+            terminal: Batched terminal values.
+            reward: Batched reward values.
+            behaviour_log_prob: Batched log probabilities of the actions under the behaviour policy,
+                see named tensor 'log_probability'.
+            bootstrap_states: Dict of state values following the last experience, required to bootstrap
+                the V-trace targets if the sequence ends with a non-terminal experience.
+            bootstrap_internals: Dict of internal state values following the last experience.
+        """
+        if self.vtrace_threshold is None:
+            raise TensorForceError("Off-policy updates require vtrace_threshold to be set.")
+
+        fetches = self.off_policy_optimization_output
+
+        feed_dict = self.get_feed_dict(
+            states=states,
+            internals=internals,
+            actions=actions,
+            terminal=terminal,
+            reward=reward
+        )
+        feed_dict[self.behaviour_log_prob_input] = behaviour_log_prob
+
+        if bootstrap_states is None or terminal[-1]:
+            feed_dict[self.bootstrap_value_input] = 0.0
+        else:
+            bootstrap_value = self.monitored_session.run(
+                fetches=self.state_value_output,
+                feed_dict=self.get_feed_dict(states=bootstrap_states, internals=bootstrap_internals)
+            )
+            feed_dict[self.bootstrap_value_input] = bootstrap_value[0]
+
+        self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
@@ -53,7 +53,9 @@ class PGProbRatioModel(PGModel):
         baseline,
         baseline_optimizer,
         gae_lambda,
-        likelihood_ratio_clipping
+        likelihood_ratio_clipping,
+        fused_parameterization=False,
+        execution=None
     ):
         # Likelihood ratio clipping
         assert likelihood_ratio_clipping is None or likelihood_ratio_clipping > 0.0
@@ -85,17 +87,20 @@ class PGProbRatioModel(PGModel):
             baseline_mode=baseline_mode,
             baseline=baseline,
             baseline_optimizer=baseline_optimizer,
-            gae_lambda=gae_lambda
+            gae_lambda=gae_lambda,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def tf_reference(self, states, internals, actions, terminal, reward, next_states, next_internals, update):
         embedding = self.network.apply(x=states, internals=internals, update=update)
 
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
+
         log_probs = list()
         for name in sorted(self.distributions):
             distribution = self.distributions[name]
-            distr_params = distribution.parameterize(x=embedding)
-            log_prob = distribution.log_probability(distr_params=distr_params, action=actions[name])
+            log_prob = distribution.log_probability(distr_params=distr_params[name], action=actions[name])
             collapsed_size = util.prod(util.shape(log_prob)[1:])
             log_prob = tf.reshape(tensor=log_prob, shape=(-1, collapsed_size))
             log_probs.append(log_prob)
@@ -105,11 +110,12 @@ class PGProbRatioModel(PGModel):
     def tf_loss_per_instance(self, states, internals, actions, terminal, reward, next_states, next_internals, update, reference=None):
         embedding = self.network.apply(x=states, internals=internals, update=update)
 
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
+
         log_probs = list()
         for name in sorted(self.distributions):
             distribution = self.distributions[name]
-            distr_params = distribution.parameterize(x=embedding)
-            log_prob = distribution.log_probability(distr_params=distr_params, action=actions[name])
+            log_prob = distribution.log_probability(distr_params=distr_params[name], action=actions[name])
             collapsed_size = util.prod(util.shape(log_prob)[1:])
             log_prob = tf.reshape(tensor=log_prob, shape=(-1, collapsed_size))
             log_probs.append(log_prob)
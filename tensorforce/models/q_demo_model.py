@@ -58,7 +58,9 @@ class QDemoModel(QModel):
         expert_margin,
         supervised_weight,
         demo_memory_capacity,
-        demo_batch_size
+        demo_batch_size,
+        fused_parameterization=False,
+        execution=None
     ):
         if any(action['type'] not in ('bool', 'int') for action in actions.values()):
             raise TensorForceError("Invalid action type, only 'bool' and 'int' are valid!")
@@ -91,7 +93,9 @@ class QDemoModel(QModel):
             target_sync_frequency=target_sync_frequency,
             target_update_weight=target_update_weight,
             double_q_model=double_q_model,
-            huber_loss=huber_loss
+            huber_loss=huber_loss,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize(self, custom_getter):
@@ -156,10 +160,11 @@ class QDemoModel(QModel):
         Extends the q-model loss via the dqfd large-margin loss.
         """
         embedding = self.network.apply(x=states, internals=internals, update=update)
+        all_distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
         deltas = list()
 
         for name, action in actions.items():
-            distr_params = self.distributions[name].parameterize(x=embedding)
+            distr_params = all_distr_params[name]
             state_action_value = self.distributions[name].state_action_value(distr_params=distr_params, action=action)
 
             # Create the supervised margin loss
@@ -235,10 +240,13 @@ class QDemoModel(QModel):
             ),
             fn_loss=self.fn_combined_loss
         )
+        if self.distributed_spec is not None and self.distributed_spec.get('synchronous'):
+            arguments['broadcast_variables'] = self.target_optimizer_arguments()['variables']
         demo_optimization = self.optimizer.minimize(**arguments)
 
-        arguments = self.target_optimizer_arguments()
-        target_optimization = self.target_optimizer.minimize(**arguments)
+        with tf.control_dependencies(control_inputs=(demo_optimization,)):
+            arguments = self.target_optimizer_arguments()
+            target_optimization = self.target_optimizer.minimize(**arguments)
 
         return tf.group(demo_optimization, target_optimization)
 
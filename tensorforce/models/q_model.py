@@ -54,7 +54,9 @@ class QModel(DistributionModel):
         target_sync_frequency,
         target_update_weight,
         double_q_model,
-        huber_loss
+        huber_loss,
+        fused_parameterization=False,
+        execution=None
     ):
         self.target_network_spec = network
         self.target_optimizer_spec = dict(
@@ -92,7 +94,9 @@ class QModel(DistributionModel):
             network=network,
             distributions=distributions,
             entropy_regularization=entropy_regularization,
-            requires_deterministic=True
+            requires_deterministic=True,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def as_local_model(self):
@@ -151,15 +155,17 @@ class QModel(DistributionModel):
         return reward + next_q_value - q_value  # tf.stop_gradient(q_target)
 
     def tf_loss_per_instance(self, states, internals, actions, terminal, reward, next_states, next_internals, update, reference=None):
-        embedding = self.network.apply(x=states, internals=internals, update=update)
-
-        # fix
         if self.double_q_model:
-            next_embedding = self.network.apply(
-                x=next_states,
-                internals=next_internals,
+            # Single forward pass of the online network for both states and next states
+            batch_size = tf.shape(input=next(iter(states.values())))[0]
+            fused_embedding = self.network.apply(
+                x=self.fuse_batches(tensors=states, next_tensors=next_states),
+                internals=self.fuse_batches(tensors=internals, next_tensors=next_internals),
                 update=update
             )
+            embedding = fused_embedding[:batch_size]
+        else:
+            embedding = self.network.apply(x=states, internals=internals, update=update)
 
         # Both networks can use the same internals, could that be a problem?
         # Otherwise need to handle internals indices correctly everywhere
@@ -169,23 +175,46 @@ class QModel(DistributionModel):
             update=update
         )
 
+        if self.double_q_model:
+            fused_distr_params = self.parameterize_distributions(
+                distributions=self.distributions,
+                embedding=fused_embedding
+            )
+            distr_params = util.map_tensors(fn=(lambda x: x[:batch_size]), tensors=fused_distr_params)
+            next_distr_params = util.map_tensors(fn=(lambda x: x[batch_size:]), tensors=fused_distr_params)
+            actions_taken = self.sample_distributions(
+                distributions=self.distributions,
+                distr_params=next_distr_params,
+                deterministic=True
+            )
+        else:
+            distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
+        target_distr_params = self.parameterize_distributions(
+            distributions=self.target_distributions,
+            embedding=target_embedding
+        )
+        if not self.double_q_model:
+            actions_taken = self.sample_distributions(
+                distributions=self.target_distributions,
+                distr_params=target_distr_params,
+                deterministic=True
+            )
+
         deltas = list()
         for name, distribution in self.distributions.items():
             target_distribution = self.target_distributions[name]
 
-            distr_params = distribution.parameterize(x=embedding)
-            target_distr_params = target_distribution.parameterize(x=target_embedding)
-
-            q_value = self.tf_q_value(embedding=embedding, distr_params=distr_params, action=actions[name], name=name)
-
-            if self.double_q_model:
-                # fix
-                next_distr_params = distribution.parameterize(x=next_embedding)
-                action_taken = distribution.sample(distr_params=next_distr_params, deterministic=True)
-            else:
-                action_taken = target_distribution.sample(distr_params=target_distr_params, deterministic=True)
+            q_value = self.tf_q_value(
+                embedding=embedding,
+                distr_params=distr_params[name],
+                action=actions[name],
+                name=name
+            )
 
-            next_q_value = target_distribution.state_action_value(distr_params=target_distr_params, action=action_taken)
+            next_q_value = target_distribution.state_action_value(
+                distr_params=target_distr_params[name],
+                action=actions_taken[name]
+            )
 
             delta = self.tf_q_delta(q_value=q_value, next_q_value=next_q_value, terminal=terminal, reward=reward)
 
@@ -208,6 +237,14 @@ class QModel(DistributionModel):
 
         return loss
 
+    @staticmethod
+    def fuse_batches(tensors, next_tensors):
+        """
+        Concatenates the dicts of state (or internal) tensors along the batch dimension, so the
+        network is evaluated once for both batches.
+        """
+        return {name: tf.concat(values=(tensors[name], next_tensors[name]), axis=0) for name in tensors}
+
     def target_optimizer_arguments(self):
         """
         Returns the target optimizer arguments including the time, the list of variables to  
@@ -237,6 +274,21 @@ class QModel(DistributionModel):
             ]
         return arguments
 
+    def optimizer_arguments(self, states, internals, actions, terminal, reward, next_states, next_internals):
+        arguments = super(QModel, self).optimizer_arguments(
+            states=states,
+            internals=internals,
+            actions=actions,
+            terminal=terminal,
+            reward=reward,
+            next_states=next_states,
+            next_internals=next_internals
+        )
+        if self.distributed_spec is not None and self.distributed_spec.get('synchronous'):
+            # Replicas start with the target network of the first worker as well
+            arguments['broadcast_variables'] = self.target_optimizer_arguments()['variables']
+        return arguments
+
     def tf_optimization(self, states, internals, actions, terminal, reward, next_states=None, next_internals=None):
         optimization = super(QModel, self).tf_optimization(
             states=states,
@@ -248,8 +300,10 @@ class QModel(DistributionModel):
             next_internals=next_internals
         )
 
-        arguments = self.target_optimizer_arguments()
-        target_optimization = self.target_optimizer.minimize(**arguments)
+        # Target network synchronized with the updated network
+        with tf.control_dependencies(control_inputs=(optimization,)):
+            arguments = self.target_optimizer_arguments()
+            target_optimization = self.target_optimizer.minimize(**arguments)
 
         return tf.group(optimization, target_optimization)
 
@@ -52,7 +52,9 @@ class QNAFModel(QModel):
         target_sync_frequency,
         target_update_weight,
         double_q_model,
-        huber_loss
+        huber_loss,
+        fused_parameterization=False,
+        execution=None
     ):
         if any(action['type'] != 'float' or 'min_value' in action or 'max_value' in action for action in actions.values()):
             raise TensorForceError("Only unconstrained float actions valid for NAFModel.")
@@ -80,7 +82,9 @@ class QNAFModel(QModel):
             target_sync_frequency=target_sync_frequency,
             target_update_weight=target_update_weight,
             double_q_model=double_q_model,
-            huber_loss=huber_loss
+            huber_loss=huber_loss,
+            fused_parameterization=fused_parameterization,
+            execution=execution
         )
 
     def initialize(self, custom_getter):
@@ -147,17 +151,25 @@ class QNAFModel(QModel):
             update=update
         )
 
+        distr_params = self.parameterize_distributions(distributions=self.distributions, embedding=embedding)
+        target_distr_params = self.parameterize_distributions(
+            distributions=self.target_distributions,
+            embedding=target_embedding
+        )
+
         deltas = list()
         for name, distribution in self.distributions.items():
             target_distribution = self.target_distributions[name]
 
-            distr_params = distribution.parameterize(x=embedding)
-            target_distr_params = target_distribution.parameterize(x=target_embedding)
-
-            q_value = self.tf_q_value(embedding=embedding, distr_params=distr_params, action=actions[name], name=name)
+            q_value = self.tf_q_value(
+                embedding=embedding,
+                distr_params=distr_params[name],
+                action=actions[name],
+                name=name
+            )
 
             # Notice, this is V', not Q' because NAF outputs V(s) separately
-            next_state_value = target_distribution.state_value(distr_params=target_distr_params)
+            next_state_value = target_distribution.state_value(distr_params=target_distr_params[name])
 
             delta = self.tf_q_delta(q_value=q_value, next_q_value=next_state_value, terminal=terminal, reward=reward)
 
@@ -0,0 +1,104 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import socket
+import unittest
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.contrib.remote_environment import BufferProtocol
+
+
+class TestBufferProtocol(unittest.TestCase):
+
+    def setUp(self):
+        self.client, self.server = socket.socketpair()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def round_trip(self, message, protocol=None):
+        BufferProtocol().send(message, self.client)
+        return (protocol or BufferProtocol()).recv(self.server, check_status=False)
+
+    def test_dtypes(self):
+        message = dict(status="ok", obs_dict=dict(
+            float32=np.random.normal(size=(3, 4)).astype(np.float32),
+            float64=np.random.normal(size=(5,)),
+            uint8=np.random.randint(256, size=(8, 8, 3)).astype(np.uint8),
+            int64=np.arange(6).reshape(2, 3),
+            bool=np.array([True, False, True]),
+            big_endian=np.arange(4, dtype='>i4')
+        ), reward=-1.5, is_terminal=False, info=["a", 1])
+        received = self.round_trip(message)
+
+        self.assertEqual(received["status"], "ok")
+        self.assertEqual(received["reward"], -1.5)
+        self.assertFalse(received["is_terminal"])
+        self.assertEqual(received["info"], ["a", 1])
+        for name, array in message["obs_dict"].items():
+            self.assertEqual(received["obs_dict"][name].dtype, array.dtype)
+            np.testing.assert_array_equal(received["obs_dict"][name], array)
+
+    def test_scalars(self):
+        received = self.round_trip(dict(flag=np.array(True), value=np.array(2.5), item=np.float32(1.5)))
+
+        self.assertEqual(received["flag"].shape, ())
+        self.assertEqual(received["flag"].dtype, np.bool_)
+        self.assertTrue(received["flag"])
+        self.assertEqual(received["value"].shape, ())
+        self.assertEqual(received["value"], 2.5)
+        self.assertEqual(received["item"], 1.5)
+
+    def test_empty_arrays(self):
+        received = self.round_trip(dict(empty=np.zeros((0, 3), dtype=np.float32), after=np.arange(3)))
+
+        self.assertEqual(received["empty"].shape, (0, 3))
+        self.assertEqual(received["empty"].dtype, np.float32)
+        np.testing.assert_array_equal(received["after"], np.arange(3))
+
+    def test_non_contiguous_arrays(self):
+        array = np.arange(24, dtype=np.float32).reshape(4, 6)
+        received = self.round_trip(dict(transposed=array.T, strided=array[:, ::2]))
+
+        np.testing.assert_array_equal(received["transposed"], array.T)
+        np.testing.assert_array_equal(received["strided"], array[:, ::2])
+
+    def test_reuse_arrays(self):
+        protocol = BufferProtocol(reuse_arrays=True)
+        first = self.round_trip(dict(state=np.zeros((2, 2))), protocol=protocol)
+        first_values = first["state"].copy()
+        second = self.round_trip(dict(state=np.ones((2, 2))), protocol=protocol)
+
+        # Same buffer re-used for matching dtype and shape, values of the latest message
+        self.assertIs(second["state"], first["state"])
+        np.testing.assert_array_equal(first_values, np.zeros((2, 2)))
+        np.testing.assert_array_equal(second["state"], np.ones((2, 2)))
+
+        third = self.round_trip(dict(state=np.ones((3,), dtype=np.int32)), protocol=protocol)
+        self.assertIsNot(third["state"], second["state"])
+        self.assertEqual(third["state"].shape, (3,))
+
+    def test_status(self):
+        BufferProtocol().send(dict(status="error", message="failed"), self.client)
+        with self.assertRaises(TensorForceError):
+            BufferProtocol().recv(self.server)
@@ -0,0 +1,88 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tensorforce.agents import DQNAgent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import Runner, Checkpointer
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class TestCheckpointer(unittest.TestCase):
+
+    def test_checkpointer(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = DQNAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            memory=dict(type='replay', capacity=100, include_next_states=True),
+            update_mode=dict(unit='timesteps', batch_size=8, frequency=4)
+        )
+        runner = Runner(agent=agent, environment=environment)
+
+        directory = tempfile.mkdtemp()
+        try:
+            checkpointer = Checkpointer(model=agent.model, path=os.path.join(directory, 'model'), max_to_keep=2)
+            runner.run(num_episodes=10)
+            snapshot = agent.model.snapshot()
+            file = checkpointer.save(block=True)
+
+            runner.run(num_episodes=10)
+            checkpointer.save(block=True)
+            checkpointer.restore(file=file)
+            restored = agent.model.snapshot()
+
+            runner.run(num_episodes=10)
+            checkpointer.save(block=True)
+            checkpointer.close()
+            files = os.listdir(directory)
+
+            # Checkpoint without memory variables.
+            checkpointer = Checkpointer(model=agent.model, path=os.path.join(directory, 'weights'),
+                                        include_memory=False)
+            weights_file = checkpointer.save(block=True)
+            checkpointer.close()
+            with np.load(weights_file) as data:
+                names = list(data.files)
+        finally:
+            shutil.rmtree(directory)
+        runner.close()
+
+        self.assertEqual(sorted(snapshot), sorted(restored))
+        for name in snapshot:
+            np.testing.assert_array_equal(snapshot[name], restored[name])
+
+        self.assertEqual(len([f for f in files if f.endswith('.npz')]), 2)
+        self.assertFalse(any(f.endswith('.tmp') for f in files))
+
+        memory_names = [variable.name for variable in agent.model.memory.get_variables()]
+        self.assertGreater(len(memory_names), 0)
+        self.assertTrue(all(name in snapshot for name in memory_names))
+        self.assertFalse(any(name in names for name in memory_names))
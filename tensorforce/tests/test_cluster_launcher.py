@@ -0,0 +1,151 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import multiprocessing
+import sys
+import unittest
+
+import tensorflow as tf
+
+from tensorforce.agents import Agent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import ClusterLauncher, Runner
+from tensorforce.execution.cluster_launcher import free_ports
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+agent = dict(
+    type='vpg_agent',
+    network=[
+        dict(type='dense', size=32),
+        dict(type='dense', size=32)
+    ],
+    update_mode=dict(
+        unit='episodes',
+        batch_size=2,
+        frequency=2
+    ),
+    memory=dict(
+        type='latest',
+        include_next_states=False,
+        capacity=100
+    ),
+    optimizer=dict(
+        type='adam',
+        learning_rate=1e-2
+    )
+)
+
+
+class CrashingTest(MinimalTest):
+    """
+    Minimal test environment which fails once, on the given number of resets across all processes.
+    """
+
+    def __init__(self, specification, resets, crash_at):
+        super(CrashingTest, self).__init__(specification=specification)
+        self.resets = resets
+        self.crash_at = crash_at
+
+    def reset(self):
+        with self.resets.get_lock():
+            self.resets.value += 1
+            if self.resets.value == self.crash_at:
+                raise RuntimeError('Environment crashed.')
+        return super(CrashingTest, self).reset()
+
+
+def run_process(cluster, job, task_index, restarted, num_episodes, queue):
+    environment = MinimalTest(specification={'int': ()})
+    agent_spec = dict(agent)
+    agent_spec['device'] = '/job:{}/task:{}'.format(job, task_index)
+    agent_spec['distributed'] = dict(
+        cluster_spec=tf.train.ClusterSpec(cluster),
+        task_index=task_index,
+        parameter_server=(job == 'ps'),
+        restarted=restarted
+    )
+    worker = Agent.from_spec(spec=agent_spec, kwargs=dict(states=environment.states, actions=environment.actions))
+    worker.reset()
+    start_episode = worker.episode
+    runner = Runner(agent=worker, environment=environment)
+    runner.run(num_episodes=num_episodes)
+    queue.put((start_episode, worker.episode))
+    runner.close()
+
+
+class TestClusterLauncher(unittest.TestCase):
+
+    def test_cluster_launcher(self):
+        sys.stdout.write('\nVPGAgent (cluster launcher):')
+        sys.stdout.flush()
+
+        resets = multiprocessing.Value('i', 0)
+        launcher = ClusterLauncher(
+            agent=agent,
+            environment=(lambda: CrashingTest(specification={'int': ()}, resets=resets, crash_at=8)),
+            num_workers=2
+        )
+
+        launcher.run(num_episodes=10)
+        launcher.close()
+
+        self.assertEqual(sum(launcher.restarts), 1)
+        self.assertGreater(len(launcher.episode_rewards), 0)
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_restarted_worker(self):
+        ports = free_ports(num_ports=3)
+        addresses = ['127.0.0.1:{}'.format(port) for port in ports]
+        cluster = dict(ps=addresses[:1], worker=addresses[1:])
+        queue = multiprocessing.Queue()
+
+        def start_process(job, task_index, restarted, num_episodes):
+            process = multiprocessing.Process(
+                target=run_process,
+                args=(cluster, job, task_index, restarted, num_episodes, queue)
+            )
+            process.daemon = True
+            process.start()
+            return process
+
+        parameter_server = start_process('ps', 0, False, None)
+        try:
+            worker = start_process('worker', 0, False, 5)
+            start_episode, episode = queue.get(timeout=120)
+            worker.join()
+            self.assertEqual(start_episode, 0)
+            self.assertEqual(episode, 5)
+
+            # A restarted worker continues from the shared state instead of re-initializing it
+            worker = start_process('worker', 1, True, 1)
+            start_episode, episode = queue.get(timeout=120)
+            worker.join()
+            self.assertEqual(start_episode, 5)
+            self.assertEqual(episode, 6)
+
+        finally:
+            parameter_server.terminate()
+            parameter_server.join()
@@ -0,0 +1,130 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from tensorforce.execution import BaseRunner
+from tensorforce.execution.episode_statistics import RingBuffer, RunningStatistics, EpisodeStatistics
+
+
+class TestEpisodeStatistics(unittest.TestCase):
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer(capacity=5, dtype=np.int64)
+        buffer.extend(range(8))
+
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(list(buffer), [3, 4, 5, 6, 7])
+        self.assertEqual(buffer[-1], 7)
+        self.assertEqual(buffer[0], 3)
+        self.assertEqual(buffer[-3:], [5, 6, 7])
+        self.assertEqual(sum(buffer[-100:]), 25)
+
+    def test_running_statistics(self):
+        values = np.random.RandomState(0).normal(size=(10000,))
+        first = RunningStatistics(compression=100)
+        second = RunningStatistics(compression=100)
+        for value in values[:3000]:
+            first.add(value)
+        for value in values[3000:]:
+            second.add(value)
+        statistics = first.merge(second)
+
+        self.assertEqual(statistics.count, 10000)
+        self.assertAlmostEqual(statistics.mean, np.mean(values))
+        self.assertAlmostEqual(statistics.std, np.std(values))
+        self.assertEqual(statistics.min, np.min(values))
+        self.assertEqual(statistics.max, np.max(values))
+        for q in (0.1, 0.5, 0.9):
+            # Rank error of the sketch is roughly 1 / compression.
+            rank = np.mean(values <= statistics.quantile(q))
+            self.assertLess(abs(rank - q), 0.03)
+
+    def test_concurrent_recent(self):
+        # Rewards equal the global episode sequence, so retained rewards in episode order increase
+        statistics = EpisodeStatistics(capacity=10)
+        for worker_id in range(2):
+            statistics.worker(worker_id=worker_id)
+
+        def record():
+            for episode in range(20000):
+                statistics.add_episode(reward=float(episode), timesteps=1, time=0.0, worker_id=(episode % 2))
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        while thread.is_alive():
+            rewards = statistics.recent(field='reward')
+            self.assertTrue(np.all(np.diff(rewards) > 0.0))
+        thread.join()
+        self.assertEqual(statistics.recent(field='reward'), [float(episode) for episode in range(19990, 20000)])
+
+    def test_threaded_workers(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'episodes.csv')
+            statistics = EpisodeStatistics(capacity=50, path=path, flush_frequency=7)
+            for worker_id in range(4):
+                statistics.worker(worker_id=worker_id)
+
+            def record(worker_id):
+                for episode in range(100):
+                    statistics.add_episode(reward=float(worker_id), timesteps=episode, time=0.0, worker_id=worker_id)
+
+            threads = [threading.Thread(target=record, args=(worker_id,)) for worker_id in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            statistics.flush()
+
+            with open(path, 'r') as fp:
+                num_lines = sum(1 for _ in fp)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(statistics.num_episodes, 400)
+        self.assertEqual(len(statistics.recent(field='reward')), 50)
+        self.assertEqual(statistics.summary()['reward_mean'], 1.5)
+        self.assertEqual(statistics.summary(worker_id=2)['timesteps_max'], 99)
+        self.assertEqual(num_lines, 401)
+
+    def test_runner_history(self):
+        runner = BaseRunner(agent=None, environment=None, history=dict(
+            episode_rewards=[1.0, 2.0, 3.0], episode_timesteps=[10, 20, 30], episode_times=[0.1, 0.2, 0.3]
+        ))
+        self.assertEqual(list(runner.episode_rewards), [1.0, 2.0, 3.0])
+
+        # Assignments replace one field and keep the others
+        runner.episode_rewards = [4.0, 5.0, 6.0]
+        self.assertEqual(list(runner.episode_rewards), [4.0, 5.0, 6.0])
+        self.assertEqual(list(runner.episode_timesteps), [10, 20, 30])
+        self.assertEqual(runner.statistics.summary()['reward_mean'], 5.0)
+
+        runner.episode_rewards = list()
+        runner.episode_timesteps = list()
+        runner.episode_times = list()
+        self.assertEqual(len(runner.episode_rewards), 0)
+        self.assertEqual(runner.statistics.num_episodes, 0)
@@ -0,0 +1,121 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import unittest
+
+import numpy as np
+
+from tensorforce.agents import Agent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import Runner, Evaluator
+from tensorforce.execution import evaluator as evaluator_module
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class TestEvaluator(unittest.TestCase):
+
+    def test_evaluator(self):
+        agent_spec = dict(
+            type='vpg_agent',
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=2)
+        )
+
+        def environment():
+            return MinimalTest(specification={'int': ()})
+
+        # Evaluation processes are forked before the training agent is created.
+        evaluator = Evaluator(
+            agent=agent_spec,
+            environment=environment,
+            frequency=5,
+            num_episodes=2,
+            max_episode_timesteps=20,
+            max_pending=2
+        )
+
+        training_environment = environment()
+        agent = Agent.from_spec(
+            spec=agent_spec,
+            kwargs=dict(states=training_environment.states, actions=training_environment.actions)
+        )
+        runner = Runner(agent=agent, environment=training_environment, evaluator=evaluator)
+        runner.run(num_episodes=20, max_episode_timesteps=20)
+        runner.close()
+
+        self.assertGreater(len(evaluator.results), 0)
+        for result in evaluator.results:
+            self.assertNotIn('error', result)
+            self.assertEqual(len(result['episode_rewards']), 2)
+            self.assertEqual(result['episode'] % 5, 0)
+
+    def test_preprocessing_state(self):
+        agent_spec = dict(
+            type='vpg_agent',
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=2),
+            states_preprocessing=[dict(type='running_standardize')]
+        )
+
+        def environment():
+            return MinimalTest(specification={'float': ()})
+
+        # Evaluation agent of this process instead of a pool process
+        evaluator_module.initialize_evaluation_process(agent=agent_spec, environment=environment)
+        evaluation_agent = evaluator_module.evaluation_agent
+
+        training_environment = environment()
+        agent = Agent.from_spec(
+            spec=agent_spec,
+            kwargs=dict(states=training_environment.states, actions=training_environment.actions)
+        )
+        runner = Runner(agent=agent, environment=training_environment)
+        runner.run(num_episodes=10, max_episode_timesteps=20)
+
+        # No episodes, only the transfer of the snapshot
+        result = evaluator_module.evaluate(
+            weights=agent.model.snapshot(include_memory=False),
+            num_episodes=0,
+            max_episode_timesteps=None
+        )
+        self.assertEqual(result, ([], []))
+
+        for name in sorted(agent.model.states_preprocessing):
+            transient = agent.model.states_preprocessing[name].get_transient_variables()
+            variables = [
+                variable for variable in agent.model.states_preprocessing[name].get_variables()
+                if variable not in transient
+            ]
+            evaluation_transient = evaluation_agent.model.states_preprocessing[name].get_transient_variables()
+            evaluation_variables = [
+                variable for variable in evaluation_agent.model.states_preprocessing[name].get_variables()
+                if variable not in evaluation_transient
+            ]
+            self.assertGreater(len(variables), 0)
+            values = agent.model.session.run(fetches=variables)
+            evaluation_values = evaluation_agent.model.session.run(fetches=evaluation_variables)
+            for value, evaluation_value in zip(values, evaluation_values):
+                np.testing.assert_allclose(value, evaluation_value)
+
+        runner.close()
+        evaluation_agent.close()
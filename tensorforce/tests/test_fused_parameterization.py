@@ -0,0 +1,94 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.core.distributions import Distribution, Bernoulli, Categorical, Gaussian
+
+
+class TestFusedParameterization(unittest.TestCase):
+
+    def test_fused_parameterization(self):
+        with tf.Graph().as_default():
+            distributions = dict(
+                action0=Categorical(shape=(), num_actions=3),
+                action1=Categorical(shape=(2,), num_actions=3),
+                action2=Categorical(shape=(), num_actions=5),
+                action3=Gaussian(shape=(2,)),
+                action4=Bernoulli(shape=())
+            )
+            x = tf.placeholder(dtype=tf.float32, shape=(None, 4))
+
+            separate = {name: distribution.parameterize(x=x) for name, distribution in distributions.items()}
+            fused = Distribution.fused_parameterize(distributions=distributions, x=x)
+            separate_actions = {
+                name: distribution.sample(distr_params=separate[name], deterministic=True)
+                for name, distribution in distributions.items()
+            }
+            joint_actions = Distribution.joint_sample(
+                distributions=distributions,
+                distr_params=fused,
+                deterministic=tf.constant(value=True)
+            )
+            sampled_actions = Distribution.joint_sample(
+                distributions=distributions,
+                distr_params=fused,
+                deterministic=tf.constant(value=False)
+            )
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                feed_dict = {x: np.random.normal(size=(3, 4))}
+                separate, fused, separate_actions, joint_actions, sampled_actions = session.run(
+                    (separate, fused, separate_actions, joint_actions, sampled_actions),
+                    feed_dict=feed_dict
+                )
+
+        for name in distributions:
+            for separate_value, fused_value in zip(separate[name], fused[name]):
+                np.testing.assert_allclose(fused_value, separate_value, rtol=1e-5, atol=1e-5)
+            np.testing.assert_array_equal(joint_actions[name], separate_actions[name])
+            self.assertEqual(sampled_actions[name].shape, separate_actions[name].shape)
+
+    def test_variable_names(self):
+        names = list()
+        for fused in (False, True):
+            with tf.Graph().as_default():
+                distributions = dict(
+                    action0=Categorical(shape=(), num_actions=3),
+                    action1=Gaussian(shape=(2,))
+                )
+                x = tf.placeholder(dtype=tf.float32, shape=(None, 4))
+
+                def parameterize(x):
+                    if fused:
+                        return Distribution.fused_parameterize(distributions=distributions, x=x)
+                    else:
+                        return {name: distribution.parameterize(x=x) for name, distribution in distributions.items()}
+
+                tf.make_template(name_='model', func_=parameterize)(x=x)
+                names.append(sorted(variable.name for variable in tf.global_variables()))
+
+        # Same variables, so checkpoints are compatible
+        self.assertEqual(names[0], names[1])
+        self.assertGreater(len(names[0]), 0)
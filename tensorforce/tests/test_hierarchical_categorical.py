@@ -0,0 +1,99 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import TensorForceError
+from tensorforce.core.distributions import HierarchicalCategorical
+
+
+class TestHierarchicalCategorical(unittest.TestCase):
+
+    def test_hierarchical_categorical(self):
+        # Three clusters of size four, the last one partially occupied
+        distribution = HierarchicalCategorical(shape=(2,), num_actions=10, num_clusters=3)
+        self.assertEqual(distribution.cluster_size, 4)
+
+        with tf.Graph().as_default():
+            x = tf.placeholder(dtype=tf.float32, shape=(None, 4))
+            action = tf.placeholder(dtype=tf.int32, shape=(None, 2))
+            distr_params = distribution.parameterize(x=x)
+            log_probability = distribution.log_probability(distr_params=distr_params, action=action)
+            sampled = distribution.sample(distr_params=distr_params, deterministic=tf.constant(value=False))
+            definite = distribution.sample(distr_params=distr_params, deterministic=tf.constant(value=True))
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                states = np.random.normal(size=(1, 4))
+                # Log probabilities of all actions, in both action dimensions
+                actions = np.stack([np.arange(10), np.arange(10)[::-1]], axis=1)
+                log_probabilities = session.run(
+                    log_probability,
+                    feed_dict={x: np.repeat(states, 10, axis=0), action: actions}
+                )
+                samples = session.run(sampled, feed_dict={x: np.repeat(states, 1000, axis=0)})
+                definites = session.run(definite, feed_dict={x: states})
+
+        probabilities = np.exp(log_probabilities)
+        np.testing.assert_allclose(probabilities.sum(axis=0), (1.0, 1.0), rtol=1e-4)
+        self.assertEqual(samples.shape, (1000, 2))
+        self.assertTrue(((samples >= 0) & (samples < 10)).all())
+        self.assertEqual(definites.shape, (1, 2))
+        self.assertTrue(((definites >= 0) & (definites < 10)).all())
+
+    def test_empty_clusters(self):
+        # Seven clusters of size two would leave the last two clusters empty
+        distribution = HierarchicalCategorical(shape=(), num_actions=10, num_clusters=7)
+        self.assertEqual(distribution.cluster_size, 2)
+        self.assertEqual(distribution.num_clusters, 5)
+
+        with tf.Graph().as_default():
+            x = tf.placeholder(dtype=tf.float32, shape=(None, 4))
+            action = tf.placeholder(dtype=tf.int32, shape=(None,))
+            distr_params = distribution.parameterize(x=x)
+            log_probability = distribution.log_probability(distr_params=distr_params, action=action)
+            sampled = distribution.sample(distr_params=distr_params, deterministic=tf.constant(value=False))
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                states = np.random.normal(size=(1, 4))
+                log_probabilities = session.run(
+                    log_probability,
+                    feed_dict={x: np.repeat(states, 10, axis=0), action: np.arange(10)}
+                )
+                samples = session.run(sampled, feed_dict={x: np.repeat(states, 1000, axis=0)})
+
+        np.testing.assert_allclose(np.exp(log_probabilities).sum(), 1.0, rtol=1e-4)
+        self.assertTrue(((samples >= 0) & (samples < 10)).all())
+
+    def test_state_value(self):
+        # Not usable as Q-values, hence rejected when building a Q-model
+        distribution = HierarchicalCategorical(shape=(), num_actions=10)
+
+        with tf.Graph().as_default():
+            x = tf.placeholder(dtype=tf.float32, shape=(None, 4))
+            distr_params = distribution.parameterize(x=x)
+            with self.assertRaises(TensorForceError):
+                distribution.state_value(distr_params=distr_params)
+            with self.assertRaises(TensorForceError):
+                distribution.state_action_value(distr_params=distr_params)
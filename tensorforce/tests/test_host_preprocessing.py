@@ -0,0 +1,80 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import TensorForceError
+from tensorforce.core.preprocessors import PreprocessorStack
+from tensorforce.environments import MinimalTest, PreprocessedEnvironment
+
+
+class TestHostPreprocessing(unittest.TestCase):
+
+    def compare(self, spec, array):
+        with tf.Graph().as_default():
+            stack = PreprocessorStack.from_spec(spec=spec, kwargs=dict(shape=array.shape[1:]))
+            states = tf.placeholder(dtype=tf.as_dtype(array.dtype), shape=((None,) + array.shape[1:]))
+            processed = stack.process(tensor=states)
+            with tf.Session() as session:
+                expected = session.run(processed, feed_dict={states: array})
+
+        result = stack.np_process(array=array)
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual(result.shape, expected.shape)
+        self.assertEqual(result.shape[1:], stack.processed_shape(shape=array.shape[1:]))
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+
+    def test_image_stack(self):
+        images = np.random.randint(low=0, high=256, size=(2, 12, 10, 3)).astype(np.uint8)
+        self.compare(spec=[dict(type='grayscale'), dict(type='image_resize', width=6, height=4)], array=images)
+        self.compare(
+            spec=[dict(type='image_resize', width=5, height=7), dict(type='divide', scale=255.0)],
+            array=images.astype(np.float32)
+        )
+        self.compare(spec=[dict(type='normalize'), dict(type='flatten')], array=images.astype(np.float32))
+
+    def test_vector_stack(self):
+        vectors = np.random.normal(size=(3, 5)).astype(np.float32)
+        self.compare(spec=[dict(type='clip', min_value=-0.5, max_value=0.5), dict(type='divide', scale=2.0)],
+                     array=vectors)
+
+    def test_stateful_preprocessor(self):
+        stack = PreprocessorStack.from_spec(spec=dict(type='sequence', length=2), kwargs=dict(shape=(2,)))
+        with self.assertRaises(TensorForceError):
+            stack.np_process(array=np.zeros(shape=(1, 2), dtype=np.float32))
+
+    def test_preprocessed_environment(self):
+        environment = PreprocessedEnvironment(
+            environment=MinimalTest(specification={'int': ()}),
+            preprocessing=[dict(type='divide', scale=2.0)]
+        )
+        self.assertEqual(environment.states, dict(shape=(2,), type='float'))
+
+        state = environment.reset()
+        self.assertEqual(state.shape, (2,))
+        np.testing.assert_allclose(state, (0.5, 0.0))
+
+        state, terminal, reward = environment.execute(actions=1)
+        self.assertEqual(state.shape, (2,))
+        np.testing.assert_allclose(state, (0.0, 0.5))
+        environment.close()
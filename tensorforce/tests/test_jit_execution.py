@@ -0,0 +1,52 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+from tensorforce.agents import VPGAgent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import SingleRunner
+
+
+class TestJitExecution(unittest.TestCase):
+
+    def test_jit_execution(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32), dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2),
+            execution=dict(jit=True)
+        )
+
+        if agent.model.jit:
+            compiled = [
+                operation for operation in agent.model.graph.get_operations()
+                if operation.node_def.attr['_XlaCompile'].b
+            ]
+            self.assertGreater(len(compiled), 0)
+
+        runner = SingleRunner(agent=agent, environment=environment)
+        runner.run(num_episodes=20)
+        self.assertGreater(agent.model.num_updates, 0)
+        runner.close()
@@ -0,0 +1,99 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import threading
+import unittest
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.contrib.multiplexed_environment import MultiplexedEnvironmentServer, MultiplexedRemoteEnvironment
+from tensorforce.environments import MinimalTest
+
+
+class TestMultiplexedEnvironment(unittest.TestCase):
+
+    def setUp(self):
+        environments = [MinimalTest(specification={'int': ()}) for _ in range(6)]
+        self.server = MultiplexedEnvironmentServer(environments=environments, num_groups=2, port=0)
+        self.server.listen()
+        self.thread = threading.Thread(target=self.server.serve, kwargs=dict(num_connections=1))
+        self.thread.daemon = True
+        self.thread.start()
+        self.environment = MultiplexedRemoteEnvironment(port=self.server.port)
+
+    def tearDown(self):
+        self.environment.close()
+        self.thread.join()
+        self.server.close()
+
+    def test_reset_execute(self):
+        self.assertEqual(self.environment.num_environments, 6)
+        self.assertEqual(self.environment.num_groups, 2)
+        self.assertEqual(self.environment.states, MinimalTest(specification={'int': ()}).states)
+
+        states = self.environment.reset()
+        self.assertEqual(states.shape, (6, 2))
+        np.testing.assert_array_equal(states, np.tile((1.0, 0.0), (6, 1)))
+
+        num_terminals = 0
+        for _ in range(20):
+            states, terminal, reward = self.environment.execute(actions=np.ones(shape=(6,), dtype=np.int64))
+            self.assertEqual(states.shape, (6, 2))
+            self.assertEqual(terminal.shape, (6,))
+            np.testing.assert_array_equal(reward, np.ones(shape=(6,)))
+            # Terminated instances are reset automatically
+            np.testing.assert_array_equal(states[terminal], np.tile((1.0, 0.0), (terminal.sum(), 1)))
+            np.testing.assert_array_equal(states[~terminal], np.tile((0.0, 1.0), ((~terminal).sum(), 1)))
+            num_terminals += terminal.sum()
+        self.assertGreater(num_terminals, 0)
+
+    def test_pipelined_groups(self):
+        self.environment.reset()
+
+        # Both groups stepped with requests in flight at the same time, received in reverse order
+        first = self.environment.send_request('execute', group=0, actions=np.ones(shape=(3,), dtype=np.int64))
+        second = self.environment.send_request('execute', group=1, actions=np.zeros(shape=(3,), dtype=np.int64))
+        second = self.environment.receive(second)
+        first = self.environment.receive(first)
+
+        self.assertEqual(first['states'].shape, (3, 2))
+        np.testing.assert_array_equal(first['reward'], np.ones(shape=(3,)))
+        np.testing.assert_array_equal(second['reward'], np.zeros(shape=(3,)))
+
+        states = self.environment.reset(group=1)
+        self.assertEqual(states.shape, (3, 2))
+
+    def test_error_response(self):
+        self.environment.reset()
+
+        # An error response to one request does not affect the other requests in flight
+        invalid = self.environment.send_request('reset', group=2)
+        valid = self.environment.send_request('execute', group=0, actions=np.ones(shape=(3,), dtype=np.int64))
+        response = self.environment.receive(valid)
+        np.testing.assert_array_equal(response['reward'], np.ones(shape=(3,)))
+        with self.assertRaises(TensorForceError):
+            self.environment.receive(invalid)
+
+        invalid = self.environment.send_request('reset', group=2)
+        valid = self.environment.send_request('reset', group=1)
+        with self.assertRaises(TensorForceError):
+            self.environment.receive(invalid)
+        self.assertEqual(self.environment.receive(valid)['states'].shape, (3, 2))
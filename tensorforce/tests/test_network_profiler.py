@@ -0,0 +1,61 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+from tensorforce.core.networks import NetworkProfiler
+
+
+class TestNetworkProfiler(unittest.TestCase):
+
+    def test_network_profiler(self):
+        profiler = NetworkProfiler(
+            network=[dict(type='dense', size=32), dict(type='dense', size=16)],
+            states=dict(shape=(8,)),
+            batch_sizes=(1, 4),
+            num_runs=2,
+            num_warmup_runs=1
+        )
+        reports = profiler.profile()
+
+        self.assertEqual([(report['batch_size'], report['layer']) for report in reports], [
+            (1, 'dense0'), (1, 'dense1'), (4, 'dense0'), (4, 'dense1')
+        ])
+        self.assertEqual(reports[2]['parameters'], 8 * 32 + 32)
+        self.assertEqual(reports[3]['parameters'], 32 * 16 + 16)
+        self.assertEqual(reports[2]['activation_bytes'], 4 * 32 * 4)
+        for report in reports:
+            self.assertGreater(report['latency'], 0.0)
+
+        self.assertEqual(len(NetworkProfiler.format(reports=reports).split('\n')), 5)
+
+    def test_flops(self):
+        profiler = NetworkProfiler(
+            network=[dict(type='linear', size=32)],
+            states=dict(shape=(8,)),
+            batch_sizes=(4,),
+            num_runs=1,
+            num_warmup_runs=0
+        )
+        reports = profiler.profile()
+
+        # Matrix multiplication and bias addition, without the variable initializers
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0]['flops'], 2 * 4 * 8 * 32 + 4 * 32)
@@ -0,0 +1,64 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from tensorforce.agents import VPGAgent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import Runner
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class TestRunnerProfiler(unittest.TestCase):
+
+    def test_runner_profiler(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=2)
+        )
+
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'profile.jsonl')
+            runner = Runner(agent=agent, environment=environment, profile=True, profile_path=path)
+            runner.run(num_episodes=10)
+            runner.close()
+
+            with open(path, 'r') as fp:
+                reports = [json.loads(line) for line in fp]
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(len(reports), 10)
+        self.assertEqual(sum(report['timesteps'] for report in reports), sum(runner.episode_timesteps))
+        self.assertGreater(sum(report['updates'] for report in reports), 0)
+        for report in reports:
+            for phase in ('act', 'execute', 'observe', 'update'):
+                self.assertGreaterEqual(report[phase + '_time'], 0.0)
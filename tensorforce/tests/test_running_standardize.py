@@ -0,0 +1,96 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.agents import VPGAgent
+from tensorforce.core.preprocessors import RunningStandardize
+
+
+class TestRunningStandardize(unittest.TestCase):
+
+    def test_batched_statistics(self):
+        values = np.random.normal(loc=3.0, scale=2.0, size=(12, 4)).astype(np.float32)
+
+        with tf.Graph().as_default():
+            batched = RunningStandardize(shape=(4,), scope='batched')
+            single = RunningStandardize(shape=(4,), scope='single')
+            states = tf.placeholder(dtype=tf.float32, shape=(None, 4))
+            batched_output = batched.process(tensor=states)
+            single_output = single.process(tensor=states)
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                for n in range(0, 12, 3):
+                    session.run(batched_output, feed_dict={states: values[n: n + 3]})
+                for n in range(12):
+                    session.run(single_output, feed_dict={states: values[n: n + 1]})
+                batched_moments, single_moments = session.run((batched.moments, single.moments))
+
+        for batched_moment, single_moment in zip(batched_moments, single_moments):
+            np.testing.assert_allclose(batched_moment, single_moment, rtol=1e-4, atol=1e-4)
+        self.assertEqual(batched_moments[0], 12.0)
+        np.testing.assert_allclose(batched_moments[1], values.mean(axis=0), rtol=1e-4, atol=1e-4)
+        np.testing.assert_allclose(batched_moments[2], values.var(axis=0) * 12.0, rtol=1e-4, atol=1e-4)
+
+    def test_synchronize(self):
+        values = np.random.normal(size=(8, 2)).astype(np.float32)
+
+        with tf.Graph().as_default():
+            source = RunningStandardize(shape=(2,), scope='global')
+            replicas = [RunningStandardize(shape=(2,), scope='replica' + str(n)) for n in range(2)]
+            states = tf.placeholder(dtype=tf.float32, shape=(None, 2))
+            source.process(tensor=states)
+            outputs = [replica.process(tensor=states) for replica in replicas]
+            synchronizations = [tf.group(*replica.synchronize(source=source)) for replica in replicas]
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                session.run(outputs[0], feed_dict={states: values[:5]})
+                session.run(outputs[1], feed_dict={states: values[5:]})
+                for synchronization in synchronizations:
+                    session.run(synchronization)
+                source_moments = session.run(source.moments)
+                replica_moments = session.run(replicas[1].moments)
+                pending_count = session.run(replicas[0].pending_moments[0])
+
+        self.assertEqual(source_moments[0], 8.0)
+        np.testing.assert_allclose(source_moments[1], values.mean(axis=0), rtol=1e-4, atol=1e-4)
+        np.testing.assert_allclose(source_moments[2], values.var(axis=0) * 8.0, rtol=1e-4, atol=1e-4)
+        for source_moment, replica_moment in zip(source_moments, replica_moments):
+            np.testing.assert_allclose(source_moment, replica_moment)
+        self.assertEqual(pending_count, 0.0)
+
+    def test_saver_variables(self):
+        agent = VPGAgent(
+            states=dict(shape=(2,), type='float'),
+            actions=dict(type='int', num_actions=2),
+            network=[dict(type='dense', size=8)],
+            states_preprocessing=dict(type='running_standardize')
+        )
+        names = [variable.name for variable in agent.model.saver_variables]
+        agent.close()
+
+        # The pending moments are transient and not saved, so older checkpoints remain loadable
+        self.assertTrue(any('mean-estimate' in name for name in names))
+        self.assertFalse(any('pending' in name for name in names))
@@ -0,0 +1,66 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.core.preprocessors import PreprocessorStack
+
+
+class TestSequencePreprocessor(unittest.TestCase):
+
+    def test_batched_slots(self):
+        with tf.Graph().as_default():
+            stack = PreprocessorStack.from_spec(
+                spec=dict(type='sequence', length=3, num_slots=2),
+                kwargs=dict(shape=(1,))
+            )
+            states = tf.placeholder(dtype=tf.float32, shape=(None, 1))
+            slots = tf.placeholder(dtype=tf.int32, shape=(None,))
+            processed = stack.process(tensor=states)
+            reset = stack.reset()
+            reset_slots = stack.reset_slots(slots=slots)
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                session.run(reset)
+
+                # New slots are filled with their first state.
+                result = session.run(processed, feed_dict={states: [[1.0], [10.0]]})
+                self.assertEqual(result.tolist(), [[1.0, 1.0, 1.0], [10.0, 10.0, 10.0]])
+
+                # Oldest state first, current state last.
+                result = session.run(processed, feed_dict={states: [[2.0], [20.0]]})
+                self.assertEqual(result.tolist(), [[1.0, 1.0, 2.0], [10.0, 10.0, 20.0]])
+                result = session.run(processed, feed_dict={states: [[3.0], [30.0]]})
+                self.assertEqual(result.tolist(), [[1.0, 2.0, 3.0], [10.0, 20.0, 30.0]])
+                result = session.run(processed, feed_dict={states: [[4.0], [40.0]]})
+                self.assertEqual(result.tolist(), [[2.0, 3.0, 4.0], [20.0, 30.0, 40.0]])
+
+                # Only the reset slot starts a new sequence.
+                session.run(reset_slots, feed_dict={slots: [1]})
+                result = session.run(processed, feed_dict={states: [[5.0], [50.0]]})
+                self.assertEqual(result.tolist(), [[3.0, 4.0, 5.0], [50.0, 50.0, 50.0]])
+
+                # Smaller batches use the leading slots.
+                result = session.run(processed, feed_dict={states: np.asarray([[6.0]])})
+                self.assertEqual(result.tolist(), [[4.0, 5.0, 6.0]])
@@ -0,0 +1,81 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import os
+import unittest
+
+from tensorforce.agents import VPGAgent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import SessionAutotuner
+
+
+class TestSessionAutotuner(unittest.TestCase):
+
+    agent = dict(
+        type='vpg_agent',
+        update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+        memory=dict(type='latest', include_next_states=False, capacity=100),
+        optimizer=dict(type='adam', learning_rate=1e-2)
+    )
+    network = [dict(type='dense', size=32), dict(type='dense', size=32)]
+
+    def test_session_config(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=self.network,
+            update_mode=self.agent['update_mode'],
+            memory=self.agent['memory'],
+            optimizer=self.agent['optimizer'],
+            execution=dict(session_config=dict(intra_op_parallelism_threads=1, inter_op_parallelism_threads=1))
+        )
+        self.assertEqual(agent.model.session_config.intra_op_parallelism_threads, 1)
+        self.assertEqual(agent.model.session_config.inter_op_parallelism_threads, 1)
+        agent.close()
+
+    def test_session_autotuner(self):
+        autotuner = SessionAutotuner(
+            agent=self.agent,
+            environment=(lambda: MinimalTest(specification={'int': ()})),
+            network=self.network,
+            intra_op_threads=(1, 2),
+            inter_op_threads=(1,),
+            timesteps=50,
+            warmup_timesteps=10
+        )
+        session_config, results = autotuner.tune()
+
+        self.assertEqual(len(results), 2)
+        self.assertIn(session_config, [result['session_config'] for result in results])
+        # Each configuration is benchmarked in its own process with a session using its thread counts
+        self.assertEqual(
+            [result['session_config'] for result in results],
+            [
+                dict(intra_op_parallelism_threads=1, inter_op_parallelism_threads=1),
+                dict(intra_op_parallelism_threads=2, inter_op_parallelism_threads=1)
+            ]
+        )
+        processes = set(result['process'] for result in results)
+        self.assertEqual(len(processes), 2)
+        self.assertNotIn(os.getpid(), processes)
+        for result in results:
+            self.assertGreater(result['act_throughput'], 0.0)
+            self.assertGreater(result['time_per_timestep'], 0.0)
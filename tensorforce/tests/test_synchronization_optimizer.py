@@ -0,0 +1,79 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.core.optimizers import Synchronization
+
+
+class TestSynchronizationOptimizer(unittest.TestCase):
+
+    def run_synchronization(self, update_weight):
+        """
+        Runs a synchronization with frequency 2 at times 0, 1 and 2, with the source variable
+        changed after every step, and returns the target values after each step.
+        """
+        with tf.Graph().as_default():
+            source = tf.Variable(initial_value=np.ones(shape=(3,), dtype=np.float32))
+            target = tf.Variable(initial_value=np.zeros(shape=(3,), dtype=np.float32))
+            time = tf.placeholder(dtype=tf.int32, shape=())
+            optimizer = Synchronization(sync_frequency=2, update_weight=update_weight)
+            synchronization = optimizer.minimize(time=time, variables=[target], source_variables=[source])
+            change_source = tf.assign_add(ref=source, value=np.ones(shape=(3,), dtype=np.float32))
+
+            values = list()
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                for step in range(3):
+                    session.run(synchronization, feed_dict={time: step})
+                    values.append(session.run(target))
+                    session.run(change_source)
+        return values
+
+    def test_full_sync(self):
+        values = self.run_synchronization(update_weight=1.0)
+        # Sync at time 0 to source 1.0, no sync at time 1, sync at time 2 to source 3.0
+        np.testing.assert_allclose(values[0], (1.0, 1.0, 1.0))
+        np.testing.assert_allclose(values[1], (1.0, 1.0, 1.0))
+        np.testing.assert_allclose(values[2], (3.0, 3.0, 3.0))
+
+    def test_polyak_sync(self):
+        values = self.run_synchronization(update_weight=0.25)
+        # 0.0 + 0.25 * (1.0 - 0.0) at time 0, unchanged at time 1, 0.25 + 0.25 * (3.0 - 0.25) at time 2
+        np.testing.assert_allclose(values[0], (0.25, 0.25, 0.25))
+        np.testing.assert_allclose(values[1], (0.25, 0.25, 0.25))
+        np.testing.assert_allclose(values[2], (0.9375, 0.9375, 0.9375))
+
+    def test_deltas(self):
+        with tf.Graph().as_default():
+            source = tf.Variable(initial_value=np.ones(shape=(2,), dtype=np.float32))
+            target = tf.Variable(initial_value=np.zeros(shape=(2,), dtype=np.float32))
+            time = tf.placeholder(dtype=tf.int32, shape=())
+            optimizer = Synchronization(sync_frequency=2, update_weight=0.5)
+            deltas = optimizer.step(time=time, variables=[target], source_variables=[source])
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                np.testing.assert_allclose(session.run(deltas, feed_dict={time: 0})[0], (0.5, 0.5))
+                np.testing.assert_allclose(session.run(deltas, feed_dict={time: 1})[0], (0.0, 0.0))
+                np.testing.assert_allclose(session.run(target), (0.5, 0.5))
@@ -0,0 +1,62 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.core.networks import LayeredNetwork
+from tensorforce.core.preprocessors import PreprocessorStack
+
+
+class TestUint8States(unittest.TestCase):
+
+    def test_uint8_preprocessing(self):
+        with tf.Graph().as_default():
+            stack = PreprocessorStack.from_spec(
+                spec=[
+                    dict(type='grayscale'),
+                    dict(type='image_resize', width=4, height=4),
+                    dict(type='sequence', length=2)
+                ],
+                kwargs=dict(shape=(8, 8, 3))
+            )
+            self.assertEqual(stack.processed_shape(shape=(8, 8, 3)), (4, 4, 2))
+            self.assertEqual(stack.processed_dtype(dtype='uint8'), 'uint8')
+
+            states = tf.placeholder(dtype=tf.uint8, shape=(None, 8, 8, 3))
+            processed = stack.process(tensor=states)
+            self.assertEqual(processed.dtype, tf.uint8)
+
+            network = LayeredNetwork(layers=[dict(type='flatten'), dict(type='dense', size=8)])
+            embedding = network.apply(x=processed, internals=dict(), update=tf.constant(value=False))
+            self.assertEqual(embedding.dtype, tf.float32)
+
+            with tf.Session() as session:
+                session.run(tf.global_variables_initializer())
+                session.run(stack.reset())
+                frames = np.full(shape=(1, 8, 8, 3), fill_value=200, dtype=np.uint8)
+                result = session.run(processed, feed_dict={states: frames})
+                self.assertTrue(np.all(result == 200))
+
+    def test_float_preprocessing(self):
+        stack = PreprocessorStack.from_spec(spec=dict(type='divide', scale=255.0), kwargs=dict(shape=(4,)))
+        self.assertEqual(stack.processed_dtype(dtype='uint8'), 'float')
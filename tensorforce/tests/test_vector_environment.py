@@ -0,0 +1,103 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+
+from tensorforce.environments import MinimalTest, VectorEnvironment
+
+
+class CountingTest(MinimalTest):
+    """
+    Minimal test environment whose state counts the timesteps of the current episode, which
+    terminates after a fixed number of timesteps.
+    """
+
+    def __init__(self, specification, episode_length):
+        super(CountingTest, self).__init__(specification=specification)
+        self.episode_length = episode_length
+        self.timestep = 0
+
+    def reset(self):
+        self.timestep = 0
+        return (0.0, 0.0)
+
+    def execute(self, actions):
+        self.timestep += 1
+        return (float(self.timestep), 0.0), self.timestep == self.episode_length, 1.0
+
+
+class TestVectorEnvironment(unittest.TestCase):
+
+    def vector_environment(self, mode):
+        environment = VectorEnvironment(
+            environments=[MinimalTest(specification={'int': ()}) for _ in range(3)],
+            mode=mode
+        )
+
+        states = environment.reset()
+        self.assertEqual(states.shape, (3, 2))
+
+        for _ in range(20):
+            states, terminal, reward = environment.execute(actions=np.ones(shape=(3,), dtype=np.int32))
+            self.assertEqual(states.shape, (3, 2))
+            self.assertEqual(terminal.shape, (3,))
+            self.assertEqual(reward.shape, (3,))
+
+        environment.close()
+
+    def auto_reset(self, mode):
+        episode_lengths = (2, 3, 5)
+        environment = VectorEnvironment(
+            environments=[
+                CountingTest(specification={'int': ()}, episode_length=episode_length)
+                for episode_length in episode_lengths
+            ],
+            mode=mode
+        )
+
+        states = environment.reset()
+        np.testing.assert_array_equal(states[:, 0], (0.0, 0.0, 0.0))
+
+        for timestep in range(1, 11):
+            states, terminal, reward = environment.execute(actions=np.ones(shape=(3,), dtype=np.int32))
+            # Terminated slots return the initial state of their next episode, the other slots continue
+            expected_terminal = [timestep % episode_length == 0 for episode_length in episode_lengths]
+            np.testing.assert_array_equal(terminal, expected_terminal)
+            np.testing.assert_array_equal(
+                states[:, 0],
+                [float(timestep % episode_length) for episode_length in episode_lengths]
+            )
+            np.testing.assert_array_equal(reward, (1.0, 1.0, 1.0))
+
+        environment.close()
+
+    def test_serial(self):
+        self.vector_environment(mode='serial')
+        self.auto_reset(mode='serial')
+
+    def test_thread(self):
+        self.vector_environment(mode='thread')
+        self.auto_reset(mode='thread')
+
+    def test_process(self):
+        self.vector_environment(mode='process')
+        self.auto_reset(mode='process')
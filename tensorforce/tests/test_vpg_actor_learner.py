@@ -0,0 +1,176 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import sys
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import TensorForceError
+from tensorforce.agents import VPGAgent
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import ActorLearnerRunner
+from tensorforce.models import PGModel
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class FailingTest(MinimalTest):
+    """
+    Minimal test environment which fails after the given number of timesteps.
+    """
+
+    def __init__(self, specification, fail_at):
+        super(FailingTest, self).__init__(specification=specification)
+        self.fail_at = fail_at
+        self.num_timesteps = 0
+
+    def execute(self, actions):
+        self.num_timesteps += 1
+        if self.num_timesteps == self.fail_at:
+            raise RuntimeError('Environment failed.')
+        return super(FailingTest, self).execute(actions=actions)
+
+
+class TestVPGActorLearner(unittest.TestCase):
+
+    def test_actor_learner(self):
+        sys.stdout.write('\nVPGAgent (actor-learner):')
+        sys.stdout.flush()
+
+        agent = dict(
+            type='vpg_agent',
+            network=[
+                dict(type='dense', size=32),
+                dict(type='dense', size=32)
+            ],
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            ),
+            baseline_mode='states',
+            baseline=dict(
+                type='mlp',
+                sizes=[32, 32]
+            ),
+            baseline_optimizer=dict(
+                type='adam',
+                learning_rate=1e-3
+            ),
+            vtrace_threshold=1.0
+        )
+
+        runner = ActorLearnerRunner(
+            agent=agent,
+            environment=(lambda: MinimalTest(specification={'int': ()})),
+            num_actors=2,
+            segment_length=10,
+            weights_frequency=2
+        )
+
+        runner.run(num_timesteps=200)
+        runner.close()
+
+        self.assertGreaterEqual(runner.global_timestep, 200)
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_actor_error(self):
+        # The learner stops on the first actor error, while actors still have queued segments
+        agent = dict(
+            type='vpg_agent',
+            network=[dict(type='dense', size=32)],
+            baseline_mode='states',
+            baseline=dict(type='mlp', sizes=[32]),
+            baseline_optimizer=dict(type='adam', learning_rate=1e-3),
+            vtrace_threshold=1.0
+        )
+
+        runner = ActorLearnerRunner(
+            agent=agent,
+            environment=(lambda: FailingTest(specification={'int': ()}, fail_at=50)),
+            num_actors=2,
+            segment_length=5
+        )
+
+        with self.assertRaises(TensorForceError):
+            runner.run(num_timesteps=10000)
+        runner.close()
+
+    def test_actions_exploration(self):
+        environment = MinimalTest(specification={'int': ()})
+        with self.assertRaises(TensorForceError):
+            VPGAgent(
+                states=environment.states,
+                actions=environment.actions,
+                network=[dict(type='dense', size=32)],
+                actions_exploration=dict(type='epsilon_decay', initial_epsilon=1.0, final_epsilon=0.1, timesteps=10),
+                baseline_mode='states',
+                baseline=dict(type='mlp', sizes=[32]),
+                baseline_optimizer=dict(type='adam', learning_rate=1e-3),
+                vtrace_threshold=1.0
+            )
+
+    def test_vtrace_targets(self):
+        discount = 0.9
+        state_value = np.array([0.5, -0.2, 1.0, 0.3, 0.8, -0.4], dtype=np.float32)
+        importance_weight = np.array([1.0, 0.6, 0.9, 1.0, 0.3, 0.7], dtype=np.float32)
+        terminal = np.array([False, False, True, False, False, False])
+        reward = np.array([1.0, 0.0, 2.0, -1.0, 0.5, 1.5], dtype=np.float32)
+        bootstrap_value = np.float32(0.7)
+
+        # Reference: v_s = V(x_s) + sum_t discount^(t-s) * prod_{s<=i<t} c_i * delta_t, within one episode
+        values = np.append(state_value, bootstrap_value)
+        next_values = np.where(terminal, 0.0, values[1:])
+        delta = importance_weight * (reward + discount * next_values - state_value)
+        value_target = np.zeros_like(state_value)
+        for s in range(len(state_value)):
+            value_target[s] = state_value[s]
+            factor = 1.0
+            for t in range(s, len(state_value)):
+                value_target[s] += factor * delta[t]
+                if terminal[t]:
+                    break
+                factor *= discount * importance_weight[t]
+        next_targets = np.where(terminal, 0.0, np.append(value_target[1:], bootstrap_value))
+        advantage = importance_weight * (reward + discount * next_targets - state_value)
+
+        with tf.Graph().as_default():
+            outputs = PGModel.vtrace_targets(
+                state_value=tf.constant(value=state_value),
+                importance_weight=tf.constant(value=importance_weight),
+                terminal=tf.constant(value=terminal),
+                reward=tf.constant(value=reward),
+                bootstrap_value=tf.constant(value=bootstrap_value),
+                discount=discount
+            )
+            with tf.Session() as session:
+                tf_advantage, tf_value_target = session.run(outputs)
+
+        np.testing.assert_allclose(tf_value_target, value_target, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(tf_advantage, advantage, rtol=1e-5, atol=1e-5)
+        # The non-terminal end of the sequence is bootstrapped, not treated as terminal
+        self.assertNotAlmostEqual(tf_value_target[-1], state_value[-1] + importance_weight[-1] * (
+            reward[-1] - state_value[-1]
+        ), places=3)
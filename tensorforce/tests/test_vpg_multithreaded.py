@@ -24,7 +24,7 @@ import unittest
 
 from tensorforce.agents import VPGAgent
 from tensorforce.environments import MinimalTest
-from tensorforce.execution import ThreadedRunner
+from tensorforce.execution import ThreadedRunner, MultiprocessRunner
 from tensorforce.execution.threaded_runner import clone_worker_agent
 
 
@@ -76,3 +76,47 @@ class TestVPGMultithreaded(unittest.TestCase):
 
         sys.stdout.write(' ran\n')
         sys.stdout.flush()
+
+    def test_multiprocess(self):
+        sys.stdout.write('\nVPGAgent (multiprocess):')
+        sys.stdout.flush()
+
+        environment = MinimalTest(specification={'int': ()})
+
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+        kwargs = dict(
+            update_mode=dict(
+                unit='episodes',
+                batch_size=4,
+                frequency=4
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            )
+        )
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=network,
+            **kwargs
+        )
+
+        agents = clone_worker_agent(agent, 3, environment, network, kwargs)
+        environments = [environment] + [copy.deepcopy(environment) for n in range(2)]
+
+        runner = MultiprocessRunner(agent=agents, environment=environments)
+
+        runner.run(episodes=50)
+        runner.close()
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
@@ -19,7 +19,9 @@ from __future__ import division
 
 import unittest
 
+from tensorforce import TensorForceError
 from tensorforce.tests.base_test import BaseTest
+from tensorforce.core.optimizers import AccumulatedStep
 from tensorforce.agents import VPGAgent
 from tensorforce.environments import MinimalTest
 
@@ -78,6 +80,33 @@ class TestVPGOptimizers(BaseTest, unittest.TestCase):
         )
         self.base_test_pass(name='evolutionary', environment=environment, network=network, **config)
 
+    def test_evolutionary_batched(self):
+        environment = MinimalTest(specification={'int': ()})
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+        config = dict(
+            update_mode=dict(
+                unit='episodes',
+                batch_size=4,
+                frequency=4
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='evolutionary',
+                learning_rate=1e-2,
+                num_samples=4,
+                antithetic=True,
+                batched=True
+            )
+        )
+        self.base_test_pass(name='evolutionary-batched', environment=environment, network=network, **config)
+
     def test_natural_gradient(self):
         environment = MinimalTest(specification={'int': ()})
         network = [
@@ -184,6 +213,71 @@ class TestVPGOptimizers(BaseTest, unittest.TestCase):
         )
         self.base_test_pass(name='optimized-step', environment=environment, network=network, **config)
 
+    def test_optimized_step_batched(self):
+        environment = MinimalTest(specification={'int': ()})
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+        config = dict(
+            update_mode=dict(
+                unit='episodes',
+                batch_size=4,
+                frequency=4
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='optimized_step',
+                optimizer=dict(
+                    type='adam',
+                    learning_rate=1e-2
+                ),
+                ls_batched=True
+            )
+        )
+        self.base_test_pass(name='optimized-step-batched', environment=environment, network=network, **config)
+
+    def test_accumulated_step(self):
+        environment = MinimalTest(specification={'int': ()})
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+        config = dict(
+            update_mode=dict(
+                unit='episodes',
+                batch_size=2,
+                frequency=2,
+                accumulation_steps=2
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            )
+        )
+        self.base_test_pass(name='accumulated-step', environment=environment, network=network, **config)
+
+    def test_accumulated_step_internal_optimizer(self):
+        for optimizer in (
+            dict(type='evolutionary', learning_rate=1e-2),
+            dict(type='natural_gradient', learning_rate=1e-2),
+            dict(type='optimized_step', optimizer=dict(type='adam', learning_rate=1e-3))
+        ):
+            with self.assertRaises(TensorForceError):
+                AccumulatedStep(optimizer=optimizer)
+        AccumulatedStep(optimizer=dict(
+            type='clipped_step', clipping_value=0.1, optimizer=dict(type='adam', learning_rate=1e-3)
+        ))
+
     def test_subsampling_step(self):
         environment = MinimalTest(specification={'int': ()})
         network = [
@@ -0,0 +1,208 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import sys
+import threading
+import unittest
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.agents import DQNAgent
+from tensorforce.core.optimizers import SynchronousReplicas
+from tensorforce.environments import MinimalTest
+from tensorforce.execution import Runner, SynchronousRunner
+from tensorforce.execution.synchronous_runner import ReplicaCoordinator
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class TestVPGSynchronous(unittest.TestCase):
+
+    def test_synchronous(self):
+        sys.stdout.write('\nVPGAgent (synchronous):')
+        sys.stdout.flush()
+
+        agent = dict(
+            type='vpg_agent',
+            network=[
+                dict(type='dense', size=32),
+                dict(type='dense', size=32)
+            ],
+            update_mode=dict(
+                unit='episodes',
+                batch_size=4,
+                frequency=4
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            )
+        )
+
+        runner = SynchronousRunner(
+            agent=agent,
+            environment=(lambda: MinimalTest(specification={'int': ()})),
+            num_workers=2
+        )
+
+        runner.run(num_episodes=20)
+        runner.close()
+
+        self.assertEqual(len(runner.episode_rewards), 40)
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_synchronous_timesteps(self):
+        # Episodes of different lengths, so workers perform different numbers of updates
+        sys.stdout.write('\nVPGAgent (synchronous, timesteps):')
+        sys.stdout.flush()
+
+        agent = dict(
+            type='vpg_agent',
+            network=[
+                dict(type='dense', size=32),
+                dict(type='dense', size=32)
+            ],
+            update_mode=dict(
+                unit='timesteps',
+                batch_size=8,
+                frequency=8
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            )
+        )
+
+        runner = SynchronousRunner(
+            agent=agent,
+            environment=(lambda: MinimalTest(specification={'int': ()})),
+            num_workers=2
+        )
+
+        runner.run(num_episodes=20)
+        runner.close()
+
+        self.assertEqual(len(runner.episode_rewards), 40)
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_finished_worker(self):
+        coordinator = ReplicaCoordinator(num_workers=2)
+        results = dict()
+
+        def exchange(task_index, operation, value):
+            results[task_index] = coordinator.exchange(
+                key='key', operation=operation, task_index=task_index, values=[np.array(value)]
+            )
+
+        # Both workers contribute
+        threads = [
+            threading.Thread(target=exchange, args=(task_index, 'average', float(task_index)))
+            for task_index in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results[0][0], 0.5)
+        self.assertEqual(results[1][0], 0.5)
+
+        # Worker 0 waits for worker 1, which finishes instead
+        thread = threading.Thread(target=exchange, args=(0, 'average', 2.0))
+        thread.start()
+        coordinator.remove_worker(task_index=1)
+        thread.join()
+        self.assertEqual(results[0][0], 2.0)
+
+        # Subsequent exchanges only involve worker 0
+        exchange(0, 'broadcast', 3.0)
+        self.assertEqual(results[0][0], 3.0)
+        coordinator.close()
+
+    def test_synchronous_dqn(self):
+        # Replicas in threads of this process, so their variables can be compared afterwards
+        coordinator = ReplicaCoordinator(num_workers=2)
+        coordinator.start()
+        environments = [MinimalTest(specification={'int': ()}) for _ in range(2)]
+        agents = [
+            DQNAgent(
+                states=environment.states,
+                actions=environment.actions,
+                network=[dict(type='dense', size=32)],
+                update_mode=dict(unit='timesteps', batch_size=8, frequency=4),
+                memory=dict(type='replay', include_next_states=True, capacity=100),
+                optimizer=dict(type='adam', learning_rate=1e-2),
+                # Target networks only converge to each other via partial updates if not broadcast
+                target_sync_frequency=1,
+                target_update_weight=0.5,
+                distributed=dict(synchronous=True, task_index=task_index, address=coordinator.address)
+            ) for task_index, environment in enumerate(environments)
+        ]
+
+        # Same number of timesteps, hence the same number of updates for both replicas
+        threads = [
+            threading.Thread(target=Runner(agent=agent, environment=environment).run, kwargs=dict(num_timesteps=40))
+            for agent, environment in zip(agents, environments)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        values = list()
+        for agent in agents:
+            # Network, target network and optimizer state like Adam moments
+            variables = agent.model.get_variables(include_submodules=True) + agent.model.optimizer.get_variables()
+            values.append(dict(zip(
+                (variable.name for variable in variables),
+                agent.model.session.run(fetches=variables)
+            )))
+            agent.close()
+        coordinator.close()
+
+        self.assertTrue(any(name.startswith('target') for name in values[0]))
+        self.assertEqual(sorted(values[0]), sorted(values[1]))
+        for name in values[0]:
+            np.testing.assert_allclose(values[0][name], values[1][name], rtol=1e-5, atol=1e-6, err_msg=name)
+
+    def test_internal_optimizer(self):
+        for optimizer in (
+            dict(type='evolutionary', learning_rate=1e-2),
+            dict(type='natural_gradient', learning_rate=1e-2),
+            dict(type='optimized_step', optimizer=dict(type='adam', learning_rate=1e-3))
+        ):
+            with self.assertRaises(TensorForceError):
+                SynchronousReplicas(optimizer=optimizer, address=('127.0.0.1', 0), task_index=0)
@@ -69,6 +69,8 @@ def np_dtype(dtype):
         return np.float32
     elif dtype == 'int' or dtype == int or dtype == np.int32 or dtype == tf.int32:
         return np.int32
+    elif dtype == 'uint8' or dtype == np.uint8 or dtype == tf.uint8:
+        return np.uint8
     elif dtype == 'bool' or dtype == bool or dtype == np.bool_ or dtype == tf.bool:
         return np.bool_
     else:
@@ -89,6 +91,8 @@ def tf_dtype(dtype):
         return tf.float32
     elif dtype == 'int' or dtype == int or dtype == np.int32 or dtype == tf.int32:
         return tf.int32
+    elif dtype == 'uint8' or dtype == np.uint8 or dtype == tf.uint8:
+        return tf.uint8
     elif dtype == 'bool' or dtype == bool or dtype == np.bool_ or dtype == tf.bool:
         return tf.bool
     else: